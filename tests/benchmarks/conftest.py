@@ -0,0 +1,56 @@
+import pytest
+
+from veta.wordlist import Wordlist
+from tests.benchmarks.generators import make_wordlist, write_wordlist, make_survey, write_survey, build_survey
+
+
+@pytest.fixture(scope="session")
+def synthetic_wordlist(tmp_path_factory):
+    """Returns a function writing (once per session) a synthetic wordlist file of a given size and language"""
+    files = {}
+
+    def make(num_terms, language='de', extension='.xlsx'):
+        key = (num_terms, language, extension)
+        if key not in files:
+            words, scores, subclasses = make_wordlist(num_terms, language)
+            filename = str(tmp_path_factory.mktemp("wordlists") / f"wordlist_{language}_{num_terms}{extension}")
+            files[key] = write_wordlist(filename, words, scores, subclasses)
+        return files[key]
+    return make
+
+
+@pytest.fixture(scope="session")
+def synthetic_answers(synthetic_wordlist):
+    """Returns a function generating (once per session) the answers of a synthetic survey"""
+    answers = {}
+
+    def make(num_items, language='de', num_terms=1000):
+        key = (num_items, language, num_terms)
+        if key not in answers:
+            words = make_wordlist(num_terms, language)[0]
+            answers[key] = make_survey(num_items, words, language)
+        return answers[key]
+    return make
+
+
+@pytest.fixture(scope="session")
+def synthetic_survey_file(tmp_path_factory, synthetic_answers):
+    """Returns a function writing (once per session) a synthetic survey file in a given layout"""
+    files = {}
+
+    def make(num_items, layout='vertical', extension='.csv', language='de'):
+        key = (num_items, layout, extension, language)
+        if key not in files:
+            filename = str(tmp_path_factory.mktemp("surveys") / f"survey_{language}_{layout}_{num_items}{extension}")
+            files[key] = write_survey(filename, synthetic_answers(num_items, language), layout)
+        return files[key]
+    return make
+
+
+@pytest.fixture
+def synthetic_survey(synthetic_wordlist, synthetic_answers):
+    """Returns a function building a fresh in-memory synthetic survey with its wordlist"""
+    def make(num_items, language='de', num_terms=1000):
+        wordlist = Wordlist(synthetic_wordlist(num_terms, language), language=language)
+        return build_survey(synthetic_answers(num_items, language, num_terms), wordlist)
+    return make
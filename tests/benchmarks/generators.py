@@ -0,0 +1,277 @@
+"""
+Synthetic LEAS survey and wordlist generators for the benchmarks.
+
+Wordlists are grown from the example wordlist (examples/wordlist.xlsx): its words and score distribution seed the
+German lists, and short lists of common emotion words seed the English, Hebrew and Arabic ones. New terms are built
+by appending letters of the language's alphabet to the seed words, and a fraction of the terms are multi-word phrases,
+so a list of any size keeps the mix of short and long entries of a real wordlist.
+
+Surveys are lists of respondents, each a list of (self, other) answers. Answers follow the language's sentence
+templates, mention a few wordlist terms (mostly the seed words, as in real answers) and repeat short answers such as
+"sad" across respondents. They can be written in the vertical or horizontal layout read by Survey.from_file, or
+built in memory with build_survey.
+
+Sizes are selected with environment variables so that a plain pytest run only uses the smallest ones:
+    VETA_BENCHMARK_MAX_ITEMS=1000000 VETA_BENCHMARK_MAX_TERMS=100000 pytest tests/benchmarks/ --benchmark-only
+"""
+import os
+import random
+import pandas as pd
+
+from veta.survey import Survey
+from veta.respondent import Respondent
+
+EXAMPLE_WORDLIST = os.path.join(os.path.dirname(__file__), '..', '..', 'examples', 'wordlist.xlsx')
+
+SURVEY_SIZES = [1000, 10000, 100000, 1000000]
+WORDLIST_SIZES = [1000, 10000, 100000]
+LANGUAGES = ['en', 'de', 'he', 'ar']
+
+SEED_WORDS = {
+    'en': ['happy', 'sad', 'angry', 'afraid', 'guilty', 'ashamed', 'proud', 'relieved', 'jealous', 'lonely',
+           'disappointed', 'excited', 'nervous', 'grateful', 'upset', 'calm', 'worried', 'embarrassed'],
+    'he': ['שמח', 'עצוב', 'כועס', 'מפחד', 'אשם', 'נבוך', 'גאה', 'הקלה', 'קנאה', 'בודד', 'מאוכזב', 'נרגש',
+           'לחוץ', 'אסיר תודה', 'מודאג', 'רגוע'],
+    'ar': ['سعيد', 'حزين', 'غاضب', 'خائف', 'مذنب', 'خجل', 'فخور', 'مرتاح', 'غيور', 'وحيد', 'محبط', 'متحمس',
+           'قلق', 'ممتن', 'مستاء', 'هادئ'],
+}
+
+ALPHABETS = {
+    'en': 'abcdefghijklmnopqrstuvwxyz',
+    'de': 'abcdefghijklmnopqrstuvwxyzäöüß',
+    'he': 'אבגדהזחטיכלמנסעפצקרשת',
+    'ar': 'ابتثجحخدذرزسشصضطظعغفقكلمنهوي',
+}
+
+TEMPLATES = {
+    'en': (["i would feel", "i'd be", "i think i would feel", "probably", "i would be so"],
+           ["they would feel", "he would be", "she would feel", "they'd be", "my friend would feel"],
+           ["and", "but also", "maybe a bit", "really", "because of it", "at first then"]),
+    'de': (["ich würde mich", "ich wäre", "ich hätte", "ich würde", "ich bin"],
+           ["er würde sich", "sie wäre", "sie würde", "er hätte", "meine freundin wäre"],
+           ["und", "aber auch", "vielleicht etwas", "sehr", "weil", "zuerst dann"]),
+    'he': (["הייתי מרגיש", "הייתי", "אני חושב שהייתי", "כנראה", "הייתי מאוד"],
+           ["הוא היה מרגיש", "היא הייתה", "הם היו", "החבר שלי היה", "היא הייתה מרגישה"],
+           ["ו", "אבל גם", "אולי קצת", "ממש", "בגלל זה", "קודם ואז"]),
+    'ar': (["سأشعر", "سأكون", "أعتقد أنني سأشعر", "ربما", "سأكون جدا"],
+           ["سيشعر", "ستكون", "سيكونون", "صديقي سيكون", "ستشعر"],
+           ["و", "لكن أيضا", "ربما قليلا", "حقا", "بسبب ذلك", "في البداية ثم"]),
+}
+
+
+def benchmark_sizes(sizes: list, variable: str) -> list:
+    '''
+    Returns the sizes up to the maximum given by an environment variable, or only the smallest size if it is not set
+
+            Parameters:
+                    sizes (list): The available sizes, in increasing order
+                    variable (str): The name of the environment variable holding the maximum size
+            Returns:
+                    sizes (list): The selected sizes
+    '''
+    maximum = os.environ.get(variable)
+    if not maximum:
+        return sizes[:1]
+    return [size for size in sizes if size <= int(maximum)] or sizes[:1]
+
+
+def seed_wordlist(language: str = 'de'):
+    '''
+    Returns the seed words of a language and the score and sublevel distribution of the example wordlist
+
+            Parameters:
+                    language (str): 'en', 'de', 'he' or 'ar'
+            Returns:
+                    words (list): The seed words
+                    scores (list): The scores of the example wordlist, cycled over when scoring new terms
+                    subclasses (list): The sublevels of the example wordlist (0 if it has none)
+    '''
+    data = pd.read_excel(EXAMPLE_WORDLIST, engine='openpyxl')
+    scores = [float(score) for score in data.iloc[:, 1]]
+    subclasses = [float(sub) for sub in data.iloc[:, 2]] if data.shape[1] > 2 else [0.0] * len(scores)
+    if language == 'de':
+        words = [str(word).strip().lower() for word in data.iloc[:, 0]]
+    else:
+        words = list(SEED_WORDS[language])
+    return words, scores, subclasses
+
+
+def _suffix(number: int, alphabet: str) -> str:
+    # Writes number in base len(alphabet) with the letters of the alphabet, so every number gives a distinct suffix
+    suffix = ''
+    while number > 0:
+        number, digit = divmod(number - 1, len(alphabet))
+        suffix = alphabet[digit] + suffix
+    return suffix
+
+
+def make_wordlist(num_terms: int, language: str = 'de', phrase_fraction: float = 0.1, seed: int = 0):
+    '''
+    Generates a wordlist of num_terms distinct terms grown from the seed words of the language
+
+            Parameters:
+                    num_terms (int): The number of terms
+                    language (str): 'en', 'de', 'he' or 'ar'
+                    phrase_fraction (float): The fraction of terms that are two or three word phrases
+                    seed (int): The random seed
+            Returns:
+                    words (list): The terms, starting with the seed words
+                    scores (list): The score of each term (1 to 4)
+                    subclasses (list): The sublevel of each term
+    '''
+    rng = random.Random(seed)
+    seeds, seed_scores, seed_subclasses = seed_wordlist(language)
+    alphabet = ALPHABETS[language]
+    words, scores, subclasses, seen = [], [], [], set()
+    number = 0
+    while len(words) < num_terms:
+        index = number % len(seeds)
+        word = seeds[index] + _suffix(number // len(seeds), alphabet)
+        number += 1
+        if number > len(seeds) and rng.random() < phrase_fraction:
+            word = ' '.join([word] + rng.sample(seeds, rng.choice([1, 2])))
+        if word in seen:
+            continue
+        seen.add(word)
+        words.append(word)
+        scores.append(seed_scores[index % len(seed_scores)] if number <= len(seeds) else float(rng.randint(1, 4)))
+        subclasses.append(seed_subclasses[index % len(seed_subclasses)])
+    return words, scores, subclasses
+
+
+def write_wordlist(filename: str, words: list, scores: list, subclasses: list = None) -> str:
+    '''
+    Writes a wordlist in the format read by Wordlist (.xlsx with word, score and sublevel columns, or .txt)
+
+            Parameters:
+                    filename (str): The output file
+                    words (list): The terms
+                    scores (list): Their scores
+                    subclasses (list): Their sublevels
+            Returns:
+                    filename (str): The output file
+    '''
+    if filename.endswith('.txt'):
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("Synthetic benchmark wordlist\n")
+            f.write("Generated from the example wordlist\n")
+            for word, score in zip(words, scores):
+                f.write(f"{word}\n{score}\n")
+        return filename
+    if subclasses is None:
+        subclasses = [0.0] * len(words)
+    pd.DataFrame({'Words': words, 'Scores': scores, 'Sublevel': subclasses}).to_excel(filename, index=False)
+    return filename
+
+
+def make_answer(rng: random.Random, start: str, terms: list, fillers: list, num_seeds: int) -> str:
+    '''Builds one answer: a template start followed by zero to three terms joined by filler words'''
+    parts = [start]
+    for i in range(rng.choice([0, 1, 1, 1, 2, 2, 3])):
+        if i:
+            parts.append(rng.choice(fillers))
+        # Most answers use the common (seed) words, a few use the rest of the wordlist
+        if rng.random() < 0.8:
+            parts.append(terms[rng.randrange(min(num_seeds, len(terms)))])
+        else:
+            parts.append(rng.choice(terms))
+    answer = ' '.join(parts)
+    return answer[0].upper() + answer[1:] + rng.choice(['.', '.', '!', ''])
+
+
+def make_survey(num_items: int, terms: list, language: str = 'de', items_per_respondent: int = 20,
+                repeat_fraction: float = 0.3, empty_fraction: float = 0.02, seed: int = 0) -> list:
+    '''
+    Generates the answers of a synthetic survey
+
+            Parameters:
+                    num_items (int): The total number of items
+                    terms (list): The wordlist terms the answers are made of (seed words first)
+                    language (str): 'en', 'de', 'he' or 'ar'
+                    items_per_respondent (int): The number of items of each respondent
+                    repeat_fraction (float): The fraction of answers reused from a pool of short, common answers
+                    empty_fraction (float): The fraction of empty answers
+                    seed (int): The random seed
+            Returns:
+                    respondents (list): One list of (self, other) answers per respondent
+    '''
+    rng = random.Random(seed)
+    self_starts, other_starts, fillers = TEMPLATES[language]
+    num_seeds = len(SEED_WORDS.get(language, [])) or 20
+    common = terms[:num_seeds] + [make_answer(rng, rng.choice(self_starts), terms, fillers, num_seeds) for _ in range(num_seeds)]
+
+    def answer(starts):
+        draw = rng.random()
+        if draw < empty_fraction:
+            return ""
+        if draw < empty_fraction + repeat_fraction:
+            return rng.choice(common)
+        return make_answer(rng, rng.choice(starts), terms, fillers, num_seeds)
+
+    respondents = []
+    for start in range(0, num_items, items_per_respondent):
+        count = min(items_per_respondent, num_items - start)
+        respondents.append([(answer(self_starts), answer(other_starts)) for _ in range(count)])
+    return respondents
+
+
+def write_survey(filename: str, respondents: list, layout: str = 'vertical') -> str:
+    '''
+    Writes a synthetic survey in the vertical or horizontal layout read by Survey.from_file (.csv, .xlsx or .json)
+
+            Parameters:
+                    filename (str): The output file
+                    respondents (list): One list of (self, other) answers per respondent
+                    layout (str): 'vertical' (one row per item, a blank row after each respondent) or
+                                  'horizontal' (one row per respondent with self/other column pairs)
+            Returns:
+                    filename (str): The output file
+    '''
+    if filename.endswith('.json'):
+        build_survey(respondents).save(filename)
+        return filename
+
+    if layout == 'vertical':
+        rows = [['Person', 'Self', 'Other']]
+        for index, answers in enumerate(respondents):
+            rows += [[f"R{index+1}", self_sentence, other_sentence] for self_sentence, other_sentence in answers]
+            rows.append([None, None, None])
+    else:
+        width = max(len(answers) for answers in respondents)
+        header = ['Person']
+        for i in range(width):
+            header += [f"Self {i+1}", f"Other {i+1}"]
+        rows = [header]
+        for index, answers in enumerate(respondents):
+            row = [f"R{index+1}"]
+            for self_sentence, other_sentence in answers:
+                row += [self_sentence, other_sentence]
+            rows.append(row + [None] * (len(header) - len(row)))
+
+    frame = pd.DataFrame(rows)
+    if filename.endswith('.csv'):
+        frame.to_csv(filename, header=False, index=False)
+    else:
+        frame.to_excel(filename, header=False, index=False)
+    return filename
+
+
+def build_survey(respondents: list, wordlist=None) -> Survey:
+    '''
+    Builds a Survey in memory from synthetic answers, without going through a file
+
+            Parameters:
+                    respondents (list): One list of (self, other) answers per respondent
+                    wordlist (Wordlist): The wordlist of the survey
+            Returns:
+                    survey (Survey): The survey
+    '''
+    survey = Survey()
+    if wordlist is not None:
+        survey.add_wordlist(wordlist)
+    for index, answers in enumerate(respondents):
+        respondent = Respondent(userid=f"R{index+1}")
+        survey.add_respondent(respondent)
+        for self_sentence, other_sentence in answers:
+            respondent.add_item(self_sentence, other_sentence)
+    return survey
@@ -0,0 +1,309 @@
+"""
+Benchmark regression runner.
+
+Times the Survey.score, match_words and I/O paths on synthetic data (see generators.py), writes the results to a
+versioned JSON baseline and compares a later run against it. A metric regresses when it is worse than the baseline by
+more than the tolerance: a throughput drop, a latency increase or a peak memory growth. Everything runs offline.
+
+    python -m tests.benchmarks.regression baseline                  # writes .benchmarks/veta_baseline.json
+    python -m tests.benchmarks.regression compare --tolerance 0.15  # exits with 1 if a metric regressed
+    python -m tests.benchmarks.regression run --output current.json # only measures
+
+Peak memory is measured with tracemalloc in a separate round, so the timed rounds are not slowed down by tracing.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import veta
+from veta.wordlist import Wordlist
+from veta.survey import Survey
+from veta.item import Item
+from veta.scoring_modules.scoring_module import ScoringModule
+from veta.scoring_modules._3345 import _3345
+from veta.scoring_modules.allsum import allsum
+from veta.scoring_modules.count import count
+from veta.scoring_modules.highestN import highestN
+from veta.scoring_modules.mlr import mlr
+from veta.scoring_modules.vocab import vocab
+from tests.benchmarks.generators import make_wordlist, write_wordlist, make_survey, write_survey, build_survey
+
+# Bump when the benchmarks or the file layout change, baselines of another format are not compared
+BASELINE_FORMAT = 1
+DEFAULT_BASELINE = os.path.join(".benchmarks", "veta_baseline.json")
+DEFAULT_CONFIG = {"items": 10000, "terms": 1000, "sentences": 2000, "languages": ["de", "he"], "rounds": 5}
+
+# For each metric, whether a higher value is better
+METRICS = {"throughput": True, "latency": False, "p99_latency": False, "peak_memory": False}
+
+
+def measure(function, setup=None, rounds=3):
+    '''
+    Runs a function several times and measures it
+
+            Parameters:
+                    function (callable): The code to measure. Returns the number of units processed (items, sentences).
+                    setup (callable): Called before every round, outside of the timing
+                    rounds (int): The number of timed rounds
+            Returns:
+                    result (dict): throughput (units per second), latency (seconds of the fastest round) and
+                                   peak_memory (bytes allocated at the peak of an additional traced round)
+    '''
+    times = []
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        units = function()
+        times.append(time.perf_counter() - start)
+    # The fastest round is the least affected by the noise of other processes
+    latency = min(times)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"throughput": units / latency if latency > 0 else 0.0, "latency": latency, "peak_memory": peak}
+
+
+def percentile(values: list, fraction: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))] if values else 0.0
+
+
+def run_benchmarks(config: dict = None) -> dict:
+    '''
+    Runs every benchmark of the regression suite
+
+            Parameters:
+                    config (dict): Overrides of DEFAULT_CONFIG (items, terms, sentences, languages, rounds)
+            Returns:
+                    results (dict): The measurements of each benchmark, by name
+    '''
+    config = dict(DEFAULT_CONFIG, **(config or {}))
+    rounds = config["rounds"]
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        wordlists = {}
+        for language in set(config["languages"]) | {"de"}:
+            words, scores, subclasses = make_wordlist(config["terms"], language)
+            filename = write_wordlist(os.path.join(directory, f"wordlist_{language}.xlsx"), words, scores, subclasses)
+            wordlists[language] = (filename, words)
+
+        # Matching, one benchmark per language
+        for language in config["languages"]:
+            filename, words = wordlists[language]
+            wordlist = Wordlist(filename, language=language)
+            sentences = [Item.normalizer(sentence) for answers in make_survey(config["sentences"] // 2, words, language)
+                         for answer in answers for sentence in answer]
+            module = ScoringModule(language=language)
+            module.add_wordlist(wordlist)
+            latencies = []
+
+            def match_all():
+                latencies.append([])
+                for sentence in sentences:
+                    start = time.perf_counter()
+                    module.match_words(sentence, wordlist)
+                    latencies[-1].append(time.perf_counter() - start)
+                return len(sentences)
+
+            result = measure(match_all, rounds=rounds)
+            # The per sentence p99 of the timed rounds (the last round ran under tracemalloc)
+            result["p99_latency"] = percentile([percentile(round, 0.99) for round in latencies[:rounds]], 0.5)
+            results[f"match_words.{language}"] = result
+
+        # Scoring
+        filename, words = wordlists["de"]
+        answers = make_survey(config["items"], words, "de")
+        survey = build_survey(answers, Wordlist(filename))
+        modules = [allsum(), _3345(), count(), highestN(3), mlr(), vocab()]
+
+        def clear_matches():
+            for respondent in survey.respondents:
+                for item in respondent.items:
+                    item.matches = {}
+
+        def score():
+            survey.score(*modules)
+            return config["items"]
+
+        results["survey.score"] = measure(score, setup=clear_matches, rounds=rounds)
+
+        # I/O
+        csv_file = write_survey(os.path.join(directory, "survey.csv"), answers, "vertical")
+        json_file = os.path.join(directory, "scored.json")
+
+        def from_file():
+            loaded = Survey(filename)
+            loaded.from_file(csv_file, layout="vertical")
+            return config["items"]
+
+        def save_json():
+            survey.save(json_file)
+            return config["items"]
+
+        def from_json():
+            Survey().from_json(json_file)
+            return config["items"]
+
+        results["io.from_file_csv"] = measure(from_file, rounds=rounds)
+        results["io.save_json"] = measure(save_json, rounds=rounds)
+        results["io.from_json"] = measure(from_json, rounds=rounds)
+    return results
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def make_report(results: dict, config: dict = None) -> dict:
+    '''Wraps benchmark results with the format version, configuration and environment they were measured in'''
+    return {
+        "format": BASELINE_FORMAT,
+        "veta_version": veta.__version__,
+        "commit": git_commit(),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": dict(DEFAULT_CONFIG, **(config or {})),
+        "results": results,
+    }
+
+
+def save_report(report: dict, filename: str) -> None:
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filename, "w") as f:
+        json.dump(report, f, indent=2)
+    return
+
+
+def load_report(filename: str) -> dict:
+    '''
+    Reads a baseline written by save_report
+
+            Parameters:
+                    filename (str): The baseline file
+            Returns:
+                    report (dict): The baseline
+            Raises:
+                    ValueError: If the baseline was written in another format
+    '''
+    with open(filename, "r") as f:
+        report = json.load(f)
+    if report.get("format") != BASELINE_FORMAT:
+        raise ValueError(f"Baseline {filename} has format {report.get('format')}, expected {BASELINE_FORMAT}. Write a new baseline.")
+    return report
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.15, memory_tolerance: float = None) -> list:
+    '''
+    Compares two reports metric by metric
+
+            Parameters:
+                    baseline (dict): The baseline report
+                    current (dict): The report of the new run
+                    tolerance (float): The relative change of throughput and latency metrics that is tolerated
+                    memory_tolerance (float): The relative growth of peak memory that is tolerated (default: tolerance)
+            Returns:
+                    changes (list): One dict per compared metric with benchmark, metric, baseline, current,
+                                    change (relative, positive when worse) and regression (bool)
+            Raises:
+                    ValueError: If the reports were measured with different configurations
+    '''
+    if baseline.get("config") != current.get("config"):
+        raise ValueError(f"Cannot compare runs with different configurations: {baseline.get('config')} and {current.get('config')}")
+    if memory_tolerance is None:
+        memory_tolerance = tolerance
+
+    changes = []
+    for name, reference in baseline["results"].items():
+        measured = current["results"].get(name)
+        if measured is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if metric not in reference or metric not in measured or not reference[metric]:
+                continue
+            change = (measured[metric] - reference[metric]) / reference[metric]
+            if higher_is_better:
+                change = -change
+            limit = memory_tolerance if metric == "peak_memory" else tolerance
+            changes.append({
+                "benchmark": name,
+                "metric": metric,
+                "baseline": reference[metric],
+                "current": measured[metric],
+                "change": change,
+                "regression": change > limit,
+            })
+    return changes
+
+
+def format_changes(changes: list) -> str:
+    ret = ""
+    for change in changes:
+        status = "REGRESSION" if change["regression"] else "ok"
+        ret += "{:<22} {:<12} {:>14.6g} -> {:<14.6g} {:+7.1%}  {}\n".format(
+            change["benchmark"], change["metric"], change["baseline"], change["current"], change["change"], status)
+    return ret
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Veta benchmark regression runner")
+    parser.add_argument("command", choices=["run", "baseline", "compare"],
+                        help="run: measure only, baseline: measure and write the baseline, compare: measure and compare to the baseline")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="The baseline file")
+    parser.add_argument("--output", help="Also write the measurements of this run to a file")
+    parser.add_argument("--current", help="Compare this report instead of running the benchmarks")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Tolerated relative change of throughput and latency")
+    parser.add_argument("--memory-tolerance", type=float, default=None, help="Tolerated relative growth of peak memory")
+    parser.add_argument("--items", type=int, default=DEFAULT_CONFIG["items"], help="Number of survey items")
+    parser.add_argument("--terms", type=int, default=DEFAULT_CONFIG["terms"], help="Number of wordlist terms")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_CONFIG["rounds"], help="Number of timed rounds")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare" and args.current:
+        report = load_report(args.current)
+    else:
+        config = {"items": args.items, "terms": args.terms, "rounds": args.rounds}
+        report = make_report(run_benchmarks(config), config)
+    if args.output:
+        save_report(report, args.output)
+
+    if args.command == "baseline":
+        save_report(report, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+    if args.command != "compare":
+        for name, result in report["results"].items():
+            print("{:<22} {}".format(name, ", ".join(f"{metric} {value:.6g}" for metric, value in result.items())))
+        return 0
+
+    changes = compare(load_report(args.baseline), report, args.tolerance, args.memory_tolerance)
+    print(format_changes(changes), end="")
+    regressions = [change for change in changes if change["regression"]]
+    if regressions:
+        print(f"{len(regressions)} metrics regressed by more than the tolerance")
+        return 1
+    print("No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Worst case latency benchmarks: match_words on adversarial answers (pages of pasted text, one word repeated thousands
+of times, long runs without spaces) with each long sentence policy. With the 'truncate' policy the latency of an item
+is bounded by max_sentence_length whatever the length of the answer.
+Run with: pytest tests/benchmarks/ --benchmark-only
+"""
+import pytest
+
+from veta.wordlist import Wordlist
+from veta.item import Item
+from veta.scoring_modules.scoring_module import ScoringModule
+from tests.benchmarks.generators import make_wordlist, make_survey
+
+pytest.importorskip("pytest_benchmark")
+
+MAX_SENTENCE_LENGTH = 2000
+# Generous bound on the latency of one truncated item, far above the expected few milliseconds
+TRUNCATED_LATENCY_BOUND = 0.5
+
+
+def adversarial_answers(language='en', num_terms=1000):
+    words = make_wordlist(num_terms, language)[0]
+    pasted = ' '.join(answer for answers in make_survey(2000, words, language) for pair in answers for answer in pair)
+    return {
+        "pasted_text": Item.normalizer(pasted),
+        "repeated_word": ' '.join([words[1]] * 20000),
+        "repeated_phrase": ' '.join([words[0], words[1]] * 10000),
+        "no_spaces": words[1] * 20000,
+    }
+
+
+@pytest.fixture(scope="module")
+def adversarial(synthetic_wordlist):
+    return Wordlist(synthetic_wordlist(1000, 'en'), language='en'), adversarial_answers()
+
+
+@pytest.mark.slow
+@pytest.mark.scoring
+@pytest.mark.parametrize("policy", ["truncate", "split", None])
+@pytest.mark.parametrize("answer", ["pasted_text", "repeated_word", "repeated_phrase", "no_spaces"])
+def test_adversarial_match_words(benchmark, adversarial, answer, policy):
+    wordlist, answers = adversarial
+    sentence = answers[answer]
+    module = ScoringModule(language='en')
+    module.add_wordlist(wordlist)
+    if policy is not None:
+        module.max_sentence_length = MAX_SENTENCE_LENGTH
+        module.long_sentence_policy = policy
+
+    benchmark.pedantic(module.match_words, args=(sentence, wordlist), rounds=3, iterations=1)
+    benchmark.extra_info["characters"] = len(sentence)
+    benchmark.extra_info["policy"] = policy or "none"
+    if benchmark.stats:
+        benchmark.extra_info["microseconds_per_character"] = round(1e6 * benchmark.stats.stats.mean / len(sentence), 3)
+        if policy == "truncate":
+            assert benchmark.stats.stats.max < TRUNCATED_LATENCY_BOUND
@@ -0,0 +1,94 @@
+"""
+Memory benchmarks for the Item and Respondent representation.
+
+Builds respondents from many short, repeated answers and reports the traced bytes per item in the
+benchmark's extra_info, with and without the raw input kept, and the bytes per item still held after
+the survey is scored (the scores, and the matches when they are indexed).
+Run with: pytest tests/benchmarks/ --benchmark-only
+"""
+import random
+import tracemalloc
+import pytest
+
+from veta.item import Item
+from veta.respondent import Respondent
+from veta.survey import Survey
+from veta.wordlist import Wordlist
+from veta.scoring_modules.allsum import allsum
+from veta.scoring_modules.count import count
+from veta.scoring_modules.highestN import highestN
+from veta.scoring_modules.highestN_allinone import highestN_allinone
+
+pytest.importorskip("pytest_benchmark")
+
+ANSWERS = ["I would feel happy.", "sad", "angry", "I would feel happy. They would feel happy.",
+           "I'd be nervous", "She would feel relieved and grateful", "embarrassed", "I would feel proud of myself"]
+NUM_ITEMS = 2000
+ITEMS_PER_RESPONDENT = 20
+
+
+def make_answers(num_items):
+    rng = random.Random(0)
+    # Copy the strings so that every answer is a distinct object, as when reading a survey file
+    return [(''.join(list(rng.choice(ANSWERS))), ''.join(list(rng.choice(ANSWERS)))) for _ in range(num_items)]
+
+
+def bytes_per_item(answers, keep_raw_input):
+    default = Item.keep_raw_input
+    Item.keep_raw_input = keep_raw_input
+    try:
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        respondents = []
+        for start in range(0, len(answers), ITEMS_PER_RESPONDENT):
+            respondent = Respondent()
+            for self_sentence, other_sentence in answers[start:start + ITEMS_PER_RESPONDENT]:
+                respondent.add_item(self_sentence, other_sentence)
+            respondents.append(respondent)
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+    finally:
+        Item.keep_raw_input = default
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return size / len(answers)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("keep_raw_input", [True, False])
+def test_item_memory(benchmark, keep_raw_input):
+    answers = make_answers(NUM_ITEMS)
+    result = benchmark.pedantic(bytes_per_item, args=(answers, keep_raw_input), rounds=1, iterations=1)
+    benchmark.extra_info["bytes_per_item"] = round(result)
+    benchmark.extra_info["keep_raw_input"] = keep_raw_input
+    assert result > 0
+
+
+def scored_bytes_per_item(answers, wordlist, index_terms):
+    survey = Survey()
+    survey.add_wordlist(wordlist)
+    for start in range(0, len(answers), ITEMS_PER_RESPONDENT):
+        respondent = Respondent()
+        for self_sentence, other_sentence in answers[start:start + ITEMS_PER_RESPONDENT]:
+            respondent.add_item(self_sentence, other_sentence)
+        survey.add_respondent(respondent)
+    modules = [allsum(), count(), highestN(3), highestN_allinone(3)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    survey.score(*modules, dedup=False, index_terms=index_terms)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    return size / len(answers)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("index_terms", [False, True])
+def test_scored_item_memory(benchmark, synthetic_wordlist, index_terms):
+    # Distinct answers, so that every item keeps matches of its own when they are indexed
+    answers = [(f"{self_sentence} {i}", other_sentence) for i, (self_sentence, other_sentence)
+               in enumerate(make_answers(NUM_ITEMS))]
+    wordlist = Wordlist(synthetic_wordlist(1000, "en"))
+    result = benchmark.pedantic(scored_bytes_per_item, args=(answers, wordlist, index_terms), rounds=1, iterations=1)
+    benchmark.extra_info["bytes_per_item"] = round(result)
+    benchmark.extra_info["index_terms"] = index_terms
+    assert result > 0
@@ -0,0 +1,75 @@
+import json
+import pytest
+
+from tests.benchmarks import regression
+
+SMALL_CONFIG = {"items": 40, "terms": 60, "sentences": 20, "languages": ["de"], "rounds": 1}
+
+
+def report(results, config=None):
+    return {"format": regression.BASELINE_FORMAT, "config": config or SMALL_CONFIG, "results": results}
+
+
+class TestCompare:
+    """Test cases for comparing a run against a baseline"""
+
+    def test_flags_throughput_latency_and_memory_regressions(self):
+        """Test that each metric regresses in its own direction"""
+        baseline = report({"survey.score": {"throughput": 1000.0, "latency": 1.0, "peak_memory": 1000}})
+        current = report({"survey.score": {"throughput": 800.0, "latency": 1.05, "peak_memory": 1300}})
+
+        changes = {change["metric"]: change for change in regression.compare(baseline, current, tolerance=0.1)}
+
+        assert changes["throughput"]["regression"]
+        assert changes["throughput"]["change"] == pytest.approx(0.2)
+        assert not changes["latency"]["regression"]
+        assert changes["peak_memory"]["regression"]
+
+    def test_improvements_and_memory_tolerance(self):
+        """Test that improvements never regress and that memory has its own tolerance"""
+        baseline = report({"match_words.de": {"throughput": 100.0, "latency": 2.0, "p99_latency": 0.01, "peak_memory": 1000}})
+        current = report({"match_words.de": {"throughput": 150.0, "latency": 1.0, "p99_latency": 0.005, "peak_memory": 1300}})
+
+        changes = regression.compare(baseline, current, tolerance=0.1, memory_tolerance=0.5)
+
+        assert len(changes) == 4
+        assert not any(change["regression"] for change in changes)
+
+    def test_different_configurations_are_not_compared(self):
+        """Test that runs of different sizes cannot be compared"""
+        baseline = report({}, dict(SMALL_CONFIG, items=100))
+        with pytest.raises(ValueError):
+            regression.compare(baseline, report({}))
+
+    def test_load_rejects_other_formats(self, tmp_path):
+        """Test that a baseline of another format version is rejected"""
+        filename = tmp_path / "baseline.json"
+        filename.write_text(json.dumps(dict(report({}), format=regression.BASELINE_FORMAT + 1)))
+        with pytest.raises(ValueError):
+            regression.load_report(str(filename))
+
+
+@pytest.mark.slow
+class TestRegressionRunner:
+    """Test cases for running the regression suite"""
+
+    def test_run_benchmarks(self):
+        """Test that every benchmarked path reports its metrics"""
+        results = regression.run_benchmarks(SMALL_CONFIG)
+
+        assert set(results) == {"match_words.de", "survey.score", "io.from_file_csv", "io.save_json", "io.from_json"}
+        for result in results.values():
+            assert result["throughput"] > 0 and result["latency"] > 0 and result["peak_memory"] > 0
+        assert results["match_words.de"]["p99_latency"] > 0
+
+    def test_main_compares_reports(self, tmp_path):
+        """Test the command line exit codes of a passing and a regressing comparison"""
+        baseline = str(tmp_path / "baseline.json")
+        current = str(tmp_path / "current.json")
+        regression.save_report(report({"survey.score": {"throughput": 1000.0, "latency": 1.0}}), baseline)
+
+        regression.save_report(report({"survey.score": {"throughput": 990.0, "latency": 1.01}}), current)
+        assert regression.main(["compare", "--baseline", baseline, "--current", current]) == 0
+
+        regression.save_report(report({"survey.score": {"throughput": 500.0, "latency": 2.0}}), current)
+        assert regression.main(["compare", "--baseline", baseline, "--current", current]) == 1
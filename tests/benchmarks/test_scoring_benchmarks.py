@@ -0,0 +1,211 @@
+"""
+Benchmarks for the execute method of every scoring module and for Survey.score on synthetic surveys, with one
+wordlist or several (Survey.score_wordlists against one Survey.score per wordlist), and on a mixed language survey
+(items routed to the wordlist and modules of their language against one survey per language). Wordlist edits are
+measured as delta updates of the affected items (Survey.apply_wordlist_diff) against scoring the survey again.
+The per item match results (Item.matches) are cleared before each round so that every round includes matching.
+Run with: pytest tests/benchmarks/ --benchmark-only
+Larger surveys: VETA_BENCHMARK_MAX_ITEMS=1000000 pytest tests/benchmarks/ --benchmark-only
+"""
+import pytest
+
+from veta.scoring_modules._334 import _334
+from veta.scoring_modules._3345 import _3345
+from veta.scoring_modules._3345plus import _3345plus
+from veta.scoring_modules.allsum import allsum
+from veta.scoring_modules.allsum_unique import allsum_unique
+from veta.scoring_modules.count import count
+from veta.scoring_modules.count_levels import count_levels
+from veta.scoring_modules.exp import exp
+from veta.scoring_modules.highestN import highestN
+from veta.scoring_modules.highestN_allinone import highestN_allinone
+from veta.scoring_modules.highestN_unique import highestN_unique
+from veta.scoring_modules.length import length
+from veta.scoring_modules.mlr import mlr
+from veta.scoring_modules.powerlaw import powerlaw
+from veta.scoring_modules.vocab import vocab
+from veta.wordlist import Wordlist, WordlistDiff
+from tests.benchmarks.generators import SURVEY_SIZES, benchmark_sizes, build_survey
+
+pytest.importorskip("pytest_benchmark")
+
+ITEMS = benchmark_sizes(SURVEY_SIZES, "VETA_BENCHMARK_MAX_ITEMS")
+NUM_ITEMS = 1000
+
+MODULES = {
+    "334": lambda: _334(),
+    "3345": lambda: _3345(),
+    "3345plus": lambda: _3345plus(),
+    "allsum": lambda: allsum(),
+    "allsum-unique": lambda: allsum_unique(),
+    "count": lambda: count(),
+    "count-levels": lambda: count_levels(),
+    "exp": lambda: exp(0.5),
+    "highestN": lambda: highestN(3),
+    "highestN-allinone": lambda: highestN_allinone(3),
+    "highestN-unique": lambda: highestN_unique(3),
+    "length": lambda: length(),
+    "mlr": lambda: mlr(),
+    "powerlaw": lambda: powerlaw(2.0),
+    "vocab": lambda: vocab(),
+}
+
+
+def sentiment_module():
+    pytest.importorskip("vaderSentiment")
+    from veta.scoring_modules.sentiment import sentiment
+    return sentiment()
+
+
+def clear_matches(survey):
+    for respondent in survey.respondents:
+        for item in respondent.items:
+            item.matches = {}
+
+
+@pytest.mark.slow
+@pytest.mark.scoring
+@pytest.mark.parametrize("name", list(MODULES) + ["sentiment"])
+def test_module_execute(benchmark, synthetic_survey, name):
+    module = sentiment_module() if name == "sentiment" else MODULES[name]()
+    survey = synthetic_survey(NUM_ITEMS)
+    wordlist = survey.wordlist
+
+    def execute_all():
+        if module.type == "per item":
+            return [module.execute(item, wordlist) for respondent in survey.respondents for item in respondent.items]
+        return [module.execute(respondent.items, wordlist) for respondent in survey.respondents]
+
+    results = benchmark.pedantic(execute_all, setup=lambda: clear_matches(survey), rounds=3, iterations=1)
+    benchmark.extra_info["items"] = NUM_ITEMS
+    if benchmark.stats:
+        benchmark.extra_info["items_per_second"] = round(NUM_ITEMS / benchmark.stats.stats.mean)
+    assert len(results) > 0
+
+
+@pytest.mark.slow
+@pytest.mark.survey
+@pytest.mark.parametrize("dedup", [True, False])
+@pytest.mark.parametrize("num_items", ITEMS)
+def test_survey_score(benchmark, synthetic_survey, num_items, dedup):
+    survey = synthetic_survey(num_items)
+    modules = [MODULES[name]() for name in ["allsum", "3345", "count", "highestN", "mlr", "vocab"]]
+
+    benchmark.pedantic(survey.score, args=tuple(modules), kwargs={"dedup": dedup},
+                       setup=lambda: clear_matches(survey), rounds=3, iterations=1)
+    benchmark.extra_info["items"] = num_items
+    if benchmark.stats:
+        benchmark.extra_info["items_per_second"] = round(num_items / benchmark.stats.stats.mean)
+    if dedup:
+        benchmark.extra_info["dedup_ratio"] = round(survey.dedup_report["dedup_ratio"], 3)
+    assert "allsum" in survey.respondents[0].totals
+
+
+@pytest.mark.slow
+@pytest.mark.survey
+@pytest.mark.parametrize("mode", ["union", "separate"])
+def test_survey_score_wordlists(benchmark, synthetic_survey, synthetic_wordlist, mode):
+    survey = synthetic_survey(ITEMS[0])
+    wordlists = {f"terms{num_terms}": Wordlist(synthetic_wordlist(num_terms), language='de')
+                 for num_terms in (500, 1000, 2000)}
+    modules = [MODULES[name]() for name in ["allsum", "count", "highestN"]]
+
+    def score():
+        if mode == "union":
+            return survey.score_wordlists(wordlists, *modules)
+        for wordlist in wordlists.values():
+            survey.add_wordlist(wordlist)
+            survey.score(*modules)
+
+    union = benchmark.pedantic(score, setup=lambda: clear_matches(survey), rounds=3, iterations=1)
+    benchmark.extra_info["items"] = ITEMS[0]
+    benchmark.extra_info["wordlists"] = len(wordlists)
+    if union is not None:
+        benchmark.extra_info["matched_together"] = sum(union.exact.values())
+        assert "allsum-terms1000" in survey.respondents[0].totals
+
+
+@pytest.mark.slow
+@pytest.mark.survey
+@pytest.mark.parametrize("mode", ["routed", "separate"])
+def test_survey_score_mixed_languages(benchmark, synthetic_wordlist, synthetic_answers, mode):
+    languages = ['en', 'de', 'he', 'ar']
+    wordlists = {language: Wordlist(synthetic_wordlist(1000, language), language=language) for language in languages}
+    answers = {language: synthetic_answers(ITEMS[0] // len(languages), language) for language in languages}
+    names = ["allsum", "count", "highestN"]
+
+    if mode == "routed":
+        # The respondents of the languages interleaved in one survey
+        respondents = [respondent for group in zip(*answers.values()) for respondent in group]
+        survey = build_survey(respondents)
+        for language, wordlist in wordlists.items():
+            survey.add_wordlist(wordlist, language=language)
+        counts = survey.detect_languages()
+        surveys = [(survey, [MODULES[name]() for name in names])]
+    else:
+        counts = None
+        surveys = []
+        for language in languages:
+            modules = [MODULES[name]() for name in names]
+            for module in modules:
+                for helper in [module] + [value for value in vars(module).values() if hasattr(value, 'set_language')]:
+                    helper.set_language(language)
+            surveys.append((build_survey(answers[language], wordlists[language]), modules))
+
+    def score():
+        for survey, modules in surveys:
+            survey.score(*modules)
+
+    def setup():
+        for survey, modules in surveys:
+            clear_matches(survey)
+
+    benchmark.pedantic(score, setup=setup, rounds=3, iterations=1)
+    num_items = sum(len(respondent.items) for survey, modules in surveys for respondent in survey.respondents)
+    benchmark.extra_info["items"] = num_items
+    if benchmark.stats:
+        benchmark.extra_info["items_per_second"] = round(num_items / benchmark.stats.stats.mean)
+    if counts is not None:
+        benchmark.extra_info["languages"] = counts
+    assert "allsum" in surveys[0][0].respondents[0].totals
+
+
+@pytest.mark.slow
+@pytest.mark.survey
+@pytest.mark.parametrize("mode", ["delta", "rescore"])
+def test_survey_apply_wordlist_diff(benchmark, synthetic_survey, mode):
+    survey = synthetic_survey(ITEMS[0])
+    modules = [MODULES[name]() for name in ["allsum", "count", "highestN", "highestN-allinone"]]
+    survey.score(*modules, index_terms=True)
+    wordlist = survey.wordlist
+    words = [str(word) for word in wordlist.words]
+    # A curator's edit: a few score changes, removals and new words
+    diff = WordlistDiff(wordlist, add={f"{words[0]} {words[1]}": 3, "neuwort": 2}, remove=words[2:4],
+                        change={word: 1 for word in words[4:9]})
+
+    if mode == "delta":
+        impact = benchmark.pedantic(survey.apply_wordlist_diff, args=(diff, *modules), kwargs={"dry_run": True},
+                                    rounds=3, iterations=1)
+        benchmark.extra_info["rescored"] = impact.rescored
+        benchmark.extra_info["changed_item_scores"] = len(impact.items)
+    else:
+        changed = diff.apply()
+
+        def rescore():
+            survey.add_wordlist(changed)
+            survey.score(*modules)
+
+        benchmark.pedantic(rescore, setup=lambda: clear_matches(survey), rounds=3, iterations=1)
+    benchmark.extra_info["items"] = ITEMS[0]
+
+
+@pytest.mark.slow
+@pytest.mark.survey
+@pytest.mark.parametrize("capacity", [1000, 100000])
+def test_survey_discover_terms(benchmark, synthetic_survey, capacity):
+    survey = synthetic_survey(ITEMS[0])
+    discovery = benchmark.pedantic(survey.discover_terms, kwargs={"capacity": capacity}, rounds=3, iterations=1)
+    benchmark.extra_info["items"] = ITEMS[0]
+    benchmark.extra_info["ngrams"] = len(discovery.counter)
+    benchmark.extra_info["dropped"] = discovery.counter.dropped
+    assert discovery.sentences > 0
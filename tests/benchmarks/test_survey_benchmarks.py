@@ -0,0 +1,90 @@
+"""
+Benchmarks for reading and writing synthetic surveys: Survey.from_file in the vertical and horizontal layouts,
+Survey.save and the JSON round trip (Survey.to_json / Survey.from_json).
+Run with: pytest tests/benchmarks/ --benchmark-only
+Larger surveys: VETA_BENCHMARK_MAX_ITEMS=1000000 pytest tests/benchmarks/ --benchmark-only
+"""
+import pytest
+
+from veta.survey import Survey
+from veta.scoring_modules.allsum import allsum
+from veta.scoring_modules.count import count
+from tests.benchmarks.generators import SURVEY_SIZES, benchmark_sizes
+
+pytest.importorskip("pytest_benchmark")
+
+ITEMS = benchmark_sizes(SURVEY_SIZES, "VETA_BENCHMARK_MAX_ITEMS")
+
+
+def load(filename, layout, wordlist_file):
+    survey = Survey(wordlist_file)
+    survey.from_file(filename, layout=layout)
+    return survey
+
+
+def num_items(survey):
+    return sum(len(respondent.items) for respondent in survey.respondents)
+
+
+@pytest.mark.slow
+@pytest.mark.survey
+@pytest.mark.parametrize("layout", ["vertical", "horizontal"])
+@pytest.mark.parametrize("items", ITEMS)
+def test_from_file_csv(benchmark, synthetic_survey_file, synthetic_wordlist, items, layout):
+    filename = synthetic_survey_file(items, layout, '.csv')
+    survey = benchmark.pedantic(load, args=(filename, layout, synthetic_wordlist(1000)), rounds=3, iterations=1)
+    benchmark.extra_info["items"] = items
+    if benchmark.stats:
+        benchmark.extra_info["items_per_second"] = round(items / benchmark.stats.stats.mean)
+    assert num_items(survey) == items
+
+
+@pytest.mark.slow
+@pytest.mark.survey
+@pytest.mark.parametrize("layout", ["vertical", "horizontal"])
+def test_from_file_xlsx(benchmark, synthetic_survey_file, synthetic_wordlist, layout):
+    filename = synthetic_survey_file(ITEMS[0], layout, '.xlsx')
+    survey = benchmark.pedantic(load, args=(filename, layout, synthetic_wordlist(1000)), rounds=3, iterations=1)
+    benchmark.extra_info["items"] = ITEMS[0]
+    assert num_items(survey) == ITEMS[0]
+
+
+@pytest.fixture
+def scored_survey(synthetic_survey):
+    def make(items):
+        survey = synthetic_survey(items)
+        survey.score(allsum(), count())
+        return survey
+    return make
+
+
+@pytest.mark.slow
+@pytest.mark.survey
+@pytest.mark.parametrize("extension", [".json", ".xlsx"])
+def test_save(benchmark, scored_survey, tmp_path, extension):
+    survey = scored_survey(ITEMS[0])
+    filename = str(tmp_path / f"scored{extension}")
+    benchmark.pedantic(survey.save, args=(filename,), rounds=3, iterations=1)
+    benchmark.extra_info["items"] = ITEMS[0]
+
+
+@pytest.mark.slow
+@pytest.mark.survey
+@pytest.mark.parametrize("items", ITEMS)
+def test_to_json(benchmark, scored_survey, items):
+    survey = scored_survey(items)
+    data = benchmark.pedantic(survey.to_json, rounds=3, iterations=1)
+    benchmark.extra_info["items"] = items
+    assert len(data) == len(survey.respondents)
+
+
+@pytest.mark.slow
+@pytest.mark.survey
+@pytest.mark.parametrize("items", ITEMS)
+def test_from_json(benchmark, scored_survey, tmp_path, items):
+    filename = str(tmp_path / "scored.json")
+    scored_survey(items).save(filename)
+    survey = Survey()
+    benchmark.pedantic(survey.from_json, args=(filename,), rounds=3, iterations=1)
+    benchmark.extra_info["items"] = items
+    assert num_items(survey) == items
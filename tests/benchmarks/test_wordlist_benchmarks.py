@@ -0,0 +1,128 @@
+"""
+Benchmarks for loading wordlists, compiling them into the matcher (ScoringModule.add_wordlist) and matching sentences
+(ScoringModule.match_words) with synthetic wordlists of increasing size in every supported language.
+Run with: pytest tests/benchmarks/ --benchmark-only
+Larger wordlists: VETA_BENCHMARK_MAX_TERMS=100000 pytest tests/benchmarks/ --benchmark-only
+"""
+import re
+import random
+import pytest
+
+from veta.wordlist import Wordlist
+from veta.item import Item
+from veta.scoring_modules.scoring_module import ScoringModule
+from veta.segmentation import SEGMENTERS
+from tests.benchmarks.generators import WORDLIST_SIZES, LANGUAGES, benchmark_sizes
+
+pytest.importorskip("pytest_benchmark")
+
+TERMS = benchmark_sizes(WORDLIST_SIZES, "VETA_BENCHMARK_MAX_TERMS")
+NUM_SENTENCES = 1000
+
+
+@pytest.mark.slow
+@pytest.mark.wordlist
+@pytest.mark.parametrize("extension", [".xlsx", ".txt"])
+@pytest.mark.parametrize("num_terms", TERMS)
+def test_wordlist_load(benchmark, synthetic_wordlist, num_terms, extension):
+    filename = synthetic_wordlist(num_terms, 'de', extension)
+    wordlist = benchmark.pedantic(Wordlist, args=(filename,), rounds=3, iterations=1)
+    benchmark.extra_info["terms"] = len(wordlist.words)
+    assert len(wordlist.words) == num_terms
+
+
+@pytest.mark.slow
+@pytest.mark.wordlist
+@pytest.mark.parametrize("language", LANGUAGES)
+@pytest.mark.parametrize("num_terms", TERMS)
+def test_add_wordlist(benchmark, synthetic_wordlist, num_terms, language):
+    wordlist = Wordlist(synthetic_wordlist(num_terms, language), language=language)
+    module = ScoringModule(language=language)
+    # Purge the re module's pattern cache so that every round compiles the wordlist regex
+    benchmark.pedantic(module.add_wordlist, args=(wordlist,), setup=re.purge, rounds=3, iterations=1)
+    benchmark.extra_info["terms"] = len(wordlist.words)
+    assert module.regex is not None
+
+
+@pytest.mark.slow
+@pytest.mark.scoring
+@pytest.mark.parametrize("language", LANGUAGES)
+@pytest.mark.parametrize("num_terms", TERMS)
+def test_match_words(benchmark, synthetic_wordlist, synthetic_answers, num_terms, language):
+    wordlist = Wordlist(synthetic_wordlist(num_terms, language), language=language)
+    sentences = [Item(self_sentence, other_sentence).full_sentence
+                 for answers in synthetic_answers(NUM_SENTENCES, language, num_terms)
+                 for self_sentence, other_sentence in answers]
+    module = ScoringModule(language=language)
+    module.add_wordlist(wordlist)
+
+    def match_all():
+        return sum(len(module.match_words(sentence, wordlist)[1]) for sentence in sentences)
+
+    matches = benchmark.pedantic(match_all, rounds=3, iterations=1)
+    benchmark.extra_info["sentences"] = len(sentences)
+    benchmark.extra_info["matches"] = matches
+    if benchmark.stats:
+        benchmark.extra_info["sentences_per_second"] = round(len(sentences) / benchmark.stats.stats.mean)
+    assert matches > 0
+
+
+@pytest.mark.slow
+@pytest.mark.scoring
+@pytest.mark.parametrize("matcher", ["token", "segment"])
+@pytest.mark.parametrize("language", sorted(SEGMENTERS))
+def test_match_words_segment(benchmark, synthetic_wordlist, synthetic_answers, language, matcher):
+    wordlist = Wordlist(synthetic_wordlist(TERMS[0], language), language=language)
+    sentences = [Item(self_sentence, other_sentence).full_sentence
+                 for answers in synthetic_answers(NUM_SENTENCES, language, TERMS[0])
+                 for self_sentence, other_sentence in answers]
+    module = ScoringModule(language=language)
+    module.matcher = matcher
+    module.add_wordlist(wordlist)
+
+    def match_all():
+        return sum(len(module.match_words(sentence, wordlist)[1]) for sentence in sentences)
+
+    matches = benchmark.pedantic(match_all, rounds=3, iterations=1)
+    benchmark.extra_info["sentences"] = len(sentences)
+    benchmark.extra_info["matcher"] = matcher
+    if benchmark.stats:
+        benchmark.extra_info["sentences_per_second"] = round(len(sentences) / benchmark.stats.stats.mean)
+    assert matches > 0
+
+
+def misspell(sentence, rng, fraction=0.1):
+    '''Drops or swaps a letter in a fraction of the words of a sentence'''
+    words = sentence.split(' ')
+    for i, word in enumerate(words):
+        if len(word) > 4 and rng.random() < fraction:
+            j = rng.randrange(1, len(word) - 1)
+            words[i] = word[:j] + word[j + 1:] if rng.random() < 0.5 else word[:j - 1] + word[j] + word[j - 1] + word[j + 1:]
+    return ' '.join(words)
+
+
+@pytest.mark.slow
+@pytest.mark.scoring
+@pytest.mark.parametrize("matcher", ["token", "fuzzy"])
+def test_match_words_fuzzy(benchmark, synthetic_wordlist, synthetic_answers, matcher):
+    wordlist = Wordlist(synthetic_wordlist(TERMS[0], 'en'), language='en')
+    rng = random.Random(0)
+    sentences = [misspell(Item(self_sentence, other_sentence).full_sentence, rng)
+                 for answers in synthetic_answers(NUM_SENTENCES, 'en', TERMS[0])
+                 for self_sentence, other_sentence in answers]
+    module = ScoringModule(language='en')
+    module.matcher = matcher
+    module.add_wordlist(wordlist)
+
+    def match_all():
+        return sum(len(module.match_words(sentence, wordlist)[1]) for sentence in sentences)
+
+    matches = benchmark.pedantic(match_all, rounds=3, iterations=1)
+    benchmark.extra_info["sentences"] = len(sentences)
+    benchmark.extra_info["matcher"] = matcher
+    benchmark.extra_info["matches"] = matches
+    if matcher == "fuzzy":
+        benchmark.extra_info["corrections"] = len(module.token_matcher.corrections)
+    if benchmark.stats:
+        benchmark.extra_info["sentences_per_second"] = round(len(sentences) / benchmark.stats.stats.mean)
+    assert matches > 0
@@ -36,7 +36,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 1]),  # frequency
                 np.array(['happy', 'sad']),  # matching_words
@@ -54,7 +54,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("happy happy sad", "joyful")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([2, 1, 1]),  # frequency (happy appears twice)
                 np.array(['happy', 'sad', 'joyful']),  # matching_words
@@ -72,7 +72,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("xyz abc def", "uvw rst")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([]),  # frequency
                 np.array([]),  # matching_words
@@ -89,7 +89,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "xyz")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1]),  # frequency
                 np.array(['happy']),  # matching_words
@@ -106,7 +106,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("very very very happy", "")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             # Assume "very" is not in wordlist but "happy" is
             mock_match.return_value = (
                 np.array([1]),  # frequency
@@ -124,7 +124,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             # Set up mock return value
             mock_match.return_value = (
                 np.array([1, 1]),  # frequency
@@ -134,11 +134,8 @@ class TestAllsumScoringModule:
             
             result = module.execute(item, wordlist)
             
-            # Verify match_words was called with combined sentence
-            mock_match.assert_called_once()
-            call_args = mock_match.call_args[0]
-            expected_sentence = item.self_sentence + ' ' + item.other_sentence
-            assert call_args[0] == expected_sentence
+            # Verify the item was matched as a whole (self and other combined)
+            mock_match.assert_called_once_with(item, wordlist)
 
     def test_execute_empty_sentences(self, sample_wordlist_file):
         """Test execute method with empty sentences"""
@@ -146,7 +143,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("", "")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([]),  # frequency
                 np.array([]),  # matching_words
@@ -163,7 +160,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("some words", "")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 2]),  # frequency
                 np.array(['word1', 'word2']),  # matching_words
@@ -180,7 +177,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("some words", "")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 1]),  # frequency
                 np.array(['good', 'bad']),  # matching_words
@@ -198,7 +195,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("some words", "")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 2]),  # frequency
                 np.array(['word1', 'word2']),  # matching_words
@@ -216,7 +213,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("words repeated many times", "")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([100, 50]),  # high frequency
                 np.array(['word1', 'word2']),  # matching_words
@@ -244,7 +241,7 @@ class TestAllsumScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 1]),  # frequency
                 np.array(['happy', 'sad']),  # matching_words
@@ -265,7 +262,7 @@ class TestAllsumScoringModule:
             "She seems very sad and depressed about the situation"
         )
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 1, 1, 1]),  # frequency
                 np.array(['happy', 'joyful', 'sad', 'depressed']),  # matching_words
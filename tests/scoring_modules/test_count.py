@@ -82,7 +82,7 @@ class TestCountScoringModule:
         item = Item("I feel happy", "She seems sad")
         
         # Mock the match_words method to return predictable results
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 1]),  # frequency
                 np.array(['happy', 'sad']),  # matching_words
@@ -94,10 +94,11 @@ class TestCountScoringModule:
             # Should count unique words
             assert result == 2
             
-            # Verify match_words was called with combined sentence
+            # Verify the self and other sentences were matched together
             mock_match.assert_called_once()
             call_args = mock_match.call_args[0]
-            assert "i feel happy she seems sad" in call_args[0]
+            assert call_args[0] is item
+            assert call_args[2] == 'both'
 
     def test_execute_self_mode(self, sample_wordlist_file):
         """Test execute method with self mode"""
@@ -105,7 +106,7 @@ class TestCountScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1]),  # frequency
                 np.array(['happy']),  # matching_words
@@ -116,9 +117,10 @@ class TestCountScoringModule:
             
             assert result == 1
             
-            # Verify match_words was called with self sentence only
+            # Verify only the self sentence was matched
             call_args = mock_match.call_args[0]
-            assert call_args[0] == item.self_sentence
+            assert call_args[0] is item
+            assert call_args[2] == 'self'
 
     def test_execute_other_mode(self, sample_wordlist_file):
         """Test execute method with other mode"""
@@ -126,7 +128,7 @@ class TestCountScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1]),  # frequency
                 np.array(['sad']),  # matching_words
@@ -137,9 +139,10 @@ class TestCountScoringModule:
             
             assert result == 1
             
-            # Verify match_words was called with other sentence only
+            # Verify only the other sentence was matched
             call_args = mock_match.call_args[0]
-            assert call_args[0] == item.other_sentence
+            assert call_args[0] is item
+            assert call_args[2] == 'other'
 
     def test_execute_with_specific_level(self, sample_wordlist_file):
         """Test execute method with specific level"""
@@ -147,7 +150,7 @@ class TestCountScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 1]),  # frequency
                 np.array(['happy', 'sad']),  # matching_words
@@ -165,7 +168,7 @@ class TestCountScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 1]),  # frequency
                 np.array(['happy', 'sad']),  # matching_words
@@ -183,7 +186,7 @@ class TestCountScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 1]),  # frequency
                 np.array(['happy', 'sad']),  # matching_words
@@ -201,7 +204,7 @@ class TestCountScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1, 1]),  # frequency
                 np.array(['happy', 'sad']),  # matching_words
@@ -220,7 +223,7 @@ class TestCountScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([1]),  # frequency
                 np.array(['happy']),  # matching_words - only 1 word
@@ -238,7 +241,7 @@ class TestCountScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("xyz abc def", "uvw rst")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([]),  # frequency
                 np.array([]),  # matching_words
@@ -255,7 +258,7 @@ class TestCountScoringModule:
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("happy happy happy", "sad sad")
         
-        with patch.object(module, 'match_words') as mock_match:
+        with patch.object(module, 'match_item') as mock_match:
             mock_match.return_value = (
                 np.array([3, 2]),  # frequency (repeated words)
                 np.array(['happy', 'sad']),  # matching_words
@@ -274,9 +277,9 @@ class TestCountScoringModule:
         # Should not raise an error and should set language if supported
         assert hasattr(module, 'language') or True  # True fallback if not supported
 
-    @patch('veta.scoring_modules.count.count.match_words')
+    @patch('veta.scoring_modules.count.count.match_item')
     def test_match_words_sublevel_handling(self, mock_match_words, sample_wordlist_file):
-        """Test that sublevels parameter is passed correctly to match_words"""
+        """Test that sublevels parameter is passed correctly to match_item"""
         module = count(sublevel=1)
         wordlist = Wordlist(sample_wordlist_file)
         item = Item("I feel happy", "She seems sad")
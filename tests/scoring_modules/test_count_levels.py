@@ -0,0 +1,102 @@
+import pytest
+import numpy as np
+from unittest.mock import Mock, patch
+
+from veta.scoring_modules.count import count
+from veta.scoring_modules.count_levels import count_levels, format_level
+from veta.item import Item
+from veta.respondent import Respondent
+from veta.wordlist import Wordlist
+
+
+class TestCountLevelsScoringModule:
+    """Test cases for the count_levels scoring module"""
+
+    def test_class_attributes(self):
+        """Test class attributes are correctly set"""
+        module = count_levels()
+
+        assert module.type == "per item"
+        assert module.id == "count-levels-both"
+        assert module.output_ids == []
+
+    def test_format_level(self):
+        """Test levels are formatted like the count module ids"""
+        assert format_level(3) == "3"
+        assert format_level(3.0) == "3"
+        assert format_level(np.float64(2.0)) == "2"
+        assert format_level(2.5) == "2.5"
+
+    def test_output_ids_follow_count_ids(self, sample_wordlist_file):
+        """Test the column ids are the ones produced by the individual count modules"""
+        wordlist = Wordlist(sample_wordlist_file)
+        module = count_levels(mode='self')
+        module.add_wordlist(wordlist)
+
+        assert count(mode='self').id in module.output_ids
+        assert count(mode='self', binary=True).id in module.output_ids
+        for level in [1, 2, 4, 5]:
+            assert count(mode='self', level=level).id in module.output_ids
+            assert count(mode='self', level=level, binary=True).id in module.output_ids
+        assert count(mode='self', level=1, sublevel=2).id in module.output_ids
+        assert count(mode='self', level=4, sublevel=1, binary=True).id in module.output_ids
+
+    @pytest.mark.parametrize("mode", ["both", "self", "other"])
+    def test_matches_individual_count_modules(self, sample_wordlist_file, mode):
+        """Test every column equals the value of the corresponding count module"""
+        wordlist = Wordlist(sample_wordlist_file)
+        items = [
+            Item("I feel happy and joyful", "She seems sad"),
+            Item("I am angry and depressed", "He is angry"),
+            Item("nothing to see", ""),
+        ]
+        module = count_levels(mode=mode)
+
+        for item in items:
+            result = module.execute(item, wordlist)
+            assert set(result.keys()) == set(module.output_ids)
+
+            assert result[count(mode=mode).id] == count(mode=mode).execute(item, wordlist)
+            assert result[count(mode=mode, binary=True).id] == count(mode=mode, binary=True).execute(item, wordlist)
+            for level, subclass in zip(wordlist.scores, wordlist.subclasses):
+                for binary in [False, True]:
+                    single = count(mode=mode, level=level, binary=binary)
+                    assert result[single.id] == single.execute(item, wordlist)
+                    single = count(mode=mode, level=level, sublevel=subclass, binary=binary)
+                    assert result[single.id] == single.execute(item, wordlist)
+
+    def test_selected_levels_without_sublevels_or_binary(self, sample_wordlist_file):
+        """Test restricting the output to some levels"""
+        wordlist = Wordlist(sample_wordlist_file)
+        module = count_levels(levels=[1, 4], sublevels=False, binary=False)
+        item = Item("I feel happy and angry", "She is depressed")
+
+        result = module.execute(item, wordlist)
+
+        assert result == {"count-both": 3, "count-level-1-both": 2, "count-level-4-both": 1}
+
+    def test_single_match_per_item(self, sample_wordlist_file):
+        """Test the item is only matched once for all of the columns"""
+        wordlist = Wordlist(sample_wordlist_file)
+        module = count_levels()
+        item = Item("I feel happy", "She seems sad")
+
+        with patch.object(module, 'match_item', wraps=module.match_item) as mock_match:
+            module.execute(item, wordlist)
+
+        mock_match.assert_called_once_with(item, wordlist, 'both')
+
+    def test_item_scores_use_count_ids(self, sample_wordlist_file):
+        """Test scoring a respondent stores every column in the item scores"""
+        respondent = Respondent(userid="test_user")
+        respondent.add_wordlist(Wordlist(sample_wordlist_file))
+        respondent.add_item("I feel happy", "She seems sad")
+        respondent.add_item("I am angry", "He is joyful")
+
+        module = count_levels()
+        respondent.score(module)
+
+        for column in module.output_ids:
+            assert column in respondent.items[0].scores
+        assert respondent.totals["count-level-4-both"] == 1
+        assert respondent.totals["count-level-1-both"] == 1
@@ -51,6 +51,17 @@ class TestAutoSelfOtherItem:
             
             mock_nlp.assert_called_once_with(item.raw_input)
 
+    def test_attempt_auto_self_other_uses_item_language(self):
+        """Test that the item's language is used when no language is given"""
+        item = Item("Ich fühle mich glücklich.", language="de")
+
+        with patch('veta.auto_self_other_item.nlp_de') as mock_nlp:
+            mock_nlp.return_value = [Mock(text="Ich", dep_="sb", head=Mock(text="fühle"))]
+
+            attempt_auto_self_other(item)
+
+            mock_nlp.assert_called_once_with(item.raw_input)
+
     def test_attempt_auto_self_other_self_identification(self):
         """Test correct identification of self vs other statements"""
         item = Item("I feel happy. She feels sad.")
@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+from unittest.mock import Mock
+
+from veta.fuzzy_matcher import FuzzyMatcher, edit_distance, deletes
+from veta.scoring_modules.scoring_module import ScoringModule
+from veta.scoring_modules.allsum import allsum
+from veta.survey import Survey
+from veta.respondent import Respondent
+from veta.wordlist import Wordlist
+from veta.match_cache import MatchCache
+
+WORDS = ['embarrassed', 'anxious', 'happy', 'angry', 'sad', 'mad', 'disappointed', 'feel down']
+
+
+def make_wordlist(words, unique_id):
+    wordlist = Mock()
+    wordlist.words = np.array(words)
+    wordlist.scores = np.arange(1, len(words) + 1)
+    wordlist.subclasses = np.zeros(len(words))
+    wordlist.unique_id = unique_id
+    return wordlist
+
+
+class TestEditDistance:
+    """Test cases for the bounded edit distance and the deletes"""
+
+    @pytest.mark.parametrize("a, b, expected", [
+        ("happy", "happy", 0),
+        ("hapy", "happy", 1),
+        ("hpapy", "happy", 1),
+        ("kitten", "sitting", 3),
+    ])
+    def test_edit_distance(self, a, b, expected):
+        """Test insertions, deletions, substitutions and transpositions"""
+        assert edit_distance(a, b, 5) == expected
+
+    def test_limit(self):
+        """Test that distances above the limit are reported as limit + 1"""
+        assert edit_distance("kitten", "sitting", 1) == 2
+        assert edit_distance("a", "abcdef", 2) == 3
+
+    def test_deletes(self):
+        """Test that the deletes include the word and every string with up to distance characters removed"""
+        assert deletes("abc", 1) == {"abc", "bc", "ac", "ab"}
+        assert "a" in deletes("abc", 2)
+
+
+class TestFuzzyMatcher:
+    """Test cases for the symmetric delete fuzzy matcher"""
+
+    @pytest.fixture
+    def matcher(self):
+        return FuzzyMatcher(WORDS, ' ', ' ')
+
+    @pytest.mark.parametrize("sentence, expected", [
+        ("i was embarassed and anxous", {'embarrassed': 1, 'anxious': 1}),
+        ("hapy", {'happy': 1}),
+        ("angyr", {'angry': 1}),
+        ("dissapointed", {'disappointed': 1}),
+        ("feel down", {'feel down': 1}),
+    ])
+    def test_corrects_misspellings(self, matcher, sentence, expected):
+        """Test that tokens within the allowed edit distance of a wordlist word are corrected"""
+        assert dict(matcher.count(sentence)) == expected
+
+    def test_short_and_exact_words(self, matcher):
+        """Test that wordlist words and short tokens are not corrected, and long corrections are bounded"""
+        assert dict(matcher.count("sad mad")) == {'sad': 1, 'mad': 1}
+        assert dict(matcher.count("sed")) == {}
+        assert dict(matcher.count("haaapy")) == {}
+        assert matcher.max_distance("sad") == 0
+        assert matcher.max_distance("happy") == 1
+        assert matcher.max_distance("disappointed") == 2
+        assert matcher.correct("happy" * 10000) is None
+
+    def test_report(self, matcher):
+        """Test that the corrections are cached per token and the applied ones are reported"""
+        matcher.add_applied("embarassed and anxous")
+        matcher.add_applied("so embarassed", times=2)
+        assert matcher.corrections['embarassed'] == ('embarrassed', 1)
+        assert matcher.report() == [
+            {'token': 'embarassed', 'correction': 'embarrassed', 'distance': 1, 'count': 3},
+            {'token': 'anxous', 'correction': 'anxious', 'distance': 1, 'count': 1},
+        ]
+
+    def test_corrections_dropped_with_the_vocabulary(self, matcher):
+        """Test that the corrections are dropped with the vocabulary, except the applied ones"""
+        matcher.max_vocabulary = 2
+        matcher.add_applied("so embarassed")
+        matcher.count("anxous dissapointed")
+        assert set(matcher.corrections) == {'embarassed', 'anxous', 'dissapointed'}
+        matcher.count("angyr")
+        assert set(matcher.corrections) == {'embarassed', 'angyr'}
+        assert [correction['token'] for correction in matcher.report()] == ['embarassed']
+
+    def test_corrected_skips_phrases(self):
+        """Test that a token within a phrase match is not counted as corrected"""
+        matcher = FuzzyMatcher(['feel down', 'downn', 'happy'], ' ', ' ')
+        assert matcher.corrected("i feel down, down") == ['down']
+        assert matcher.corrected("happy") == []
+
+    def test_scoring_module(self):
+        """Test matcher = 'fuzzy' and max_edit_distance"""
+        module = ScoringModule(language='en')
+        module.matcher = 'fuzzy'
+        module.max_edit_distance = 1
+        module.add_wordlist(make_wordlist(WORDS, 'fuzzy-wordlist'))
+        assert isinstance(module.token_matcher, FuzzyMatcher)
+        frequency, matching_words, scores = module.match_words("dissapointed and anxous", module.wordlist)
+        assert list(matching_words) == ['anxious']
+        assert module.match_language() == 'en:fuzzy1'
+
+    def test_report_counts_items(self, sample_wordlist_file, tmp_path):
+        """Test that the corrections are counted once per item, with dedup and with a warm match cache"""
+        def make_survey():
+            survey = Survey()
+            for i in range(3):
+                respondent = Respondent(userid=f"user{i}")
+                respondent.add_item("i was so depresed", "they were joyfull")
+                survey.add_respondent(respondent)
+            survey.add_wordlist(Wordlist(sample_wordlist_file))
+            return survey
+
+        cache = MatchCache(str(tmp_path / "cache"))
+        for dedup in (True, False, True):
+            module = allsum()
+            module.matcher = 'fuzzy'
+            module.match_cache = cache
+            survey = make_survey()
+            survey.score(module, dedup=dedup)
+            assert {correction['token']: correction['count'] for correction in module.token_matcher.report()} == {
+                'depresed': 3, 'joyfull': 3}
+        assert cache.hits > 0
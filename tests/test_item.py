@@ -215,6 +215,44 @@ class TestItem:
         expected_raw_input = f"{self_sentence}. {other_sentence}"
         assert item.raw_input == expected_raw_input
 
+    def test_drop_raw_input(self):
+        """Test that dropping the raw input rebuilds it from the cleaned sentences"""
+        item = Item("I am Happy!", "She is sad.", keep_raw_input=False)
+
+        assert item.raw_input == "i am happy. she is sad"
+        assert item.full_sentence == "i am happy she is sad"
+        assert item.self_sentence == "i am happy"
+
+        item = Item("I am Happy!", "She is sad.")
+        assert item.raw_input == "I am Happy!. She is sad."
+        item.drop_raw_input()
+        assert item.raw_input == "i am happy. she is sad"
+
+    def test_keep_raw_input_class_default(self):
+        """Test that Item.keep_raw_input sets the default for new items"""
+        Item.keep_raw_input = False
+        try:
+            item = Item("I am Happy!", "She is sad.")
+        finally:
+            Item.keep_raw_input = True
+        assert item.raw_input == "i am happy. she is sad"
+
+    def test_cleaned_sentences_are_interned(self):
+        """Test that identical answers share the same cleaned string"""
+        first = Item("".join(["S", "ad!"]), "angry")
+        second = Item("".join(["s", "ad"]), "Angry.")
+
+        assert first.self_sentence is second.self_sentence
+        assert first.other_sentence is second.other_sentence
+
+    def test_slots(self):
+        """Test that items do not carry a per-instance __dict__"""
+        item = Item("I feel happy")
+
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.unknown_attribute = 1
+
     def test_sentence_attributes_are_strings(self):
         """Test that all sentence attributes are strings after initialization"""
         item = Item("I feel happy", "She seems sad")
@@ -246,6 +284,36 @@ class TestItem:
         assert item.scores["mock_module2"] == 3
         assert item.scores["mock_module3"] == 7
 
+    def test_compute_scores_does_not_modify_scores(self):
+        """Test that compute_scores returns the scores without adding them"""
+        item = Item("I feel happy")
+        mock_module = Mock()
+        mock_module.id = "test_module"
+        mock_module.execute = lambda item: (1, 2)
+
+        assert item.compute_scores(mock_module) == {"test_module1": 1, "test_module2": 2}
+        assert item.scores == {}
+
+    def test_score_scoring_module_without_introspection(self, sample_wordlist_file):
+        """Test that ScoringModule instances are dispatched without inspecting execute per item"""
+        from veta.scoring_modules.scoring_module import ScoringModule
+
+        class Pair(ScoringModule):
+            type = "per item"
+            id = "pair"
+            returns_tuple = True
+
+            def execute(self, item, wordlist):
+                return (1, len(item.self_sentence))
+
+        module = Pair()
+        item = Item("I feel happy")
+        item.add_wordlist(Wordlist(sample_wordlist_file))
+        with patch("veta.item.inspect.signature") as signature:
+            item.score(module)
+        signature.assert_not_called()
+        assert item.scores == {"pair1": 1, "pair2": 12}
+
     def test_score_without_wordlist_raises_exception(self):
         """Test that scoring without wordlist raises exception"""
         item = Item("I feel happy", "She seems sad")
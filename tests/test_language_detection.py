@@ -0,0 +1,24 @@
+import pytest
+
+from veta.language_detection import detect_language
+
+
+class TestDetectLanguage:
+    """Test cases for the script and function word language detector"""
+
+    @pytest.mark.parametrize("text, language", [
+        ("I feel happy and a bit sad", 'en'),
+        ("Ich bin froh und ein bisschen traurig", 'de'),
+        ("Ich wäre müde", 'de'),
+        ("אני מרגיש שמח", 'he'),
+        ("أشعر بالسعادة", 'ar'),
+        ("אני מרגיש happy", 'he'),
+    ])
+    def test_detects_language(self, text, language):
+        """Test that the script with the most letters decides first, then the function words and German letters"""
+        assert detect_language(text) == language
+
+    @pytest.mark.parametrize("text", ["", "123 !?", "happy", "ich the"])
+    def test_default_without_evidence(self, text):
+        """Test that texts without letters, function words or with a tie get the default language"""
+        assert detect_language(text, default='he') == 'he'
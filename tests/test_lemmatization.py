@@ -0,0 +1,107 @@
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from veta.lemmatization import Lemmatizer, LemmaMatcher
+from veta.token_matcher import TokenMatcher
+from veta.scoring_modules.scoring_module import ScoringModule
+
+LEMMAS = {'sadder': 'sad', 'saddest': 'sad', 'worries': 'worry', 'worried': 'worry', 'felt': 'feel',
+          'feeling': 'feel', 'feelings': 'feel'}
+
+
+class FakeNLP:
+    """A stand in for a spaCy pipeline looking up the lemmas in LEMMAS and recording the batches"""
+
+    def __init__(self):
+        self.batches = []
+
+    def pipe(self, texts):
+        texts = list(texts)
+        self.batches.append(texts)
+        for text in texts:
+            yield [SimpleNamespace(lemma_=LEMMAS.get(text, text))]
+
+
+def make_wordlist(words, unique_id):
+    wordlist = Mock()
+    wordlist.words = np.array(words)
+    wordlist.scores = np.arange(1, len(words) + 1)
+    wordlist.subclasses = np.zeros(len(words))
+    wordlist.unique_id = unique_id
+    return wordlist
+
+
+class TestLemmatizer:
+    """Test cases for the cached lemmatizer"""
+
+    def test_lemmatizes_each_token_once(self):
+        """Test that each distinct token is lemmatized once, in one batch, and interned as a lemma id"""
+        nlp = FakeNLP()
+        lemmatizer = Lemmatizer('en', nlp)
+        ids = lemmatizer.lemma_ids(['sadder', 'sad', 'sadder', 'worried'])
+        assert ids[0] == ids[1] == ids[2] != ids[3]
+        assert lemmatizer.lemma_ids(['saddest', 'sad']) == [ids[0], ids[0]]
+        assert nlp.batches == [['sadder', 'sad', 'worried'], ['saddest']]
+        assert lemmatizer.lemma('worried') == 'worry'
+
+    def test_bounded(self, monkeypatch):
+        """Test that the lemmatized tokens are dropped past TokenMatcher.max_vocabulary, keeping the lemma ids"""
+        monkeypatch.setattr(TokenMatcher, 'max_vocabulary', 2)
+        lemmatizer = Lemmatizer('en', FakeNLP())
+        sad = lemmatizer.lemma_ids(['sad', 'worried', 'felt'])[0]
+        assert lemmatizer.lemma_ids(['sadder', 'glad']) == [sad, len(lemmatizer.lemmas) - 1]
+        assert set(lemmatizer.ids) == {'sadder', 'glad'}
+
+    def test_unsupported_language(self):
+        """Test that languages without a spaCy model are rejected"""
+        with pytest.raises(ValueError):
+            Lemmatizer('he')
+
+
+class TestLemmaMatcher:
+    """Test cases for the lemma matcher"""
+
+    @pytest.fixture
+    def matcher(self):
+        return LemmaMatcher(['sad', 'sadder', 'worried', 'feel down'], ' ', ' ', Lemmatizer('en', FakeNLP()))
+
+    def test_matches_inflections(self, matcher):
+        """Test that the inflections of a wordlist word match it, reported as the word equal to the lemma"""
+        assert dict(matcher.count("i was saddest")) == {'sad': 1}
+        assert dict(matcher.count("she worries")) == {'worried': 1}
+
+    def test_exact_match_first(self):
+        """Test that a token equal to a wordlist word is reported as that word rather than under its lemma"""
+        matcher = LemmaMatcher(['feel', 'feeling', 'sad'], ' ', ' ', Lemmatizer('en', FakeNLP()))
+        assert dict(matcher.count("feeling feelings felt feel")) == {'feeling': 1, 'feel': 3}
+        matcher = LemmaMatcher(['sad', 'sadder', 'worried'], ' ', ' ', Lemmatizer('en', FakeNLP()))
+        assert dict(matcher.count("i was sadder and saddest")) == {'sadder': 1, 'sad': 1}
+
+    def test_phrases(self, matcher):
+        """Test that phrases are still matched on their surface form"""
+        assert dict(matcher.count("i feel down")) == {'feel down': 1}
+        assert dict(matcher.count("i felt down")) == {}
+
+    def test_batches_new_tokens(self, matcher):
+        """Test that the new tokens of a sentence are lemmatized in a single batch"""
+        nlp = matcher.lemmatizer.nlp
+        nlp.batches.clear()
+        matcher.count("sadder than ever before")
+        assert len(nlp.batches) == 1 and 'before' in nlp.batches[0]
+        matcher.count("sadder than ever")
+        assert len(nlp.batches) == 1
+
+    def test_scoring_module(self, monkeypatch):
+        """Test matcher = 'lemma' and that its matches are cached apart from the surface matches"""
+        monkeypatch.setattr(Lemmatizer, 'lemmatizers', {'en': Lemmatizer('en', FakeNLP())})
+        module = ScoringModule(language='en')
+        module.matcher = 'lemma'
+        module.add_wordlist(make_wordlist(['sad', 'worried'], 'lemma-wordlist'))
+        assert isinstance(module.token_matcher, LemmaMatcher)
+        frequency, matching_words, scores = module.match_words("sadder and worried", module.wordlist)
+        assert list(matching_words) == ['sad', 'worried']
+        assert module.match_language() == 'en:lemma'
+        module.matcher = 'token'
+        assert module.match_language() == 'en'
@@ -6,8 +6,17 @@ import pytest
 import logging
 import tempfile
 import os
+import json
+import multiprocessing
 from pathlib import Path
-from veta.logger import setup_logging, get_logger, VetaLogger
+from veta.logger import (setup_logging, get_logger, VetaLogger, setup_worker_logging, get_log_queue,
+                         get_run_id, shutdown_logging)
+
+
+def log_from_worker(log_queue, run_id):
+    """Logs one record from a worker process."""
+    setup_worker_logging(log_queue, run_id)
+    get_logger('test_worker').info("Worker message", extra={'module_id': 'allsum', 'respondent_id': 7})
 
 class TestVetaLogging:
     """Test cases for the veta logging system."""
@@ -131,6 +140,93 @@ class TestVetaLogging:
             if os.path.exists(log_file):
                 os.unlink(log_file)
 
+    def test_performance_profile_samples_per_item_messages(self, tmp_path):
+        """Test that the performance profile demotes per item messages to DEBUG and samples them."""
+        from veta.item import Item
+
+        log_file = str(tmp_path / "performance.log")
+        try:
+            setup_logging(level='DEBUG', log_file=log_file, console_output=False,
+                          profile='performance', sample_every=3)
+            for i in range(6):
+                Item("item {}".format(i))
+
+            with open(log_file, 'r') as f:
+                lines = [line for line in f if "Created Item" in line]
+            assert len(lines) == 2
+            assert all("DEBUG" in line for line in lines)
+
+            setup_logging(level='INFO', log_file=log_file, console_output=False,
+                          profile='performance', sample_every=3)
+            Item("not logged")
+            with open(log_file, 'r') as f:
+                assert "not logged" not in f.read()
+        finally:
+            setup_logging(auto_generate_file=False, console_output=False)
+
+    def test_default_profile_logs_every_item(self, tmp_path):
+        """Test that the default profile logs every per item message at INFO."""
+        from veta.item import Item
+
+        log_file = str(tmp_path / "default.log")
+        setup_logging(level='INFO', log_file=log_file, console_output=False)
+        for i in range(3):
+            Item("item {}".format(i))
+
+        with open(log_file, 'r') as f:
+            lines = [line for line in f if "Created Item" in line]
+        assert len(lines) == 3
+        assert all("INFO" in line for line in lines)
+
+    def test_unknown_profile(self):
+        """Test that an unknown profile is rejected."""
+        with pytest.raises(ValueError):
+            setup_logging(profile='fast', auto_generate_file=False, console_output=False)
+
+    def test_queue_json_output(self, tmp_path):
+        """Test that queued records are written as JSON lines with the run context."""
+        log_file = str(tmp_path / "queued.jsonl")
+        try:
+            setup_logging(level='DEBUG', log_file=log_file, console_output=False,
+                          use_queue=True, json_format=True, run_id="run-1")
+            assert get_log_queue() is not None
+            logger = get_logger('test_queue')
+            logger.info("Queued %s", "message", extra={'respondent_id': 3})
+            shutdown_logging()
+
+            with open(log_file, 'r') as f:
+                records = [json.loads(line) for line in f]
+            record = [r for r in records if r["message"] == "Queued message"][0]
+            assert record["run_id"] == "run-1"
+            assert record["respondent_id"] == 3
+            assert record["module_id"] is None
+            assert record["logger"] == "veta.test_queue"
+            assert record["level"] == "INFO"
+        finally:
+            setup_logging(auto_generate_file=False, console_output=False)
+
+    def test_worker_process_logging(self, tmp_path):
+        """Test that worker processes log through the queue of the main process."""
+        log_file = str(tmp_path / "workers.jsonl")
+        try:
+            setup_logging(level='DEBUG', log_file=log_file, console_output=False,
+                          multiprocess=True, json_format=True)
+            worker = multiprocessing.Process(target=log_from_worker, args=(get_log_queue(), get_run_id()))
+            worker.start()
+            worker.join(30)
+            assert worker.exitcode == 0
+            shutdown_logging()
+
+            with open(log_file, 'r') as f:
+                records = [json.loads(line) for line in f]
+            record = [r for r in records if r["message"] == "Worker message"][0]
+            assert record["run_id"] == get_run_id()
+            assert record["module_id"] == "allsum"
+            assert record["respondent_id"] == 7
+            assert record["process"] != os.getpid()
+        finally:
+            setup_logging(auto_generate_file=False, console_output=False)
+
 def test_integration_with_veta_components():
     """Test that veta components can use the logging system."""
     from veta.respondent import Respondent
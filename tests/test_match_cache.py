@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+
+from veta.match_cache import MatchCache
+from veta.wordlist import Wordlist
+from veta.scoring_modules.scoring_module import ScoringModule
+
+
+class TestMatchCache:
+    """Test cases for the persistent match cache"""
+
+    def test_get_put_and_counters(self, tmp_path):
+        """Test that a stored sentence is a hit and an unknown one a miss"""
+        cache = MatchCache(str(tmp_path))
+
+        assert cache.get("i feel happy", "wl", "en") is None
+        cache.put("i feel happy", "wl", "en", {"happy": 1})
+
+        assert cache.get("i feel happy", "wl", "en") == {"happy": 1}
+        assert cache.get("i feel happy", "other wl", "en") is None
+        assert cache.get("i feel happy", "wl", "he") is None
+        assert cache.stats() == {"hits": 1, "misses": 3, "hit_rate": 0.25, "entries": 1}
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that entries survive closing and reopening the cache"""
+        with MatchCache(str(tmp_path)) as cache:
+            cache.put("sad and angry", "wl", "en", {"sad": 1, "angry": 2})
+
+        with MatchCache(str(tmp_path)) as cache:
+            assert cache.stats()["entries"] == 1
+            assert list(cache.get("sad and angry", "wl", "en").items()) == [("sad", 1), ("angry", 2)]
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entries are evicted first"""
+        cache = MatchCache(str(tmp_path), max_entries=3)
+        for sentence in ["a", "b", "c"]:
+            cache.put(sentence, "wl", "en", {})
+        cache.get("a", "wl", "en")
+        cache.put("d", "wl", "en", {})
+
+        assert cache.stats()["entries"] <= 3
+        assert cache.get("a", "wl", "en") == {}
+        assert cache.get("d", "wl", "en") == {}
+        assert cache.get("b", "wl", "en") is None
+        cache.close()
+
+    def test_clear(self, tmp_path):
+        """Test that clear removes every entry"""
+        cache = MatchCache(str(tmp_path))
+        cache.put("a", "wl", "en", {"x": 1})
+        cache.clear()
+
+        assert cache.stats()["entries"] == 0
+        assert cache.get("a", "wl", "en") is None
+        cache.close()
+
+
+class TestMatchWordsWithCache:
+    """Test cases for match_words consulting the match cache"""
+
+    def test_cached_results_match_uncached(self, tmp_path, sample_wordlist_file):
+        """Test that match_words returns the same arrays from the cache"""
+        wordlist = Wordlist(sample_wordlist_file)
+        sentences = ["i feel happy and sad", "angry angry joyful", "nothing here", ""]
+        expected = [ScoringModule().match_words(sentence, wordlist, sublevels=True) for sentence in sentences]
+
+        cache = MatchCache(str(tmp_path))
+        for run in range(2):
+            module = ScoringModule()
+            module.match_cache = cache
+            for sentence, reference in zip(sentences, expected):
+                result = module.match_words(sentence, wordlist, sublevels=True)
+                for array, reference_array in zip(result, reference):
+                    np.testing.assert_array_equal(array, reference_array)
+                    assert array.dtype == reference_array.dtype
+
+        assert cache.stats()["hits"] == len(sentences)
+        assert cache.stats()["misses"] == len(sentences)
+        cache.close()
+
+    def test_fingerprint_is_stable(self, sample_wordlist_file):
+        """Test that the fingerprint depends on the words only"""
+        first = Wordlist(sample_wordlist_file)
+        second = Wordlist(sample_wordlist_file)
+
+        assert first.unique_id != second.unique_id
+        assert first.fingerprint() == second.fingerprint()
+        second.addWord("calm", 2.0)
+        assert first.fingerprint() != second.fingerprint()
@@ -0,0 +1,70 @@
+import random
+import pytest
+
+from veta.normalization import Normalizer
+from veta.item import Item
+
+
+def legacy_clean_sentence(sentence):
+    """The original per character implementation of Item.clean_sentence"""
+    sentence = str(sentence).lower()
+    for c in sentence:
+        if c in "_–,-,.?!;:/()$\n\r\t":
+            sentence = sentence.replace(c,' ')
+    sentence = sentence.replace("  ",' ').strip()
+    return sentence
+
+
+class TestNormalizer:
+    """Test cases for the Normalizer class"""
+
+    def test_default_matches_legacy_cleaning(self):
+        """Test the default pipeline is byte compatible with the original cleaning"""
+        normalizer = Normalizer()
+        rng = random.Random(0)
+        alphabet = "aB _–,-.?!;:/()$\n\r\t\x0b\xa0İßÄשָׁلَ"
+        for _ in range(5000):
+            sentence = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+            assert normalizer.normalize(sentence) == legacy_clean_sentence(sentence)
+        for value in [None, 123, 4.5, "I feel   happy!!  ", ""]:
+            assert normalizer.normalize(value) == legacy_clean_sentence(value)
+
+    def test_collapse_whitespace(self):
+        """Test every run of spaces becomes a single space"""
+        assert Normalizer().normalize("happy ,, sad") == "happy  sad"
+        assert Normalizer(collapse_whitespace=True).normalize("happy ,, sad") == "happy sad"
+
+    def test_casefold_and_nfkc(self):
+        """Test the casefold and NFKC options"""
+        assert Normalizer().normalize("Straße") == "straße"
+        assert Normalizer(casefold=True).normalize("Straße") == "strasse"
+        assert Normalizer(nfkc=True).normalize("ＨＡＰＰＹ ﬁne") == "happy fine"
+
+    def test_hebrew_diacritics(self):
+        """Test niqqud is removed in Hebrew mode while the maqaf is kept"""
+        normalizer = Normalizer('he', strip_diacritics=True)
+        assert normalizer.normalize("שָׂמֵחַ") == "שמח"
+        assert normalizer.normalize("בית־ספר") == "בית־ספר"
+        assert Normalizer('he').normalize("שָׂמֵחַ") == "שָׂמֵחַ"
+
+    def test_arabic_diacritics(self):
+        """Test harakat and tatweel are removed in Arabic mode"""
+        normalizer = Normalizer('ar', strip_diacritics=True)
+        assert normalizer.normalize("سَعِيدٌ") == "سعيد"
+        assert normalizer.normalize("سعـــيد") == "سعيد"
+
+    def test_german_diacritics(self):
+        """Test decomposed umlauts are composed in German mode"""
+        decomposed = "glücklich"
+        assert Normalizer('de', strip_diacritics=True).normalize(decomposed) == "glücklich"
+        assert Normalizer('de').normalize(decomposed) == decomposed
+
+    def test_item_uses_class_normalizer(self):
+        """Test Item.clean_sentence uses Item.normalizer"""
+        default = Item.normalizer
+        Item.normalizer = Normalizer('he', strip_diacritics=True)
+        try:
+            item = Item("אני שָׂמֵחַ.")
+        finally:
+            Item.normalizer = default
+        assert item.self_sentence == "אני שמח"
@@ -162,7 +162,7 @@ class TestRespondent:
         respondent.add_item("I feel happy", "She seems sad")
         
         # Mock the method to avoid issues with empty scores
-        with patch.object(respondent, 'to_array', return_value=np.array([[]])):
+        with patch.object(Respondent, 'to_array', return_value=np.array([[]])):
             array = respondent.to_array()
             assert isinstance(array, np.ndarray)
 
@@ -357,3 +357,11 @@ class TestRespondent:
         # Check that totals were computed
         assert "test_module" in respondent.totals
         assert respondent.totals["test_module"] == 8  # 5 + 3
+
+    def test_slots(self):
+        """Test that respondents do not carry a per-instance __dict__"""
+        respondent = Respondent()
+
+        assert not hasattr(respondent, "__dict__")
+        with pytest.raises(AttributeError):
+            respondent.unknown_attribute = 1
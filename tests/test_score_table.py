@@ -0,0 +1,255 @@
+import pytest
+import numpy as np
+
+from veta.score_table import ScoreTable, ItemScores, RespondentTotals
+from veta.survey import Survey
+from veta.respondent import Respondent
+from veta.item import Item
+from veta.wordlist import Wordlist
+from veta.scoring_modules.allsum import allsum
+from veta.scoring_modules.count import count
+from veta.scoring_modules.vocab import vocab
+
+
+def make_respondents(item_scores):
+    respondents = []
+    for scores in item_scores:
+        respondent = Respondent()
+        for item_score in scores:
+            item = respondent.add_item("I feel happy", "She seems sad")
+            for key, value in item_score.items():
+                item.add_additional_info(key, value)
+        respondents.append(respondent)
+    return respondents
+
+
+class TestScoreTable:
+    """Test cases for the columnar ScoreTable"""
+
+    def test_offsets(self):
+        """Test respondent offsets are the running item counts"""
+        table = ScoreTable([2, 0, 3])
+
+        assert list(table.offsets) == [0, 2, 2, 5]
+        assert table.num_items == 5
+
+    def test_from_respondents_copies_scores_into_views(self):
+        """Test building a table keeps every existing score"""
+        respondents = make_respondents([[{"a": 1}, {"a": 2}], [{"a": 3}]])
+
+        table = ScoreTable.from_respondents(respondents)
+
+        assert isinstance(respondents[0].items[0].scores, ItemScores)
+        assert isinstance(respondents[1].totals, RespondentTotals)
+        assert list(table.columns["a"]) == [1, 2, 3]
+        assert list(table.columns["index"]) == [1, 2, 1]
+        assert respondents[0].items[1].scores["a"] == 2
+        assert dict(respondents[1].items[0].scores) == {"index": 1, "a": 3}
+
+    def test_column_types_widen(self):
+        """Test columns keep the type of their values and widen when needed"""
+        table = ScoreTable([3])
+
+        table.set("flag", 0, True)
+        assert table.columns["flag"].dtype == np.bool_
+        assert table.get("flag", 0) is True
+
+        table.set("flag", 1, 2)
+        assert table.columns["flag"].dtype == np.int64
+        table.set("flag", 2, 0.5)
+        assert table.columns["flag"].dtype == np.float64
+        assert table.get("flag", 1) == 2
+
+        table.set("label", 0, "text")
+        assert table.get("label", 0) == "text"
+
+    def test_missing_values_raise_key_error(self):
+        """Test reading an id the item does not have"""
+        table = ScoreTable([2])
+        table.set("a", 0, 1)
+        view = ItemScores(table, 1)
+
+        assert "a" not in view
+        with pytest.raises(KeyError):
+            view["a"]
+        with pytest.raises(KeyError):
+            view["b"]
+
+    def test_item_scores_view_operations(self):
+        """Test the item view behaves like a dictionary"""
+        table = ScoreTable([1])
+        view = ItemScores(table, 0)
+
+        view["a"] = 1
+        view["b"] = 2.5
+        assert len(view) == 2
+        assert list(view) == ["a", "b"]
+        assert view == {"a": 1, "b": 2.5}
+
+        del view["a"]
+        assert "a" not in view
+        assert len(view) == 1
+
+    def test_totals_with_empty_respondents(self):
+        """Test reduceat totals handle respondents without items"""
+        table = ScoreTable([2, 0, 1])
+        for row, value in enumerate([1, 2, 5]):
+            table.set("a", row, value)
+            table.set("flag", row, value > 1)
+
+        assert list(table.totals("a")) == [3, 0, 5]
+        assert list(table.totals("flag")) == [1, 0, 1]
+
+    def test_float_totals_added_in_order(self):
+        """Test float totals are bit identical to adding the item scores one by one, as Respondent.compute_totals does"""
+        values = [np.exp(0.5 * (i % 7)) - 1 for i in range(40)]
+        table = ScoreTable([25, 0, 15])
+        for row, value in enumerate(values):
+            table.set("exp", row, value)
+
+        expected = []
+        for scores in (values[:25], [], values[25:]):
+            total = 0
+            for value in scores:
+                total += value
+            expected.append(total)
+        assert list(table.totals("exp")) == expected
+
+    def test_totals_updated_after_set(self):
+        """Test totals are recomputed once a value changes"""
+        table = ScoreTable([2])
+        table.set("a", 0, 1)
+        table.set("a", 1, 1)
+        assert table.totals("a")[0] == 2
+
+        table.set("a", 1, 4)
+        assert table.totals("a")[0] == 5
+
+    def test_cached_totals_updated_by_difference(self):
+        """Test that setting a value updates the cached total of its respondent only, and widening recomputes"""
+        table = ScoreTable([2, 0, 2])
+        for row, value in enumerate([1, 2, 3, 4]):
+            table.set("a", row, value)
+        totals = table.totals("a")
+
+        table.set("a", 2, 10)
+        assert table.totals("a") is totals
+        assert list(totals) == [3, 0, 14]
+
+        table.set("a", 0, 0.5)
+        assert list(table.totals("a")) == [2.5, 0, 14]
+
+    def test_respondent_totals_keep_added_values(self):
+        """Test values added to the totals are kept unless the item total is not zero"""
+        respondents = make_respondents([[{"module": 0}, {"module": 0}], [{"module": 1}]])
+        respondents[0].add_additional_info("module", 7)
+        respondents[0].add_additional_info("age", 30)
+        respondents[1].add_additional_info("module", 7)
+
+        ScoreTable.from_respondents(respondents)
+
+        assert respondents[0].totals["module"] == 7
+        assert respondents[0].totals["age"] == 30
+        assert respondents[1].totals["module"] == 1
+        assert set(respondents[0].totals) == {"module", "age", "index"}
+
+    def test_matches_and_detach(self):
+        """Test adding an item detaches the respondent from the table"""
+        respondents = make_respondents([[{"a": 1}], [{"a": 2}]])
+        table = ScoreTable.from_respondents(respondents)
+        assert table.matches(respondents)
+
+        respondents[0].add_item("I am sad", "")
+
+        assert not table.matches(respondents)
+        assert isinstance(respondents[0].totals, dict)
+        assert respondents[0].items[0].scores == {"index": 1, "a": 1}
+        assert respondents[0].totals["a"] == 1
+
+
+class TestSurveyScoreTable:
+    """Test cases for the survey's use of the score table"""
+
+    def build_survey(self, wordlist_file):
+        survey = Survey()
+        survey.add_wordlist(Wordlist(wordlist_file))
+        sentences = [
+            [("I feel happy", "She seems sad"), ("I am angry", "He is joyful")],
+            [],
+            [("I feel depressed", ""), ("", "She is happy and sad"), ("I feel nothing", "nothing")],
+        ]
+        for respondent_sentences in sentences:
+            respondent = Respondent()
+            survey.add_respondent(respondent)
+            for self_sentence, other_sentence in respondent_sentences:
+                respondent.add_item(self_sentence, other_sentence)
+        return survey
+
+    def test_score_uses_table(self, sample_wordlist_file):
+        """Test scoring stores the item scores in the score table"""
+        survey = self.build_survey(sample_wordlist_file)
+        survey.score(allsum(), count(binary=True), vocab())
+
+        table = survey.score_table
+        assert table.matches(survey.respondents)
+        assert table.columns["allsum"].dtype == np.int64
+        assert survey.respondents[0].totals["allsum"] == 12
+        assert survey.respondents[1].totals == {"vocab": 0}
+        assert survey.respondents[2].totals["vocab"] == 9
+
+    def test_summary_matches_dictionary_scores(self, sample_wordlist_file):
+        """Test the table summary equals the summary of detached respondents"""
+        survey = self.build_survey(sample_wordlist_file)
+        survey.score(allsum(), count(binary=True), vocab())
+        survey.compute_summary()
+        summary = survey.summary
+
+        expected = Survey()
+        for respondent in survey.respondents:
+            respondent.detach_scores()
+            expected.respondents.append(respondent)
+        expected.compute_summary()
+
+        assert set(summary) == set(expected.summary)
+        for key in summary:
+            assert np.allclose(summary[key], expected.summary[key])
+
+    def test_to_array_matches_dictionary_scores(self, sample_wordlist_file):
+        """Test to_array gives the same rows from the table as from the item dictionaries"""
+        survey = self.build_survey(sample_wordlist_file)
+        survey.score(allsum(), count(mode='self'), vocab())
+
+        from_table = [respondent.to_array() for respondent in survey.respondents]
+        for respondent in survey.respondents:
+            respondent.detach_scores()
+        from_dicts = [respondent.to_array() for respondent in survey.respondents]
+
+        for table_array, dict_array in zip(from_table, from_dicts):
+            assert np.array_equal(table_array, dict_array)
+
+    def test_table_rebuilt_after_new_respondent(self, sample_wordlist_file):
+        """Test scoring again after adding a respondent rebuilds the table"""
+        survey = self.build_survey(sample_wordlist_file)
+        survey.score(allsum())
+        first_table = survey.score_table
+
+        respondent = Respondent()
+        survey.add_respondent(respondent)
+        respondent.add_item("I feel happy", "")
+        survey.score(allsum())
+
+        assert survey.score_table is not first_table
+        assert survey.score_table.num_items == 6
+        assert survey.respondents[0].totals["allsum"] == 12
+        assert respondent.totals["allsum"] == 4
+
+    def test_to_json_with_table(self, sample_wordlist_file):
+        """Test the views are written out as plain dictionaries"""
+        survey = self.build_survey(sample_wordlist_file)
+        survey.score(allsum())
+
+        data = survey.to_json()
+
+        assert isinstance(data[0]['totals'], dict)
+        assert isinstance(data[0]['items'][0]['scores'], dict)
+        assert data[0]['items'][0]['scores']['allsum'] == 6
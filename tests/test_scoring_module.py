@@ -1,3 +1,4 @@
+import os
 import pytest
 import numpy as np
 from unittest.mock import Mock, patch, MagicMock
@@ -6,6 +7,8 @@ from veta.scoring_modules.scoring_module import ScoringModule
 from veta.item import Item
 from veta.wordlist import Wordlist
 
+EXAMPLE_WORDLIST = os.path.join(os.path.dirname(__file__), '..', 'examples', 'wordlist.xlsx')
+
 
 class TestScoringModule:
     """Test cases for the ScoringModule base class"""
@@ -175,6 +178,53 @@ class TestScoringModule:
         assert test_module.id == "test_scoring"
         assert test_module.execute(None, None) == 42
 
+    def test_bind_infers_calling_convention(self):
+        """Test that needs_wordlist is inferred once from the execute signature"""
+
+        class ItemOnly(ScoringModule):
+            type = "per item"
+            id = "item_only"
+
+            def execute(self, item):
+                return 1
+
+        class WithWordlist(ScoringModule):
+            type = "per item"
+            id = "with_wordlist"
+
+            def execute(self, item, wordlist):
+                return 2
+
+        assert ItemOnly().needs_wordlist is False
+        assert ItemOnly().scorer("item", None) == 1
+        assert WithWordlist().needs_wordlist is True
+        assert WithWordlist().scorer("item", "wordlist") == 2
+
+    def test_bind_rejects_mismatched_declaration(self):
+        """Test that a declared convention must match the execute signature"""
+
+        class Mismatched(ScoringModule):
+            type = "per item"
+            id = "mismatched"
+            needs_wordlist = True
+
+            def execute(self, item):
+                return 1
+
+        with pytest.raises(TypeError):
+            Mismatched()
+
+    def test_tuple_ids_follow_module_id(self):
+        """Test tuple column ids are computed once per id and length"""
+        module = ScoringModule()
+        module.id = "tuple"
+
+        ids = module.tuple_ids(3)
+        assert ids == ["tuple1", "tuple2", "tuple3"]
+        assert module.tuple_ids(3) is ids
+        module.id = "renamed"
+        assert module.tuple_ids(2) == ["renamed1", "renamed2"]
+
     def test_word_boundary_detection(self):
         """Test word boundary detection in is_full_word"""
         module = ScoringModule()
@@ -278,6 +328,56 @@ class TestScoringModule:
             # If language parameter is not supported, that's okay
             pass
 
+    def test_for_language(self, sample_wordlist_file):
+        """Test that the language variant of a module is created once and shares its default language helper modules"""
+        from veta.scoring_modules.exp import exp
+
+        module = exp(0.5)
+        module.matcher = 'regex'
+        assert module.for_language('en') is module
+        assert module.for_language(None) is module
+
+        variant = module.for_language('he')
+        assert module.for_language('he') is variant
+        assert variant.language == 'he' and variant.base is module.base and variant.base.language == 'en'
+        assert variant.matcher == 'regex' and variant.b == 0.5
+        assert 'ל' in variant.acceptable_prev_chars
+        assert module.language == 'en' and module.base.language == 'en'
+
+        module.id = "exp-renamed"
+        assert module.for_language('he').id == "exp-renamed"
+        item = Item("happy")
+        item.add_wordlist(Wordlist(sample_wordlist_file))
+        assert variant.scorer(item, item.wordlist) == module.scorer(item, item.wordlist)
+
+    @pytest.mark.parametrize("name", ["exp", "powerlaw", "highestN_allinone"])
+    def test_helpers_follow_the_module_configuration(self, sample_wordlist_file, name):
+        """Test that the helper module matches as configured on its module, directly and through for_language"""
+        from veta.scoring_modules.exp import exp
+        from veta.scoring_modules.powerlaw import powerlaw
+        from veta.scoring_modules.highestN_allinone import highestN_allinone
+        factory = {"exp": lambda **kwargs: exp(0.5, **kwargs), "powerlaw": lambda **kwargs: powerlaw(2, **kwargs),
+                   "highestN_allinone": lambda **kwargs: highestN_allinone(3, **kwargs)}[name]
+        wordlist = Wordlist(sample_wordlist_file)
+
+        def score(module, *sentences):
+            items = [Item(sentence) for sentence in sentences]
+            return module.scorer(items[0] if module.type == "per item" else items, wordlist)
+
+        module = factory()
+        module.matcher = 'regex'
+        module.max_sentence_length = 10
+        module.long_sentence_policy = 'truncate'
+        score(module, "happy and then sad")
+        assert module.base.matcher == 'regex' and module.base.token_matcher is None
+        assert module.base.max_sentence_length == 10 and module.base.long_sentence_policy == 'truncate'
+
+        # The helper keeps matching in the default language, in a Hebrew module and a Hebrew variant alike
+        hebrew, variant = factory(language='he'), factory().for_language('he')
+        assert hebrew.base.language == variant.base.language == 'en'
+        assert score(hebrew, "\u05d5happy") == score(variant, "\u05d5happy") == score(factory(), "\u05d5happy")
+        assert score(hebrew, "\u05d5happy") != score(hebrew, "happy")
+
     def test_multiple_word_matching(self, sample_wordlist_file):
         """Test matching multiple words from wordlist"""
         module = ScoringModule()
@@ -294,3 +394,182 @@ class TestScoringModule:
         
         # At least some of the expected words should be found
         assert len(found_words.intersection(expected_words)) > 0
+
+    def test_match_item_matches_each_sentence_once(self, sample_wordlist_file):
+        """Test that all modes and modules share one self/other matching pass per item"""
+        from veta.scoring_modules._334 import _334
+        from veta.scoring_modules.allsum import allsum
+
+        wordlist = Wordlist(sample_wordlist_file)
+        item = Item("I feel happy and sad", "She seems sad")
+        modules = [_334(mode='self'), _334(mode='other'), _334(), allsum()]
+
+        calls = []
+        original = ScoringModule.match_words
+
+        def counting_match_words(module, sentence, wordlist, sublevels=False):
+            calls.append(sentence)
+            return original(module, sentence, wordlist, sublevels=sublevels)
+
+        with patch.object(ScoringModule, 'match_words', counting_match_words):
+            for module in modules:
+                module.execute(item, wordlist)
+
+        assert sorted(calls) == sorted([item.self_sentence, item.other_sentence])
+
+    def test_match_item_both_equals_joined_sentence(self, sample_wordlist_file):
+        """Test that the merged self/other result equals matching the joined sentence"""
+        module = ScoringModule()
+        wordlist = Wordlist(sample_wordlist_file)
+        items = [
+            Item("I feel happy and sad", "She seems sad and happy"),
+            Item("", "She is angry"),
+            Item("I am joyful", ""),
+            Item("nothing here", "nor here"),
+        ]
+
+        for item in items:
+            joined = module.match_words(item.self_sentence + ' ' + item.other_sentence, wordlist, sublevels=True)
+            merged = module.match_item(item, wordlist, 'both', sublevels=True)
+            assert dict(zip(merged[1], merged[0])) == dict(zip(joined[1], joined[0]))
+            assert list(merged[1]) == list(joined[1])
+
+    def test_match_item_phrase_spanning_boundary(self):
+        """Test that a phrase split between the self and other sentences is matched explicitly"""
+        module = ScoringModule()
+
+        mock_wordlist = Mock()
+        mock_wordlist.words = np.array(['feel down', 'down', 'sad'])
+        mock_wordlist.scores = np.array([3, 1, 2])
+        mock_wordlist.subclasses = np.array([0, 0, 0])
+        mock_wordlist.unique_id = 'boundary-test-wordlist'
+
+        item = Item("I feel", "down and sad")
+
+        frequency, matching_words, scores = module.match_item(item, mock_wordlist, 'both')
+        assert module.spans_boundary(item.self_sentence, item.other_sentence)
+        assert list(matching_words) == ['feel down', 'sad']
+
+        frequency, matching_words, scores = module.match_item(item, mock_wordlist, 'other')
+        assert list(matching_words) == ['down', 'sad']
+
+    def test_match_item_irregular_words_at_boundary(self):
+        """Test that a word ending with a space (the example wordlist's 'glücklich ') still matches across the
+        self/other boundary, as when the joined sentence was matched"""
+        from veta.scoring_modules.allsum import allsum
+        from veta.scoring_modules.highestN_allinone import highestN_allinone
+        wordlist = Wordlist(EXAMPLE_WORDLIST)
+        assert 'glücklich ' in [str(word) for word in wordlist.words]
+        module = ScoringModule()
+        items = [
+            Item('glücklich ', 'the would'),
+            Item('ich bin glücklich', 'und traurig'),
+            Item('glücklich', ''),
+            Item('', 'glücklich x'),
+            Item('sehr glücklich und glücklich', 'wut'),
+        ]
+
+        for item in items:
+            joined = module.match_words(item.self_sentence + ' ' + item.other_sentence, wordlist, sublevels=True)
+            merged = module.match_item(item, wordlist, 'both', sublevels=True)
+            assert dict(zip(merged[1], merged[0])) == dict(zip(joined[1], joined[0]))
+        assert allsum().execute(Item('glücklich ', 'the would'), wordlist) == 3
+
+        # Across two items of a respondent
+        assert highestN_allinone(3).execute([Item('glücklich', ''), Item('the would', '')], wordlist) == 3
+
+    def test_match_item_recomputes_changed_sentences(self, sample_wordlist_file):
+        """Test that stored matches are not reused once the item's sentences change"""
+        module = ScoringModule()
+        wordlist = Wordlist(sample_wordlist_file)
+        item = Item("I feel happy", "She seems sad")
+
+        frequency, matching_words, scores = module.match_item(item, wordlist, 'self')
+        assert list(matching_words) == ['happy']
+
+        item.self_sentence = item.clean_sentence("I feel angry")
+        frequency, matching_words, scores = module.match_item(item, wordlist, 'self')
+        assert list(matching_words) == ['angry']
+
+
+class TestLongSentencePolicy:
+    """Test cases for the handling of sentences longer than max_sentence_length"""
+
+    @pytest.fixture
+    def phrase_wordlist(self):
+        wordlist = Mock()
+        wordlist.words = np.array(['feel down', 'down', 'sad', 'happy'])
+        wordlist.scores = np.array([3, 1, 2, 4])
+        wordlist.subclasses = np.array([0, 0, 0, 0])
+        wordlist.unique_id = 'long-sentence-wordlist'
+        return wordlist
+
+    def long_sentence(self):
+        words = ['i', 'feel', 'down', 'sad', 'happy', 'and', 'then', 'really']
+        rng = np.random.default_rng(0)
+        return ' '.join(words[i] for i in rng.integers(0, len(words), 3000))
+
+    def test_split_matches_whole_sentence(self, phrase_wordlist):
+        """Test that matching in windows finds the same words, including phrases near the cuts"""
+        sentence = self.long_sentence()
+        expected = ScoringModule().match_words(sentence, phrase_wordlist)
+
+        module = ScoringModule()
+        module.max_sentence_length = 50
+        module.long_sentence_policy = 'split'
+        result = module.match_words(sentence, phrase_wordlist)
+
+        assert dict(zip(result[1], result[0])) == dict(zip(expected[1], expected[0]))
+        assert module.long_sentences == 1
+
+    def test_windows_are_cut_outside_phrases(self, phrase_wordlist):
+        """Test that no window ends inside a phrase and that text without spaces is cut at the limit"""
+        module = ScoringModule()
+        module.add_wordlist(phrase_wordlist)
+
+        windows = list(module.sentence_windows("sad i feel down sad", 12))
+        assert windows == ["sad i", "feel down", "sad"]
+        assert list(module.sentence_windows("x" * 25, 10)) == ["x" * 10, "x" * 10, "x" * 5]
+
+    def test_truncate_and_flag(self, phrase_wordlist):
+        """Test that truncate only matches the first window and flag matches everything"""
+        sentence = "happy " * 10 + "sad " * 10
+        module = ScoringModule()
+        module.max_sentence_length = 30
+
+        module.long_sentence_policy = 'truncate'
+        frequency, matching_words, scores = module.match_words(sentence, phrase_wordlist)
+        assert list(matching_words) == ['happy'] and frequency[0] == 5
+
+        module.long_sentence_policy = 'flag'
+        frequency, matching_words, scores = module.match_words(sentence, phrase_wordlist)
+        assert list(frequency) == [10, 10]
+        assert module.long_sentences == 2
+
+        module.long_sentence_policy = 'drop'
+        with pytest.raises(ValueError):
+            module.match_words(sentence, phrase_wordlist)
+
+    def test_item_matches_not_shared_across_limits(self, phrase_wordlist):
+        """Test that the matches a truncating module stores on an item are not reused by a module without a limit,
+        whatever the order of the modules"""
+        from veta.scoring_modules.allsum import allsum
+        sentence = "happy " * 10 + "sad " * 10
+        truncating = allsum()
+        truncating.max_sentence_length = 30
+        truncating.long_sentence_policy = 'truncate'
+
+        for modules in ([truncating, allsum()], [allsum(), truncating]):
+            item = Item(sentence, "")
+            scores = {module.max_sentence_length: module.execute(item, phrase_wordlist) for module in modules}
+            assert scores == {30: 20, None: 60}
+            assert len(item.matches) == 2
+
+    def test_short_sentences_are_unaffected(self, phrase_wordlist):
+        """Test that sentences within the limit are matched as usual"""
+        module = ScoringModule()
+        module.max_sentence_length = 100
+        frequency, matching_words, scores = module.match_words("i feel down and sad", phrase_wordlist)
+
+        assert list(matching_words) == ['feel down', 'sad']
+        assert module.long_sentences == 0
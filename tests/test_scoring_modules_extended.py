@@ -59,6 +59,43 @@ class TestVocabScoringModule:
         except ImportError:
             pytest.skip("vocab module not available")
 
+    def test_vocab_counts_unique_words_across_items(self, sample_wordlist_file):
+        """Test vocab counts each distinct word once across all items"""
+        wordlist = Wordlist(sample_wordlist_file)
+        items = [Item("I feel happy", "She seems sad"), Item("I feel sad", "She feels happy")]
+
+        assert vocab().execute(items, wordlist) == 7
+        assert vocab(mode='self').execute(items, wordlist) == 4
+        assert vocab(mode='other').execute(items, wordlist) == 5
+
+
+class TestHighestNAllinoneScoringModule:
+    """Test cases for the highestN-allinone scoring module"""
+
+    def test_matches_concatenated_highestN(self, sample_wordlist_file):
+        """Test merging per item matches gives the same score as scoring the concatenated items"""
+        from veta.scoring_modules.highestN import highestN
+        from veta.scoring_modules.highestN_allinone import highestN_allinone
+
+        wordlist = Wordlist(sample_wordlist_file)
+        items = [
+            Item("I feel happy and joyful", "She seems sad"),
+            Item("I am angry", "He is depressed and sad"),
+            Item("I feel happy", ""),
+        ]
+        combined = Item(" ".join(item.self_sentence + ' ' + item.other_sentence for item in items), "")
+
+        for N in [1, 2, 3, 5, 10]:
+            expected = highestN(N).execute(combined, wordlist)
+            assert highestN_allinone(N).execute(items, wordlist) == expected
+
+    def test_no_items(self, sample_wordlist_file):
+        """Test a respondent without items scores zero"""
+        from veta.scoring_modules.highestN_allinone import highestN_allinone
+
+        wordlist = Wordlist(sample_wordlist_file)
+        assert highestN_allinone(3).execute([], wordlist) == 0
+
 
 class TestScoringModulesGeneral:
     """General tests for scoring modules that may exist"""
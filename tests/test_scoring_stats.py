@@ -0,0 +1,105 @@
+import json
+import pytest
+
+from veta.survey import Survey
+from veta.respondent import Respondent
+from veta.wordlist import Wordlist
+from veta.match_cache import MatchCache
+from veta.scoring_stats import ScoringStats, ModuleStats
+from veta.scoring_modules.allsum import allsum
+from veta.scoring_modules.count import count
+from veta.scoring_modules.exp import exp
+from veta.scoring_modules.highestN_allinone import highestN_allinone
+
+
+def make_survey(wordlist_file):
+    survey = Survey()
+    survey.add_wordlist(Wordlist(wordlist_file))
+    for i in range(3):
+        respondent = Respondent(userid="user{}".format(i))
+        respondent.add_item("I feel happy", "They feel sad")
+        respondent.add_item("angry", "")
+        respondent.add_item("joyful {}".format(i), "depressed")
+        survey.add_respondent(respondent)
+    return survey
+
+
+class TestScoringStats:
+    """Test cases for the scoring statistics collected by Survey.score"""
+
+    def test_stats_not_collected_by_default(self, sample_wordlist_file):
+        """Test that scoring without collect_stats leaves the modules uninstrumented"""
+        survey = make_survey(sample_wordlist_file)
+        module = allsum()
+        survey.score(module)
+
+        assert survey.scoring_stats is None
+        assert module.stats is None
+
+    def test_per_module_statistics(self, sample_wordlist_file):
+        """Test the counts recorded for per item and per respondent modules"""
+        survey = make_survey(sample_wordlist_file)
+        modules = [allsum(), count(), exp(0.5), highestN_allinone(2)]
+        survey.score(*modules, collect_stats=True, dedup=True)
+
+        stats = survey.scoring_stats
+        assert isinstance(stats, ScoringStats)
+        assert stats.items == 9
+        assert stats.unique_items == 5
+        assert list(stats.modules) == ["allsum", "count-both", "exp", "highest2-allinone"]
+
+        allsum_stats = stats.modules["allsum"]
+        assert allsum_stats.calls == 5
+        assert allsum_stats.items == 9
+        assert allsum_stats.match_calls == 10
+        assert allsum_stats.item_cache_misses == 5
+        assert allsum_stats.wall_time >= allsum_stats.matcher_time > 0
+
+        # count reuses the matches of allsum
+        assert stats.modules["count-both"].item_cache_hits == 5
+        assert stats.modules["count-both"].match_calls == 0
+        # exp matches through its 3345 helper module
+        assert stats.modules["exp"].item_cache_hits > 0
+        assert stats.modules["highest2-allinone"].calls == 3
+        for module in modules:
+            assert module.stats is None
+
+    def test_match_cache_hit_rates(self, sample_wordlist_file, tmp_path):
+        """Test that persistent cache lookups are reported per module"""
+        module = allsum()
+        module.match_cache = MatchCache(str(tmp_path / "cache"))
+        for run in range(2):
+            survey = make_survey(sample_wordlist_file)
+            survey.score(module, collect_stats=True, dedup=True)
+        module.match_cache.close()
+
+        report = survey.scoring_stats.modules["allsum"].to_dict()
+        assert report["cache_hits"] == 10
+        assert report["cache_misses"] == 0
+        assert report["cache_hit_rate"] == 1.0
+
+    def test_stats_report_next_to_output(self, sample_wordlist_file, tmp_path):
+        """Test that save writes the JSON report next to the output"""
+        survey = make_survey(sample_wordlist_file)
+        survey.score(allsum(), collect_stats=True, dedup=False)
+        survey.save(str(tmp_path / "scores.json"), stats_report=True)
+
+        with open(tmp_path / "scores.stats.json") as f:
+            report = json.load(f)
+        assert report["items"] == 9
+        assert report["unique_items"] == 9
+        assert report["modules"][0]["id"] == "allsum"
+        assert report["modules"][0]["calls"] == 9
+        assert report["modules"][0]["items_per_second"] > 0
+
+    def test_module_stats_rates(self):
+        """Test the derived rates of ModuleStats"""
+        stats = ModuleStats("test")
+        stats.wall_time = 2.0
+        stats.matcher_time = 0.5
+        stats.items = 10
+
+        assert stats.reduction_time == 1.5
+        assert stats.items_per_second == 5.0
+        assert ModuleStats.rate(0, 0) == 0.0
+        assert ModuleStats.rate(3, 1) == 0.75
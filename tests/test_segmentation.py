@@ -0,0 +1,173 @@
+import pytest
+import numpy as np
+from unittest.mock import Mock
+
+from veta.segmentation import Trie, HebrewSegmenter, ArabicMatcher, GermanDecompounder, ARABIC_PROCLITICS, SEGMENTERS
+from veta.token_matcher import TokenMatcher
+from veta.scoring_modules.scoring_module import ScoringModule
+
+
+def make_wordlist(words, unique_id):
+    wordlist = Mock()
+    wordlist.words = np.array(words)
+    wordlist.scores = np.arange(1, len(words) + 1)
+    wordlist.subclasses = np.zeros(len(words))
+    wordlist.unique_id = unique_id
+    return wordlist
+
+
+HEBREW_WORDS = ['שמח', 'עצוב', 'כועס', 'הקלה', 'גאה', 'אסיר תודה']
+ARABIC_WORDS = ['سعيد', 'حزين', 'الحزن', 'خائف', 'مرتاح جدا', 'أمل']
+GERMAN_WORDS = ['wut', 'trauer', 'liebe', 'kummer', 'angst', 'freude', 'mut', 'traurig']
+
+
+class TestTrie:
+    """Test cases for the wordlist trie"""
+
+    def test_ends(self):
+        """Test that every word starting at a position is found, shortest first"""
+        trie = Trie(['sad', 'sadness', 'down'])
+        assert list(trie.ends("xsadness", 1)) == [4, 8]
+        assert list(trie.ends("xsadness", 0)) == []
+        assert list(trie.ends("down", 0)) == [4]
+
+
+class TestHebrewSegmenter:
+    """Test cases for the Hebrew segmenting matcher"""
+
+    @pytest.fixture
+    def segmenter(self):
+        return HebrewSegmenter(HEBREW_WORDS)
+
+    @pytest.mark.parametrize("sentence, expected", [
+        ("אני שמח", {'שמח': 1}),
+        ("ושמח", {'שמח': 1}),
+        ("ובשמח", {'שמח': 1}),
+        ("והקלה", {'הקלה': 1}),
+        ("ואסיר תודה", {'אסיר תודה': 1}),
+    ])
+    def test_prefixes(self, segmenter, sentence, expected):
+        """Test that the attached prefix letters are removed before looking up a word"""
+        assert dict(segmenter.count(sentence)) == expected
+
+    def test_exact_word_first(self, segmenter):
+        """Test that a word starting with a prefix letter is kept whole when it is in the wordlist"""
+        assert segmenter.strip_prefixes("הקלה") == [1]
+        assert dict(segmenter.count("הקלה")) == {'הקלה': 1}
+
+    def test_run_together_words(self, segmenter):
+        """Test that tokens made of wordlist words written without spaces are split into those words"""
+        assert segmenter.segment("שמחועצוב") == ('שמח', 'עצוב')
+        assert dict(segmenter.count("שמחעצובכועס")) == {'שמח': 1, 'עצוב': 1, 'כועס': 1}
+        assert dict(segmenter.count("גאהשמח")) == {'גאה': 1, 'שמח': 1}
+
+    def test_no_embedded_matches(self, segmenter):
+        """Test that a wordlist word inside a longer word that is not made of wordlist words does not match"""
+        assert segmenter.segment("שמחה") == ()
+        assert dict(segmenter.count("שמחה")) == {}
+
+
+class TestArabicMatcher:
+    """Test cases for the Arabic clitic aware matcher"""
+
+    @pytest.fixture
+    def matcher(self):
+        return ArabicMatcher(ARABIC_WORDS)
+
+    def test_proclitics(self):
+        """Test that the combined proclitics are precomputed, with ل followed by ال written لل"""
+        assert {'و', 'ف', 'ب', 'ل', 'ك', 'ال', 'وال', 'بال', 'لل', 'وبال', 'فلل'} <= ARABIC_PROCLITICS
+        assert 'لال' not in ARABIC_PROCLITICS
+
+    @pytest.mark.parametrize("sentence, expected", [
+        ("انا سعيد", {'سعيد': 1}),
+        ("وسعيد", {'سعيد': 1}),
+        ("والحزن", {'الحزن': 1}),
+        ("وبالحزن", {'الحزن': 1}),
+        ("للحزن", {'الحزن': 1}),
+        ("ومرتاح جدا", {'مرتاح جدا': 1}),
+    ])
+    def test_strips_proclitics(self, matcher, sentence, expected):
+        """Test that the proclitics are removed before looking up a stem"""
+        assert dict(matcher.count(sentence)) == expected
+
+    def test_normalization(self, matcher):
+        """Test that diacritics and letter variants are normalized and the original wordlist word is reported"""
+        assert dict(matcher.count("سَعِيد")) == {'سعيد': 1}
+        assert dict(matcher.count("امل وإمل")) == {'أمل': 2}
+
+    def test_match_positions(self, matcher):
+        """Test that the matches cover their tokens, proclitics included, in the sentence before the diacritics are removed"""
+        sentence = "انا سَعِيد والحزن"
+        assert [(word, sentence[start:stop]) for word, start, stop in matcher.matches(sentence)] == \
+            [('سعيد', "سَعِيد"), ('الحزن', "والحزن")]
+
+    def test_no_letter_prefixes(self, matcher):
+        """Test that, unlike the regex, a letter that is not a proclitic before a word does not match"""
+        assert dict(matcher.count("مسعيد")) == {}
+        module = ScoringModule(language='ar')
+        module.add_wordlist(make_wordlist(ARABIC_WORDS, 'arabic-regex'))
+        assert dict(module.count_matches("مسعيد")) == {'سعيد': 1}
+
+
+class TestGermanDecompounder:
+    """Test cases for the German decompounding matcher"""
+
+    @pytest.fixture
+    def decompounder(self):
+        return GermanDecompounder(GERMAN_WORDS)
+
+    @pytest.mark.parametrize("token, expected", [
+        ("wutausbruch", ('wut',)),
+        ("trauergefühl", ('trauer',)),
+        ("liebeskummer", ('liebe', 'kummer')),
+        ("freudentränen", ('freude',)),
+        ("todesangst", ('angst',)),
+        ("mutter", ()),
+    ])
+    def test_decompose(self, decompounder, token, expected):
+        """Test that compounds are split into their wordlist words, with the linking morphemes"""
+        assert decompounder.decompose(token) == expected
+
+    def test_memoized(self, decompounder):
+        """Test that each compound and part is split once"""
+        assert dict(decompounder.count("wutausbruch und liebeskummer, wutausbruch")) == {'wut': 2, 'liebe': 1, 'kummer': 1}
+        assert decompounder.parts["wutausbruch"] == ('wut',)
+        decompounder.parts["wutausbruch"] = ('angst',)
+        assert decompounder.decompose("wutausbruch") == ('angst',)
+
+    def test_parts_dropped_with_the_vocabulary(self, decompounder):
+        """Test that the memoized splits are dropped with the vocabulary once it holds max_vocabulary tokens"""
+        decompounder.max_vocabulary = 2
+        decompounder.count("wutausbruch und liebeskummer")
+        assert "liebeskummer" in decompounder.parts
+        assert dict(decompounder.count("todesangst")) == {'angst': 1}
+        assert list(decompounder.parts) == ["todesangst"]
+        assert len(decompounder.vocabulary) == 1
+
+    def test_long_tokens(self, decompounder):
+        """Test that tokens longer than max_compound_length are not split"""
+        assert decompounder.decompose("wut" * 10000) == ()
+
+    def test_whole_words_first(self, decompounder):
+        """Test that wordlist words are not split"""
+        assert dict(decompounder.count("traurig")) == {'traurig': 1}
+
+
+class TestSegmentMatcher:
+    """Test cases for ScoringModule.matcher = 'segment'"""
+
+    def test_language_segmenter(self):
+        """Test that the segmenter of the module language is used, and the token matcher otherwise"""
+        module = ScoringModule(language='he')
+        module.matcher = 'segment'
+        module.add_wordlist(make_wordlist(HEBREW_WORDS, 'segment-he'))
+        assert isinstance(module.token_matcher, SEGMENTERS['he'])
+        assert module.token_matcher.supported
+        frequency, matching_words, scores = module.match_words("ושמחועצוב", module.wordlist)
+        assert list(matching_words) == ['שמח', 'עצוב']
+
+        module = ScoringModule(language='en')
+        module.matcher = 'segment'
+        module.add_wordlist(make_wordlist(['sad'], 'segment-en'))
+        assert type(module.token_matcher) is TokenMatcher
@@ -246,6 +246,205 @@ class TestSurvey:
                 assert "test_score" in item.scores
                 assert "index" in item.scores  # This is always added by add_item
 
+    def test_score_dedup_scores_unique_items_once(self, sample_wordlist_file):
+        """Test that identical items are scored once and get the same scores"""
+        survey = Survey()
+        survey.add_wordlist(Wordlist(sample_wordlist_file))
+        for userid in ["user1", "user2", "user3"]:
+            respondent = Respondent(userid=userid)
+            respondent.add_item("I feel happy!", "She seems sad")
+            respondent.add_item("i feel happy", "she seems sad.")
+            survey.add_respondent(respondent)
+        survey.respondents[2].add_item("I am angry", "")
+
+        mock_module = Mock()
+        mock_module.id = "test_score"
+        mock_module.type = "per item"
+        mock_module.execute.return_value = 5
+
+        survey.score(mock_module, dedup=True)
+
+        assert mock_module.execute.call_count == 2
+        assert survey.dedup_report == {"items": 7, "unique_items": 2, "dedup_ratio": 3.5}
+        for respondent in survey.respondents:
+            for item in respondent.items:
+                assert item.scores["test_score"] == 5
+        assert survey.respondents[2].totals["test_score"] == 15
+
+    def test_score_without_dedup_by_default(self, sample_wordlist_file):
+        """Test that every item is scored unless dedup is asked for, so items differing only in raw input keep their scores"""
+        survey = Survey()
+        survey.add_wordlist(Wordlist(sample_wordlist_file))
+        respondent = Respondent(userid="user1")
+        respondent.add_item("I feel happy!", "She seems sad")
+        respondent.add_item("i feel happy", "she seems sad.")
+        survey.add_respondent(respondent)
+
+        mock_module = Mock()
+        mock_module.id = "test_score"
+        mock_module.type = "per item"
+        mock_module.execute.side_effect = lambda item, *args: len(item.raw_input)
+
+        survey.score(mock_module)
+
+        assert mock_module.execute.call_count == 2
+        assert [item.scores["test_score"] for item in respondent.items] == [len(item.raw_input) for item in respondent.items]
+
+    def test_score_dedup_matches_full_scoring(self, sample_wordlist_file):
+        """Test that deduplicated scoring gives the same scores as scoring every item"""
+        from veta.scoring_modules.allsum import allsum
+        from veta.scoring_modules.count import count
+        from veta.scoring_modules.highestN_allinone import highestN_allinone
+
+        answers = [("I feel happy", "They feel sad"), ("angry", ""), ("I feel happy", "They feel sad"), ("joyful", "depressed")]
+        surveys = []
+        for dedup in [True, False]:
+            survey = Survey()
+            survey.add_wordlist(Wordlist(sample_wordlist_file))
+            for i in range(3):
+                respondent = Respondent(userid="user{}".format(i))
+                for self_sentence, other_sentence in answers[i:]:
+                    respondent.add_item(self_sentence, other_sentence)
+                survey.add_respondent(respondent)
+            survey.score(allsum(), count(), highestN_allinone(2), dedup=dedup)
+            surveys.append(survey)
+
+        for deduped, full in zip(*[survey.respondents for survey in surveys]):
+            assert dict(deduped.totals) == dict(full.totals)
+            for deduped_item, full_item in zip(deduped.items, full.items):
+                assert dict(deduped_item.scores) == dict(full_item.scores)
+
+    def test_score_wordlists_matches_separate_scoring(self, tmp_path):
+        """Test that scoring several wordlists at once gives the scores of each wordlist scored separately"""
+        from veta.scoring_modules.allsum import allsum
+        from veta.scoring_modules.count import count
+        from veta.scoring_modules.highestN_allinone import highestN_allinone
+
+        wordlists = {}
+        for name, words in [('original', ['happy', 'sad', 'down', 'angry']),
+                            ('expanded', ['happy', 'sad', 'feel down', 'joyful', 'let down']),
+                            ('language', ['angry', 'furious'])]:
+            file_path = tmp_path / f"{name}.txt"
+            with open(file_path, 'w') as f:
+                f.write("Test wordlist, created for testing\nFile to be used for testing LEAS scoring\n")
+                for i, word in enumerate(words):
+                    f.write(f"{word}\n{i % 5 + 1}\n")
+            wordlists[name] = Wordlist(str(file_path), name=name)
+
+        answers = [("I feel down and happy", "They let down the team"), ("angry, furious", ""), ("joyful", "sad sad")]
+        def make_survey():
+            survey = Survey()
+            for i in range(2):
+                respondent = Respondent(userid="user{}".format(i))
+                for self_sentence, other_sentence in answers[i:]:
+                    respondent.add_item(self_sentence, other_sentence)
+                survey.add_respondent(respondent)
+            return survey
+
+        modules = [allsum(), count(), highestN_allinone(2)]
+        ids = [module.id for module in modules]
+        survey = make_survey()
+        survey.score_wordlists(wordlists, *modules, collect_stats=True)
+        assert [module.id for module in modules] == ids
+        assert all(module.union is None for module in modules)
+        assert modules[2].base.union is None
+        assert 'allsum-original' in survey.scoring_stats.modules
+
+        # A module id set on the instance is kept
+        named = allsum()
+        named.id = 'named'
+        make_survey().score_wordlists(wordlists, named)
+        assert named.id == 'named' and named.union is None
+
+        for name, wordlist in wordlists.items():
+            separate = make_survey()
+            separate.add_wordlist(wordlist)
+            separate.score(allsum(), count(), highestN_allinone(2))
+            for respondent, expected in zip(survey.respondents, separate.respondents):
+                for item, expected_item in zip(respondent.items, expected.items):
+                    for key, value in expected_item.scores.items():
+                        # Additional information (e.g. the item index) is not suffixed
+                        if key not in item.scores:
+                            assert item.scores[f"{key}-{name}"] == value
+                for key, value in expected.totals.items():
+                    if key not in respondent.totals:
+                        assert respondent.totals[f"{key}-{name}"] == value
+
+    @staticmethod
+    def write_wordlist(path, words):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("Test wordlist, created for testing\nFile to be used for testing LEAS scoring\n")
+            for i, word in enumerate(words):
+                f.write(f"{word}\n{i % 5 + 1}\n")
+        return Wordlist(str(path))
+
+    def test_detect_languages(self):
+        """Test that detection fills in the missing languages and keeps the explicit ones"""
+        survey = Survey()
+        mixed = Respondent(userid="mixed")
+        mixed.add_item("I feel happy", "")
+        mixed.add_item("Ich bin traurig", "")
+        mixed.add_item("אני שמח", "")
+        mixed.add_item("أنا سعيد", "")
+        explicit = Respondent(userid="explicit", language="de")
+        explicit.add_item("I feel happy", "")
+        survey.add_respondent(mixed)
+        survey.add_respondent(explicit)
+
+        counts = survey.detect_languages()
+
+        assert [item.language for item in mixed.items] == ['en', 'de', 'he', 'ar']
+        assert explicit.items[0].language == 'de'
+        assert counts == {'en': 1, 'de': 2, 'he': 1, 'ar': 1}
+        assert mixed.language == 'en'
+        with pytest.raises(ValueError):
+            survey.detect_languages(per='survey')
+
+    def test_score_routes_items_by_language(self, tmp_path):
+        """Test that each item is scored with the wordlist and module of its language"""
+        from veta.scoring_modules.allsum import allsum
+
+        wordlists = {'en': self.write_wordlist(tmp_path / "en.txt", ['happy', 'sad']),
+                     'de': self.write_wordlist(tmp_path / "de.txt", ['froh', 'traurig', 'sad']),
+                     'he': self.write_wordlist(tmp_path / "he.txt", ['שמח'])}
+        answers = [("I feel happy and sad", ""), ("Ich bin froh und traurig, sad", ""), ("ושמח", "")]
+        survey = Survey()
+        for language, wordlist in wordlists.items():
+            survey.add_wordlist(wordlist, language=language)
+        for userid in ["user1", "user2"]:
+            respondent = Respondent(userid=userid)
+            for self_sentence, other_sentence in answers:
+                respondent.add_item(self_sentence, other_sentence)
+            survey.add_respondent(respondent)
+        survey.detect_languages()
+
+        module = allsum()
+        survey.score(module)
+
+        for respondent in survey.respondents:
+            for item, language in zip(respondent.items, ['en', 'de', 'he']):
+                expected = allsum(language=language).execute(Item(item.raw_input), wordlists[language])
+                assert item.wordlist is wordlists[language]
+                assert item.scores['allsum'] == expected
+        # The Hebrew variant accepts the prefix letter, the English module does not
+        assert respondent.items[2].scores['allsum'] == 1
+        assert module.language == 'en'
+        assert set(module._variants) == {'de', 'he'}
+
+    def test_language_column(self):
+        """Test that the language column sets the language of each item"""
+        survey = Survey()
+        survey.configure_columns(0, 1, 2, language_col=3)
+        data = np.array([["ID", "Self", "Other", "Language"],
+                         ["user1", "I feel happy", "", "EN"],
+                         ["user1", "Ich bin froh", "", " de "],
+                         ["user1", "sad", "", np.nan]], dtype=object)
+
+        survey.from_vertical_layout(data)
+
+        assert [item.language for item in survey.respondents[0].items] == ['en', 'de', None]
+        assert survey.to_json()[0]['items'][1]['language'] == 'de'
+
     def test_summary_statistics_method_exists(self):
         """Test that summary statistics methods exist"""
         survey = Survey()
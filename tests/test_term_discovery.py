@@ -0,0 +1,123 @@
+import pytest
+
+from veta.survey import Survey
+from veta.respondent import Respondent
+from veta.wordlist import Wordlist
+from veta.term_discovery import TermCounter, TermDiscovery
+from veta.scoring_modules.scoring_module import ScoringModule
+
+
+WORDS = [('happy', 4), ('sad', 2), ('down', 2), ('feel down', 3), ('lonely', 3)]
+ANSWERS = [
+    [("I feel left out and lonely", "They are sad"), ("I felt so left out at work", "")],
+    [("happy, left out", "she feels heartbroken"), ("I feel heartbroken", "He would feel left out")],
+    [("work was fine", "they feel down"), ("sad sad", "lonely and heartbroken")],
+]
+
+
+@pytest.fixture
+def wordlist(tmp_path):
+    file_path = tmp_path / "wordlist.txt"
+    with open(file_path, 'w') as f:
+        f.write("Test wordlist, created for testing\nFile to be used for testing LEAS scoring\n")
+        for word, score in WORDS:
+            f.write(f"{word}\n{score}\n")
+    return Wordlist(str(file_path))
+
+
+def make_survey(wordlist):
+    survey = Survey()
+    survey.add_wordlist(wordlist)
+    for i, answers in enumerate(ANSWERS):
+        respondent = Respondent(userid=f"user{i}")
+        for self_sentence, other_sentence in answers:
+            respondent.add_item(self_sentence, other_sentence)
+        survey.add_respondent(respondent)
+    return survey
+
+
+class TestTermCounter:
+    """Test cases for the bounded memory counter"""
+
+    def test_exact_until_pruned(self):
+        """Test that the counts are exact while no key is dropped"""
+        counter = TermCounter(capacity=2)
+        for key in ['a', 'b', 'a', 'c', 'a', 'b']:
+            assert counter.add(key)
+        assert counter.most_common() == [('a', 3), ('b', 2), ('c', 1)]
+        assert counter.floor == 0
+
+    def test_prune_bounds_the_error(self):
+        """Test that a key counted after keys were dropped starts from the floor, an upper bound of its count"""
+        counter = TermCounter(capacity=2)
+        for key in ['a', 'a', 'a', 'b', 'b', 'c', 'd']:
+            counter.add(key)
+        assert sorted(counter.prune()) == ['c', 'd']
+        assert counter.floor == 1 and counter.dropped == 2
+        assert not counter.add('c')
+        assert counter.counts['c'] == 2 and counter.errors['c'] == 1
+        assert counter.add('a')
+
+    def test_invalid_capacity(self):
+        """Test that the capacity must be positive"""
+        with pytest.raises(ValueError):
+            TermCounter(capacity=0)
+
+
+class TestTermDiscovery:
+    """Test cases for the discovery of terms missing from the wordlist"""
+
+    def test_covered_words_are_skipped(self):
+        """Test that no n-gram contains or spans a wordlist match, and that stopwords do not start or end one"""
+        discovery = TermDiscovery(n=2)
+        sentence = "i feel left out and lonely today"
+        discovery.add(sentence, [('lonely', 20, 26)])
+        assert set(discovery.counter.counts) == {'left', 'out', 'left out', 'today'}
+        assert discovery.words == 7 and discovery.covered == 1
+
+    def test_near_an_emotion_verb(self):
+        """Test that the n-grams starting within the window after an emotion verb are counted as near"""
+        discovery = TermDiscovery(n=2, window=2)
+        discovery.add("i feel so left out at work", [])
+        assert discovery.near == {'left': 1, 'left out': 1}
+        candidates = {candidate['term']: candidate for candidate in discovery.candidates(min_count=1)}
+        assert candidates['left out']['score'] == 1 + TermDiscovery.anchor_weight
+        assert candidates['left out']['examples'] == ["i feel so [left out] at work"]
+
+    def test_ranking_and_contexts(self):
+        """Test that candidates are ranked by score and keep a bounded number of distinct contexts"""
+        discovery = TermDiscovery(n=1, examples=2)
+        for sentence in ["work again", "work again", "more work", "i feel drained", "lots of work"]:
+            discovery.add(sentence, [])
+        candidates = discovery.candidates(min_count=1)
+        assert [candidate['term'] for candidate in candidates][:2] == ['work', 'drained']
+        assert candidates[0]['count'] == 4
+        assert candidates[0]['examples'] == ["[work] again", "more [work]"]
+
+    def test_memory_is_bounded(self):
+        """Test that the counts are pruned to the capacity with their contexts"""
+        discovery = TermDiscovery(n=1, capacity=5)
+        for i in range(50):
+            discovery.add(f"frequent word{i}", [])
+        assert len(discovery.counter) <= 10
+        assert len(discovery.contexts) == len(discovery.counter)
+        assert discovery.candidates(top=1)[0]['term'] == 'frequent'
+
+    def test_survey_discover_terms(self, wordlist):
+        """Test that the survey proposes the frequent terms its wordlist does not cover"""
+        survey = make_survey(wordlist)
+        discovery = survey.discover_terms()
+        candidates = discovery.candidates(top=3)
+
+        assert [candidate['term'] for candidate in candidates] == ['left out', 'heartbroken', 'work']
+        assert candidates[0]['count'] == 4 and candidates[0]['near'] == 3
+        assert "[left out]" in candidates[0]['examples'][0]
+        assert all(candidate['term'] not in ('lonely', 'sad', 'down') for candidate in discovery.candidates(top=None))
+
+    def test_survey_discover_terms_with_module(self, wordlist):
+        """Test that the words are found with the matcher of the given module"""
+        survey = make_survey(wordlist)
+        module = ScoringModule()
+        module.matcher = 'regex'
+        candidates = survey.discover_terms(module, n=1).candidates(top=None)
+        assert [candidate['term'] for candidate in candidates] == ['left', 'out', 'heartbroken', 'work']
@@ -0,0 +1,161 @@
+import pytest
+
+from veta.survey import Survey
+from veta.respondent import Respondent
+from veta.wordlist import Wordlist, WordlistDiff
+from veta.term_index import TermIndex, finds_by_tokens
+from veta.scoring_modules.scoring_module import ScoringModule
+from veta.scoring_modules.allsum import allsum
+from veta.scoring_modules.count import count
+from veta.scoring_modules.highestN import highestN
+from veta.scoring_modules.highestN_allinone import highestN_allinone
+from veta.scoring_modules.vocab import vocab
+
+
+WORDS = [('happy', 4), ('sad', 2), ('down', 2), ('feel down', 3), ('angry', 1), ('joyful', 5)]
+ANSWERS = [
+    [("I feel down and happy", "They are sad"), ("angry", ""), ("nothing", "at all")],
+    [("joyful, happy", "let down"), ("I feel happy", "She feels down")],
+    [("sad sad", ""), ("content and calm", "they let down the team")],
+]
+
+
+def make_modules():
+    return [allsum(), count(), highestN(2), highestN_allinone(2), vocab()]
+
+
+def make_survey(wordlist):
+    survey = Survey()
+    survey.add_wordlist(wordlist)
+    for i, answers in enumerate(ANSWERS):
+        respondent = Respondent(userid=f"user{i}")
+        for self_sentence, other_sentence in answers:
+            respondent.add_item(self_sentence, other_sentence)
+        survey.add_respondent(respondent)
+    return survey
+
+
+@pytest.fixture
+def wordlist(tmp_path):
+    file_path = tmp_path / "wordlist.txt"
+    with open(file_path, 'w') as f:
+        f.write("Test wordlist, created for testing\nFile to be used for testing LEAS scoring\n")
+        for word, score in WORDS:
+            f.write(f"{word}\n{score}\n")
+    return Wordlist(str(file_path))
+
+
+class TestTermIndex:
+    """Test cases for the inverted term index of a scored survey"""
+
+    def test_terms_and_candidates(self, wordlist):
+        """Test that the index maps each matched word and each token to its items"""
+        survey = make_survey(wordlist)
+        survey.score(allsum(), index_terms=True)
+        index = survey.term_index
+
+        terms = index.terms[wordlist.unique_id]
+        assert terms['happy'] == {0, 3, 4}
+        assert terms['feel down'] == {0}
+        assert terms['down'] == {3, 4, 6}
+        assert index.candidates("let down") == {3, 6}
+        assert index.candidates("calm content") == {6}
+        assert index.candidates("!") is None
+        assert index.positions(wordlist) == set(range(7))
+
+    def test_affected_items(self, wordlist):
+        """Test that only the items a change can affect are selected"""
+        survey = make_survey(wordlist)
+        survey.score(allsum(), index_terms=True)
+        index = survey.term_index
+
+        assert index.affected(WordlistDiff(wordlist, change={'angry': 3})) == {1}
+        assert index.affected(WordlistDiff(wordlist, remove=['feel down'])) == {0}
+        assert index.affected(WordlistDiff(wordlist, add={'let down': 2})) == {3, 6}
+        assert index.affected(WordlistDiff(wordlist, add={'let down': 2}), exact=False) == set(range(7))
+
+    def test_finds_by_tokens(self):
+        """Test that matchers finding words without their tokens are detected"""
+        assert finds_by_tokens(allsum())
+        assert not finds_by_tokens(allsum(language='he'))
+        module = ScoringModule()
+        module.matcher = 'fuzzy'
+        assert not finds_by_tokens(module)
+
+
+class TestApplyWordlistDiff:
+    """Test cases for applying a wordlist change to a scored survey"""
+
+    @pytest.mark.parametrize("change", [
+        {'change': {'happy': 1, 'sad': (2, 3)}},
+        {'remove': ['feel down', 'angry']},
+        {'add': {'let down': 3, 'calm': 2}},
+        {'add': {'feel': 1}, 'remove': ['joyful'], 'change': {'down': 5}},
+    ])
+    def test_same_scores_as_rescoring(self, wordlist, change):
+        """Test that the updated scores and totals equal scoring the survey again with the changed wordlist"""
+        survey = make_survey(wordlist)
+        modules = make_modules()
+        survey.score(*modules, index_terms=True)
+        diff = WordlistDiff(wordlist, **change)
+
+        impact = survey.apply_wordlist_diff(diff, *modules)
+
+        expected = make_survey(impact.wordlist)
+        expected.score(*make_modules())
+        for respondent, expected_respondent in zip(survey.respondents, expected.respondents):
+            assert dict(respondent.totals) == dict(expected_respondent.totals)
+            for item, expected_item in zip(respondent.items, expected_respondent.items):
+                assert dict(item.scores) == dict(expected_item.scores)
+                assert item.wordlist is impact.wordlist
+        assert survey.wordlist is impact.wordlist
+        assert impact.rescored < impact.total
+        assert impact.items
+
+        # The moved matches and the index are valid for the next change
+        again = survey.apply_wordlist_diff(WordlistDiff(impact.wordlist, change={'joyful': 2} if 'joyful' not in diff.removed else {'happy': 2}), *modules)
+        assert again.rescored < again.total
+
+    def test_without_index_terms(self, wordlist):
+        """Test that the matches are dropped after scoring without index_terms, and that a change then matches
+        every item of the wordlist again with the same result"""
+        survey = make_survey(wordlist)
+        modules = make_modules()
+        survey.score(*modules)
+        assert survey.term_index is None
+        assert all(item.matches is None for respondent in survey.respondents for item in respondent.items)
+
+        impact = survey.apply_wordlist_diff(WordlistDiff(wordlist, change={'happy': 1}), *modules)
+
+        assert impact.rescored == impact.total
+        expected = make_survey(impact.wordlist)
+        expected.score(*make_modules())
+        assert [dict(respondent.totals) for respondent in survey.respondents] == \
+            [dict(respondent.totals) for respondent in expected.respondents]
+
+    def test_dry_run(self, wordlist):
+        """Test that a dry run reports the change and leaves the survey unchanged"""
+        survey = make_survey(wordlist)
+        modules = make_modules()
+        survey.score(*modules, index_terms=True)
+        before = [dict(respondent.totals) for respondent in survey.respondents]
+        diff = WordlistDiff(wordlist, change={'happy': 1})
+
+        preview = survey.apply_wordlist_diff(diff, *modules, dry_run=True)
+
+        assert [dict(respondent.totals) for respondent in survey.respondents] == before
+        assert survey.wordlist is wordlist
+        assert all(key[0] == wordlist.unique_id for respondent in survey.respondents
+                   for item in respondent.items for key in item.matches or ())
+        assert not preview.applied
+        allsum_rows = [row for row in preview.items if row['id'] == 'allsum']
+        assert [(row['respondent'], row['item'], row['delta']) for row in allsum_rows] == \
+            [('user0', 1, -3), ('user1', 1, -3), ('user1', 2, -3)]
+        summary = preview.summary()
+        assert summary['allsum']['items'] == 3 and summary['allsum']['respondents'] == 2
+        assert summary['allsum']['mean_delta'] == -3
+
+        applied = survey.apply_wordlist_diff(diff, *modules)
+        assert applied.items == preview.items
+        assert applied.respondents == preview.respondents
+        assert "rescored 3 of 7 items" in str(applied)
@@ -0,0 +1,126 @@
+import pytest
+import numpy as np
+from unittest.mock import Mock
+
+from veta.token_matcher import TokenMatcher, Vocabulary
+from veta.scoring_modules.scoring_module import ScoringModule
+from veta.wordlist import Wordlist
+
+
+def make_wordlist(words, unique_id):
+    wordlist = Mock()
+    wordlist.words = np.array(words)
+    wordlist.scores = np.arange(1, len(words) + 1)
+    wordlist.subclasses = np.zeros(len(words))
+    wordlist.unique_id = unique_id
+    return wordlist
+
+
+WORDS = ['sad', 'down', 'feel down', 'let down', "don't", 'worn-out', 'sad sad', 'über', 'a b c', 'b']
+SENTENCES = [
+    "i feel down and sad",
+    "sad sad sad",
+    "they let down the team and feel down",
+    "i don't know, i'm worn-out and down",
+    "[sad] \"down\" {über}",
+    "sadness downtown feel  down",
+    "a b c b a b",
+    "",
+]
+
+
+class TestVocabulary:
+    """Test cases for the token vocabulary"""
+
+    def test_intern_assigns_stable_ids(self):
+        """Test that a token keeps the id it was first given"""
+        vocabulary = Vocabulary()
+        assert vocabulary.intern("sad") == 0
+        assert vocabulary.intern("happy") == 1
+        assert vocabulary.intern("sad") == 0
+        assert vocabulary.tokens == ["sad", "happy"]
+        assert len(vocabulary) == 2
+
+
+class TestTokenMatcher:
+    """Test cases for the token matcher"""
+
+    @pytest.mark.parametrize("sentence", SENTENCES)
+    def test_same_result_as_regex(self, sentence):
+        """Test that the token matcher finds the same words, counts and order as the regex"""
+        module = ScoringModule()
+        module.add_wordlist(make_wordlist(WORDS, 'token-matcher-words'))
+
+        result = module.token_matcher.count(sentence)
+        expected = module.count_matches_regex(sentence)
+
+        assert result is not None
+        assert list(result.items()) == list(expected.items())
+
+    @pytest.mark.parametrize("sentence", SENTENCES)
+    def test_same_spans_as_regex(self, sentence):
+        """Test that the token matcher finds the words at the same positions as the regex"""
+        module = ScoringModule()
+        wordlist = make_wordlist(WORDS, 'token-matcher-spans')
+        module.add_wordlist(wordlist)
+
+        result = module.match_spans(sentence, wordlist)
+        module.token_matcher = None
+        expected = module.match_spans(sentence, wordlist)
+
+        assert result == expected
+        assert all(sentence[start:stop] == word for word, start, stop in result)
+
+    def test_longest_phrase_wins(self):
+        """Test that the longest word starting at a token is kept and its tokens are not matched again"""
+        matcher = TokenMatcher(['feel', 'down', 'feel down', 'feel down today'], ' ', ' ')
+        assert dict(matcher.count("i feel down today and feel down")) == {'feel down today': 1, 'feel down': 1}
+
+    def test_vocabulary_is_per_matcher_and_bounded(self):
+        """Test that each matcher interns only its own tokens, and drops its vocabulary past max_vocabulary"""
+        first = TokenMatcher(WORDS, ' ', ' ')
+        second = TokenMatcher(WORDS, ' ', ' ')
+        first.count("i feel down and sad")
+        assert len(second.vocabulary) == 0
+        assert len(first.starts) == len(first.vocabulary) == 5
+
+        first.max_vocabulary = 6
+        expected = [dict(second.count(sentence)) for sentence in SENTENCES]
+        assert [dict(first.count(sentence)) for sentence in SENTENCES] == expected
+        assert len(first.vocabulary) < len(second.vocabulary)
+        assert len(first.starts) == len(first.vocabulary)
+
+    def test_falls_back_for_irregular_words(self):
+        """Test that sentences containing a word that does not start and end with a word character use the regex"""
+        matcher = TokenMatcher(['glücklich ', 'traurig'], ' ', ' ')
+        assert matcher.irregular == ['glücklich ']
+        assert matcher.count("ich bin glücklich und traurig") is None
+        assert dict(matcher.count("ich bin traurig")) == {'traurig': 1}
+
+    def test_falls_back_for_letter_prefixes(self):
+        """Test that languages accepting letters around words (Hebrew, Arabic) always use the regex"""
+        module = ScoringModule(language='he')
+        module.add_wordlist(make_wordlist(['שמח'], 'token-matcher-he'))
+
+        assert not module.token_matcher.supported
+        assert module.token_matcher.count("ושמח") is None
+        frequency, matching_words, scores = module.match_words("ושמח", module.wordlist)
+        assert list(matching_words) == ['שמח']
+
+    def test_regex_matcher_option(self, sample_wordlist_file):
+        """Test that matcher = 'regex' disables the token matcher and gives the same results"""
+        wordlist = Wordlist(sample_wordlist_file)
+        token_module = ScoringModule()
+        regex_module = ScoringModule()
+        regex_module.matcher = 'regex'
+
+        for sentence in ["i feel happy and sad", "angry angry joyful", "nothing here"]:
+            token_result = token_module.match_words(sentence, wordlist, sublevels=True)
+            regex_result = regex_module.match_words(sentence, wordlist, sublevels=True)
+            for array, expected in zip(token_result, regex_result):
+                np.testing.assert_array_equal(array, expected)
+        assert regex_module.token_matcher is None
+
+        regex_module.matcher = 'unknown'
+        with pytest.raises(ValueError):
+            regex_module.add_wordlist(wordlist)
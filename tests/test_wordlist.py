@@ -5,7 +5,7 @@ import tempfile
 import os
 from unittest.mock import patch, MagicMock
 
-from veta.wordlist import Wordlist, is_number
+from veta.wordlist import Wordlist, WordlistDiff, is_number
 
 
 class TestWordlist:
@@ -273,3 +273,43 @@ class TestIsNumberFunction:
         assert is_number(".5") == False  # No leading digit
         assert is_number("5.") == False  # No trailing digit
         assert is_number("--5") == False  # Double negative
+
+
+class TestWordlistDiff:
+    """Test cases for proposed wordlist changes"""
+
+    def test_apply(self, sample_wordlist_file):
+        """Test that applying a diff returns a changed copy with its own id"""
+        wordlist = Wordlist(sample_wordlist_file)
+        diff = WordlistDiff(wordlist, add={'Content': 2, 'let down': (3, 1)}, remove=['angry'], change={'happy': 3})
+
+        changed = diff.apply()
+
+        assert changed.unique_id != wordlist.unique_id
+        assert 'angry' in wordlist.words and 'angry' not in changed.words
+        scores = dict(zip(changed.words, changed.scores))
+        assert scores['content'] == 2 and scores['let down'] == 3 and scores['happy'] == 3
+        assert list(changed.words) == sorted(changed.words)
+        assert diff.words() == {'content', 'let down', 'angry', 'happy'}
+
+    def test_between(self, sample_wordlist_file):
+        """Test that the diff between two wordlists turns one into the other"""
+        wordlist = Wordlist(sample_wordlist_file)
+        changed = WordlistDiff(wordlist, add={'content': 2}, remove=['sad'], change={'joyful': 1}).apply()
+
+        diff = WordlistDiff.between(wordlist, changed)
+
+        assert diff.added == {'content': (2.0, 0.0)}
+        assert diff.removed == {'sad'}
+        assert list(diff.changed) == ['joyful']
+
+    def test_invalid_changes(self, sample_wordlist_file):
+        """Test that adding existing words, or removing or changing missing words, raises"""
+        wordlist = Wordlist(sample_wordlist_file)
+        with pytest.raises(ValueError):
+            WordlistDiff(wordlist, add={'happy': 1})
+        with pytest.raises(ValueError):
+            WordlistDiff(wordlist, remove=['content'])
+        with pytest.raises(ValueError):
+            WordlistDiff(wordlist, remove=['happy'], change={'happy': 2})
+        assert WordlistDiff(wordlist, change={'happy': wordlist.scores[list(wordlist.words).index('happy')]}).changed == {}
@@ -0,0 +1,92 @@
+import pytest
+
+from veta.wordlist import Wordlist
+from veta.wordlist_union import WordlistUnion, overlaps
+from veta.scoring_modules.scoring_module import ScoringModule
+
+
+def write_wordlist(tmp_path, name, words, scores):
+    file_path = tmp_path / f"{name}.txt"
+    with open(file_path, 'w') as f:
+        f.write(f"{name} wordlist, created for testing\n")
+        f.write("File to be used for testing LEAS scoring\n")
+        for word, score in zip(words, scores):
+            f.write(f"{word}\n{score}\n")
+    return Wordlist(str(file_path), name=name)
+
+
+@pytest.fixture
+def wordlists(tmp_path):
+    return {
+        'original': write_wordlist(tmp_path, 'original', ['happy', 'sad', 'down'], [2, 2, 1]),
+        'expanded': write_wordlist(tmp_path, 'expanded', ['happy', 'sad', 'joyful', 'feel down'], [3, 2, 4, 3]),
+        'other': write_wordlist(tmp_path, 'other', ['angry', 'furious'], [1, 2]),
+    }
+
+
+class TestWordlistUnion:
+    """Test cases for the union of several wordlists"""
+
+    def test_words(self, wordlists):
+        """Test that the union holds every word of the wordlists once"""
+        union = WordlistUnion(wordlists)
+        assert sorted(union.words) == ['angry', 'down', 'feel down', 'furious', 'happy', 'joyful', 'sad']
+        assert union.names == {wordlist.unique_id: name for name, wordlist in wordlists.items()}
+
+    def test_shadows(self, wordlists):
+        """Test that the phrases of other wordlists that can hide a word of a wordlist are found"""
+        union = WordlistUnion(wordlists)
+        # "feel down" can hide "down"
+        assert union.shadows == {'original': {'feel down'}, 'expanded': set(), 'other': set()}
+        assert union.exact == {'original': False, 'expanded': True, 'other': True}
+
+    def test_covers(self, wordlists):
+        """Test that only the token and regex matchers without word characters around words use the union"""
+        union = WordlistUnion(wordlists)
+        module = ScoringModule()
+        assert union.covers(module, wordlists['original'])
+        assert not union.covers(ScoringModule(language='he'), wordlists['other'])
+        module.matcher = 'fuzzy'
+        assert not union.covers(module, wordlists['other'])
+
+    @pytest.mark.parametrize("first, second, expected", [
+        (("feel", "down"), ("down",), True),
+        (("feel", "down"), ("down", "and", "out"), True),
+        (("i", "feel"), ("feel", "down"), True),
+        (("let", "down"), ("feel", "down"), False),
+        (("a", "b", "c"), ("b",), True),
+        (("a", "b", "c"), ("b", "a"), True),
+        (("a", "b", "c"), ("d", "b"), False),
+    ])
+    def test_overlaps(self, first, second, expected):
+        """Test which token sequences can overlap in a sentence"""
+        assert overlaps(first, second) == expected
+        assert overlaps(second, first) == expected
+
+    def test_names(self, wordlists):
+        """Test that a list of wordlists is named after the wordlists, which must be distinct"""
+        union = WordlistUnion([wordlists['original'], wordlists['other']])
+        assert list(union.wordlists) == ['original', 'other']
+        with pytest.raises(ValueError):
+            WordlistUnion([wordlists['original'], wordlists['original']])
+        with pytest.raises(ValueError):
+            WordlistUnion({})
+
+    def test_count_once_per_sentence(self, wordlists):
+        """Test that a sentence is matched once against the union for every wordlist"""
+        union = WordlistUnion(wordlists)
+        module = ScoringModule()
+        first = union.count(module, "i was happy and angry", wordlists['other'])
+        assert dict(first) == {'happy': 1, 'angry': 1}
+        assert union.count(module, "i was happy and angry", wordlists['original']) is first
+        union.clear()
+        assert union.counts == {}
+
+    def test_count_falls_back(self, wordlists):
+        """Test that the sentences containing a word that can hide a word of the wordlist are matched separately"""
+        union = WordlistUnion(wordlists)
+        module = ScoringModule()
+        assert dict(union.count(module, "i feel down", wordlists['expanded'])) == {'feel down': 1}
+        assert union.count(module, "i feel down", wordlists['original']) is None
+        assert union.count(module, "i am down", wordlists['original']) is not None
+        assert union.fallbacks == {'original': 1, 'expanded': 0, 'other': 0}
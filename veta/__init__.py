@@ -2,11 +2,13 @@
 Veta - A Python package for LEAS (Levels of Emotional Awareness Scale) analysis.
 """
 
-from .logger import get_logger, setup_logging
+from .logger import get_logger, setup_logging, setup_worker_logging, shutdown_logging
 from .survey import Survey
 from .respondent import Respondent
 from .item import Item
 from .wordlist import Wordlist
+from .match_cache import MatchCache
+from .normalization import Normalizer
 from .auto_self_other_item import attempt_auto_self_other
 
 __version__ = "1.0.0"
@@ -15,7 +17,11 @@ __all__ = [
     "Respondent", 
     "Item",
     "Wordlist",
+    "MatchCache",
+    "Normalizer",
     "attempt_auto_self_other",
     "get_logger",
-    "setup_logging"
+    "setup_logging",
+    "setup_worker_logging",
+    "shutdown_logging"
 ]
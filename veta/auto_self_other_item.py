@@ -22,7 +22,10 @@ except:
     logger.warning("German SpaCy not detected: https://spacy.io/usage/models/")
     print("German SpaCy not detected: https://spacy.io/usage/models/")
 
-def attempt_auto_self_other(item, lang = "en") -> None:
+def attempt_auto_self_other(item, lang = None) -> None:
+    # Without a language, use the item's (see Survey.detect_languages)
+    if lang is None:
+        lang = item.language or "en"
     logger.debug(f"Attempting auto self/other separation for language: {lang}")
 
     self_sentence = ''
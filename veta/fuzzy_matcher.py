@@ -0,0 +1,202 @@
+from collections import defaultdict
+
+from veta.token_matcher import TokenMatcher
+from veta.logger import get_logger
+
+logger = get_logger('fuzzy_matcher')
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    '''
+    Returns the Damerau-Levenshtein (optimal string alignment) distance between two strings, or limit + 1 if it is
+    larger than limit
+
+            Parameters:
+                    a (str): The first string
+                    b (str): The second string
+                    limit (int): The largest distance of interest
+            Returns:
+                    distance (int): The edit distance, at most limit + 1
+    '''
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+def deletes(word: str, distance: int) -> set:
+    '''Returns the strings obtained by deleting up to distance characters from word, including word'''
+    results = {word}
+    layer = {word}
+    for _ in range(distance):
+        layer = {variant[:i] + variant[i + 1:] for variant in layer for i in range(len(variant))}
+        results |= layer
+    return results
+
+
+class FuzzyMatcher(TokenMatcher):
+    """
+    A typo tolerant token matcher (ScoringModule.matcher = 'fuzzy') correcting misspelled tokens ("embarassed",
+    "anxous") to the closest single word entry of the wordlist. The wordlist is indexed once with the symmetric delete
+    method: every string obtained by deleting up to max_edit_distance characters from a word points to that word, so
+    the candidates of a token are found with a few dictionary lookups of its own deletes and only those candidates are
+    compared with the token. Each distinct token is corrected once (see TokenMatcher.entry).
+    Tokens that are wordlist words are never corrected, and the allowed distance grows with the length of the token
+    (see max_distance) so that short words are not corrected into other short words. Tokens longer than the longest
+    word plus the allowed distance are skipped without generating their deletes.
+
+    ...
+
+    Attributes
+    ----------
+    max_edit_distance : int
+        The largest number of insertions, deletions, substitutions or transpositions corrected
+    min_length : int
+        Tokens shorter than this are not corrected. Tokens of at least twice this length allow two edits.
+    deletes : dict
+        Maps each delete of a wordlist word to the words it was obtained from
+    corrections : dict
+        Maps each corrected token to its correction and edit distance. Dropped with the vocabulary (see reset),
+        except for the corrections applied.
+    applied : dict
+        The number of times each correction was applied in the items scored, counted by Survey.score once per item
+        (see add_applied), whether the item was matched, shared the matches of an identical item or found them cached
+
+    Methods
+    -------
+    max_distance(token)
+        returns the largest edit distance corrected for a token
+    correct(token)
+        returns the correction of a token and its edit distance, or None
+    corrected(sentence)
+        returns the tokens of a sentence matched through a correction
+    add_applied(sentence, times)
+        counts the corrections applied in a sentence
+    report()
+        returns the corrections applied, most frequent first
+    """
+    max_edit_distance = 2
+    min_length = 4
+
+    def __init__(self, words, acceptable_prev_chars: str = '', acceptable_next_chars: str = '',
+                 max_edit_distance: int = None) -> None:
+        super().__init__(words, acceptable_prev_chars, acceptable_next_chars)
+        if max_edit_distance is not None:
+            self.max_edit_distance = max_edit_distance
+        # The position of each word, so that ties are corrected to the first word of the wordlist
+        self.order = {}
+        self.deletes = defaultdict(list)
+        for word, indexed in self.index.items():
+            if indexed[0] is None or len(word) < self.min_length:
+                continue
+            self.order[word] = len(self.order)
+            for variant in deletes(word, self.max_distance(word)):
+                self.deletes[variant].append(word)
+        self.longest = max(map(len, self.order), default=0)
+        self.corrections = {}
+        self.applied = defaultdict(int)
+        return
+
+    def reset(self) -> None:
+        super().reset()
+        # The applied corrections are kept for report
+        self.corrections = {token: self.corrections[token] for token in self.applied if token in self.corrections}
+        return
+
+    def max_distance(self, token: str) -> int:
+        if len(token) < self.min_length:
+            return 0
+        return min(self.max_edit_distance, 1 if len(token) < 2 * self.min_length else 2)
+
+    def correct(self, token: str):
+        '''
+        Finds the closest wordlist word to a token
+
+                Parameters:
+                        token (str): The token
+                Returns:
+                        correction (tuple): The wordlist word and its edit distance, or None if no word is close enough
+        '''
+        limit = self.max_distance(token)
+        # Tokens far longer than every word (e.g. pasted text without spaces) are not compared
+        if limit == 0 or len(token) > self.longest + limit:
+            return None
+        best = None
+        seen = set()
+        for variant in deletes(token, limit):
+            for word in self.deletes.get(variant, ()):
+                if word in seen:
+                    continue
+                seen.add(word)
+                # A word is only corrected to within its own allowed distance
+                distance = edit_distance(token, word, min(limit, self.max_distance(word)))
+                if distance > min(limit, self.max_distance(word)):
+                    continue
+                if best is None or (distance, self.order[word]) < (best[1], self.order[best[0]]):
+                    best = (word, distance)
+        return best
+
+    def entry(self, token: str):
+        entry = super().entry(token)
+        if entry is not None and entry[0]:
+            return entry
+        correction = self.correct(token)
+        if correction is None:
+            return entry
+        self.corrections[token] = correction
+        logger.debug("Correcting '%s' to '%s' (edit distance %d)", token, correction[0], correction[1])
+        return (correction[0],), entry[1] if entry is not None else []
+
+    def corrected(self, sentence: str) -> list:
+        '''
+        Finds the tokens of a cleaned sentence that are matched through a correction. The tokens within a longer
+        wordlist word (a phrase) are not corrected and not returned.
+
+                Parameters:
+                        sentence (str): The cleaned sentence
+                Returns:
+                        tokens (list): The corrected tokens, in order, empty if the regex must be used
+        '''
+        found = self.matches(sentence)
+        if not found:
+            return []
+        corrections = self.corrections
+        return [sentence[start:stop] for word, start, stop in found if sentence[start:stop] in corrections]
+
+    def add_applied(self, sentence: str, times: int = 1) -> None:
+        '''
+        Counts the corrections applied in a cleaned sentence (applied)
+
+                Parameters:
+                        sentence (str): The cleaned sentence
+                        times (int): The number of items the sentence stands for
+                Returns:
+
+        '''
+        for token in self.corrected(sentence):
+            self.applied[token] += times
+        return
+
+    def report(self) -> list:
+        '''
+        Returns the corrections applied in the items scored (see applied)
+
+                Parameters:
+
+                Returns:
+                        corrections (list): A dictionary per corrected token with the token, its correction, the edit
+                                            distance and the number of times it was corrected, most frequent first
+        '''
+        report = [{'token': token, 'correction': self.corrections[token][0], 'distance': self.corrections[token][1],
+                   'count': count} for token, count in self.applied.items()]
+        return sorted(report, key=lambda correction: correction['count'], reverse=True)
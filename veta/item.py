@@ -1,7 +1,9 @@
 from veta.wordlist import Wordlist
 from veta.scoring_modules.scoring_module import ScoringModule
-from veta.logger import get_logger
+from veta.normalization import Normalizer
+from veta.logger import get_logger, per_item_level
 import inspect
+import sys
 
 # Initialize logger for this module
 logger = get_logger('item')
@@ -27,39 +29,99 @@ class Item:
         The keys are the scoring module ids, the values are the corresponding scores.
     wordlist: Wordlist
         The wordlist object used to produce the associated scores.
+    language: str
+        The language of the response ('en', 'de', 'he', 'ar', ...), set explicitly or by Survey.detect_languages.
+        Survey.score scores the item with the wordlist and the scoring modules of its language. None uses the
+        survey's wordlist and the language of the modules.
+    matches: dict
+        The wordlist matches of the self and other sentences, shared by all of the scoring modules that use the same
+        wordlist, language and sentence length limit (ScoringModule.match_key). Filled in by ScoringModule.match_item, None until the item is matched. Survey.score
+        drops them once the survey is scored, unless they are indexed (index_terms).
+    raw_input: str
+        The self and other sentences as given, joined by ". ". If the raw input was dropped (keep_raw_input = False),
+        it is rebuilt from the cleaned sentences.
+    full_sentence: str
+        The cleaned raw input, computed when accessed.
+    keep_raw_input: bool
+        Class wide default deciding whether new items keep their raw input. Set Item.keep_raw_input = False to save memory
+        on large surveys.
+    normalizer: Normalizer
+        Class wide normalization used by clean_sentence, e.g. Item.normalizer = Normalizer('he', strip_diacritics=True)
     Methods
     -------
     add_additional_info(id, info)
         adds a key (id), value (info) pair to the scores dictionary
     clean_sentence(sentence: str)
         preps the sentence to be scored
+    drop_raw_input()
+        drops the raw input of the item to save memory
     score(scoring_module: ScoringModule)
         applies the given scoring module and adds the score to the scores dictionary
+    compute_scores(scoring_module: ScoringModule)
+        applies the given scoring module and returns the scores without adding them
+    compute_scores_unbound(scoring_module)
+        compute_scores for duck typed modules that are not ScoringModule instances
     add_wordlist(wordlist: Wordlist)
         sets the wordlist for the item
     """
-    def __init__(self, self_sentence: str, other_sentence: str = "") -> None:
+    __slots__ = ('_raw_input', 'self_sentence', 'other_sentence', 'scores', 'matches', 'wordlist', 'language')
+
+    keep_raw_input = True
+    normalizer = Normalizer()
+
+    def __init__(self, self_sentence: str, other_sentence: str = "", keep_raw_input: bool = None, language: str = None) -> None:
         '''
-        Initializes the Item class
+        Initializes the Item class. The cleaned sentences are interned, so identical answers share a single string.
 
                 Parameters:
                         self_sentence (str): The entire response to an LEAS question or the components of the LEAS question response referencing the 'self'. 
                         other_sentence (str): the components of the LEAS question response referencing the 'other'.
+                        keep_raw_input (bool): Whether to keep the raw input after cleaning. Defaults to Item.keep_raw_input.
+                        language (str): The language of the response, None if unknown
 
                 Returns:
 
         '''
-        logger.debug(f"Initializing Item with self_sentence length: {len(self_sentence)}, other_sentence length: {len(other_sentence)}")
+        logger.debug("Initializing Item with self_sentence length: %d, other_sentence length: %d", len(self_sentence), len(other_sentence))
         
-        self.raw_input = self_sentence +". " + other_sentence
-        self.full_sentence = self.clean_sentence(self.raw_input)
-        self.self_sentence = self.clean_sentence(self_sentence)
-        self.other_sentence = self.clean_sentence(other_sentence)
+        if keep_raw_input is None:
+            keep_raw_input = self.keep_raw_input
+        self._raw_input = None
+        if keep_raw_input:
+            self._raw_input = sys.intern(self_sentence +". " + other_sentence)
+        self.self_sentence = sys.intern(self.clean_sentence(self_sentence))
+        self.other_sentence = sys.intern(self.clean_sentence(other_sentence))
         self.scores = {}
+        self.matches = None
 
         self.wordlist = None
+        self.language = language
 
-        logger.info(f"Created Item with full_sentence: '{self.full_sentence[:50]}{'...' if len(self.full_sentence) > 50 else ''}'")
+        level = per_item_level(logger)
+        if level:
+            logger.log(level, "Created Item with self_sentence: '%s%s'", self.self_sentence[:50], '...' if len(self.self_sentence) > 50 else '')
+        return
+
+    @property
+    def raw_input(self) -> str:
+        if self._raw_input is None:
+            return self.self_sentence + ". " + self.other_sentence
+        return self._raw_input
+
+    @property
+    def full_sentence(self) -> str:
+        return self.clean_sentence(self.raw_input)
+
+    def drop_raw_input(self) -> None:
+        '''
+        Drops the raw input of the item to save memory. raw_input and full_sentence are then rebuilt from the cleaned sentences.
+
+                Parameters:
+
+                Returns:
+
+        '''
+        self._raw_input = None
         return
 
     def __str__(self):
@@ -87,13 +149,14 @@ class Item:
                 Returns:
 
         '''
-        logger.debug(f"Adding additional info to Item: {id} = {info}")
+        logger.debug("Adding additional info to Item: %s = %s", id, info)
         self.scores[id] = info
         return
 
     def clean_sentence(self, sentence: str) -> str:
         '''
         Cleans a string for further processing by the standard LEAS scoring modules. Removes punctuation and capitalization
+        using Item.normalizer, which can be replaced by a Normalizer with language specific options.
 
                 Parameters:
                         sentence (str): The string that will be cleaned. 
@@ -101,49 +164,96 @@ class Item:
                         sentence (str): The cleaned string 
 
         '''
-        sentence = str(sentence).lower()
-        for c in sentence:
-            if c in "_–,-,.?!;:/()$\n\r\t":
-                sentence = sentence.replace(c,' ')
-        sentence = sentence.replace("  ",' ').strip()
-        return sentence
+        return self.normalizer.normalize(sentence)
 
     def score(self, scoring_module: ScoringModule) -> None:
         '''
         Scores the Item using the given scoring module. The score is added to the scores dictionary as follows: scores[scoring_module.id] = value
+        Modules returning a tuple add scores[scoring_module.id + str(i+1)] for each value and modules returning a dict add each of its keys.
 
                 Parameters:
                         scoring_module (ScoringModule): The scoring module that will be applied. 
                 Returns:
 
         '''
+        self.scores.update(self.compute_scores(scoring_module))
+        return
+
+    def compute_scores(self, scoring_module: ScoringModule) -> dict:
+        '''
+        Applies the given scoring module without modifying the scores dictionary. Used to score an item once and copy
+        the scores to identical items.
+
+                Parameters:
+                        scoring_module (ScoringModule): The scoring module that will be applied. 
+                Returns:
+                        scores (dict): The scores that Item.score would add, keyed as described in Item.score
+        '''
+        scorer = scoring_module.scorer if isinstance(scoring_module, ScoringModule) else None
+        if scorer is None:
+            return self.compute_scores_unbound(scoring_module)
+
+        try:
+            if scoring_module.needs_wordlist and not isinstance(self.wordlist, Wordlist):
+                logger.error("Scoring Error: Item does not have a wordlist for module %s", scoring_module.id,
+                             extra={'module_id': scoring_module.id})
+                raise Exception("Scoring Error: Item does not have a wordlist")
+            scres = scorer(self, self.wordlist)
+
+            if scoring_module.returns_tuple or (scoring_module.returns_tuple is None and isinstance(scres, tuple)):
+                scores = dict(zip(scoring_module.tuple_ids(len(scres)), scres))
+            elif isinstance(scres, dict):
+                scores = dict(scres)
+            else:
+                scores = {scoring_module.id: scres}
+
+        except Exception as e:
+            logger.error("Error scoring Item with module %s: %s", scoring_module.id, e, extra={'module_id': scoring_module.id})
+            raise
+
+        return scores
+
+    def compute_scores_unbound(self, scoring_module) -> dict:
+        '''
+        Applies a scoring module that was not constructed as a ScoringModule (e.g. a duck typed module), deciding
+        whether to pass the wordlist from the signature of its execute method.
+
+                Parameters:
+                        scoring_module (any): An object with id and execute attributes
+                Returns:
+                        scores (dict): The scores that Item.score would add, keyed as described in Item.score
+        '''
         module_id = getattr(scoring_module, 'id', str(scoring_module))
-        logger.debug(f"Scoring Item with module: {module_id}")
+        logger.debug("Scoring Item with module: %s", module_id)
         
         try:
             if len(inspect.signature(scoring_module.execute).parameters) < 2:
                 scres = scoring_module.execute(self)
-                logger.debug(f"Executed module {module_id} without wordlist")
+                logger.debug("Executed module %s without wordlist", module_id)
             elif isinstance(self.wordlist, Wordlist):
                 scres = scoring_module.execute(self, self.wordlist)
-                logger.debug(f"Executed module {module_id} with wordlist")
+                logger.debug("Executed module %s with wordlist", module_id)
             else:
-                logger.error(f"Scoring Error: Item does not have a wordlist for module {module_id}")
+                logger.error("Scoring Error: Item does not have a wordlist for module %s", module_id)
                 raise Exception("Scoring Error: Item does not have a wordlist")
             
             if isinstance(scres,tuple):
-                logger.debug(f"Module {module_id} returned tuple with {len(scres)} values")
+                logger.debug("Module %s returned tuple with %d values", module_id, len(scres))
+                scores = {}
                 for i in range(len(scres)):
-                    self.scores[scoring_module.id+str(i+1)] = scres[i]
+                    scores[scoring_module.id+str(i+1)] = scres[i]
+            elif isinstance(scres,dict):
+                logger.debug("Module %s returned %d named values", module_id, len(scres))
+                scores = dict(scres)
             else:
-                logger.debug(f"Module {module_id} returned single value: {scres}")
-                self.scores[scoring_module.id] = scres
+                logger.debug("Module %s returned single value: %s", module_id, scres)
+                scores = {scoring_module.id: scres}
                 
         except Exception as e:
-            logger.error(f"Error scoring Item with module {module_id}: {str(e)}")
+            logger.error("Error scoring Item with module %s: %s", module_id, e, extra={'module_id': module_id})
             raise
         
-        return
+        return scores
 
     def add_wordlist(self, wordlist: Wordlist) -> None: 
         '''
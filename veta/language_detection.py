@@ -0,0 +1,47 @@
+import re
+
+# The letters of the scripts told apart by detect_language, as character class ranges
+SCRIPTS = {
+    'he': '\u0590-\u05ff\ufb1d-\ufb4f',
+    'ar': '\u0600-\u06ff\u0750-\u077f\u08a0-\u08ff\ufb50-\ufdff\ufe70-\ufeff',
+    'latin': 'a-zA-Z\u00c0-\u024f',
+}
+# Frequent function words of the languages written in the Latin script, without the words they share ("so", "in")
+# or that are frequent in both ("die", "was")
+FUNCTION_WORDS = {
+    'en': {'i', 'and', 'the', 'a', 'is', 'am', 'are', 'my', 'me', 'to', 'of', 'it', 'that', 'not', 'would', 'feel',
+           'be', 'with', 'very', 'he', 'she', 'they', 'you', 'we', 'but', 'because', 'at', 'this', 'have', 'for'},
+    'de': {'ich', 'und', 'der', 'das', 'ist', 'bin', 'sind', 'mein', 'mich', 'mir', 'zu', 'nicht', 'würde', 'fühle',
+           'sein', 'mit', 'sehr', 'er', 'sie', 'es', 'wir', 'aber', 'weil', 'auf', 'ein', 'eine', 'dass', 'habe', 'für'},
+}
+# Letters only used by German among the Latin script languages
+GERMAN_LETTERS = 'äöüß'
+
+_SCRIPT_LETTERS = {script: re.compile(f'[{letters}]') for script, letters in SCRIPTS.items()}
+_WORD = re.compile(r'\w+')
+
+def detect_language(text: str, default: str = 'en') -> str:
+    '''
+    Guesses the language of a text from the script of its letters: Hebrew, Arabic, or for the Latin script German or
+    English from their function words and the German letters. Meant to route a survey response to the wordlist of its
+    language, not as a general language identifier.
+
+            Parameters:
+                    text (str): The text, e.g. the raw input of an item
+                    default (str): The language returned when the text gives no evidence or a tie
+            Returns:
+                    language (str): 'he', 'ar', 'de', 'en' or the default
+    '''
+    letters = {script: len(pattern.findall(text)) for script, pattern in _SCRIPT_LETTERS.items()}
+    script = max(letters, key=letters.get)
+    if letters[script] == 0:
+        return default
+    if script != 'latin':
+        return script
+    words = _WORD.findall(text.lower())
+    evidence = {language: sum(word in function_words for word in words)
+                for language, function_words in FUNCTION_WORDS.items()}
+    evidence['de'] += sum(text.lower().count(letter) for letter in GERMAN_LETTERS)
+    if evidence['de'] == evidence['en']:
+        return default
+    return 'de' if evidence['de'] > evidence['en'] else 'en'
@@ -0,0 +1,153 @@
+import spacy
+
+from veta.token_matcher import TokenMatcher, Vocabulary
+from veta.logger import get_logger
+
+logger = get_logger('lemmatization')
+
+# The spaCy model of each language
+MODELS = {
+    'en': "en_core_web_sm",
+    'de': "de_core_news_sm",
+}
+# The pipeline components kept to lemmatize: the lemmatizer and the components its lemmas depend on (the rule based
+# English lemmatizer uses the part of speech tags, the German one the shared token vectors)
+LEMMA_COMPONENTS = ('tok2vec', 'tagger', 'attribute_ruler', 'morphologizer', 'lemmatizer', 'trainable_lemmatizer')
+
+class Lemmatizer:
+    """
+    A cached spaCy lemmatizer. Each distinct token is lemmatized once, in batches with nlp.pipe, and its lemma is
+    interned in a lemma vocabulary so that matchers compare integer lemma ids. One Lemmatizer per language is shared
+    by all the matchers (Lemmatizer.get), so a token seen in several items, modules or wordlists is lemmatized once.
+
+    ...
+
+    Attributes
+    ----------
+    language : str
+        The language of the tokens ('en' or 'de')
+    nlp : spacy.Language
+        The spaCy pipeline, loaded on first use with only the lemmatizer and the components it needs enabled
+    lemmas : Vocabulary
+        The lemma vocabulary, interning every lemma as an id
+    ids : dict
+        Maps each token lemmatized so far to the id of its lemma. Dropped when it holds more than
+        TokenMatcher.max_vocabulary tokens; the lemma ids stay the same.
+
+    Methods
+    -------
+    get(language)
+        returns the shared Lemmatizer of a language
+    lemma_ids(tokens)
+        returns the lemma id of each token, lemmatizing the new ones in one batch
+    lemma(token)
+        returns the lemma of a token
+    """
+    lemmatizers = {}
+
+    def __init__(self, language: str = 'en', nlp=None) -> None:
+        '''
+        Initializes the Lemmatizer class
+
+                Parameters:
+                        language (str): The language of the tokens
+                        nlp (spacy.Language): The pipeline to use instead of the spaCy model of the language
+                Returns:
+
+        '''
+        if nlp is None and language not in MODELS:
+            raise ValueError(f"No spaCy model for language {language}, lemma matching supports {', '.join(MODELS)}")
+        self.language = language
+        self._nlp = nlp
+        self.lemmas = Vocabulary()
+        self.ids = {}
+        return
+
+    @classmethod
+    def get(cls, language: str):
+        lemmatizer = cls.lemmatizers.get(language)
+        if lemmatizer is None:
+            lemmatizer = cls.lemmatizers[language] = cls(language)
+        return lemmatizer
+
+    @property
+    def nlp(self):
+        if self._nlp is None:
+            model = MODELS[self.language]
+            try:
+                nlp = spacy.load(model)
+            except OSError:
+                logger.error("SpaCy model %s not available for lemma matching", model)
+                raise RuntimeError(f"SpaCy model {model} not available. Please install with: python -m spacy download {model}")
+            nlp.select_pipes(enable=[name for name in nlp.pipe_names if name in LEMMA_COMPONENTS])
+            logger.info("Loaded %s for lemma matching with %s", model, ', '.join(nlp.pipe_names))
+            self._nlp = nlp
+        return self._nlp
+
+    def lemma_ids(self, tokens) -> list:
+        '''
+        Returns the lemma id of each token
+
+                Parameters:
+                        tokens (list): The tokens
+                Returns:
+                        ids (list): The id of the lemma of each token in the lemma vocabulary
+        '''
+        ids = self.ids
+        new = list(dict.fromkeys(token for token in tokens if token not in ids))
+        if new and len(ids) > TokenMatcher.max_vocabulary:
+            # Bounded like the token vocabularies, the lemma vocabulary and ids are kept
+            ids.clear()
+            new = list(dict.fromkeys(tokens))
+        if new:
+            intern = self.lemmas.intern
+            for token, doc in zip(new, self.nlp.pipe(new)):
+                ids[token] = intern(''.join(word.lemma_ for word in doc).lower() or token)
+        return [ids[token] for token in tokens]
+
+    def lemma(self, token: str) -> str:
+        return self.lemmas.tokens[self.lemma_ids([token])[0]]
+
+
+class LemmaMatcher(TokenMatcher):
+    """
+    A token matcher comparing lemmas instead of surface forms (ScoringModule.matcher = 'lemma'), so that a single
+    wordlist entry matches all of its inflections ("sad" matches "sadder"). The single word entries of the wordlist
+    are indexed by lemma id, and each new token of the vocabulary is lemmatized once in a batch when the matcher
+    first sees it (see TokenMatcher.entry). A token equal to a wordlist word is reported as that word; the other
+    tokens are reported as the wordlist word sharing their lemma, the one equal to the lemma or else the first one.
+    Phrases are still matched on their surface form.
+
+    ...
+
+    Attributes
+    ----------
+    lemmatizer : Lemmatizer
+        The cached lemmatizer
+    lemma_index : dict
+        Maps the lemma id of each single word entry to the wordlist word reported
+    """
+    def __init__(self, words, acceptable_prev_chars: str = '', acceptable_next_chars: str = '', lemmatizer=None) -> None:
+        super().__init__(words, acceptable_prev_chars, acceptable_next_chars)
+        self.lemmatizer = lemmatizer if lemmatizer is not None else Lemmatizer()
+        singles = [indexed[0] for indexed in self.index.values() if indexed[0] is not None]
+        self.lemma_index = {}
+        for word, id in zip(singles, self.lemmatizer.lemma_ids(singles)):
+            if id not in self.lemma_index or word == self.lemmatizer.lemmas.tokens[id]:
+                self.lemma_index[id] = word
+        return
+
+    def _extend(self) -> list:
+        # Lemmatize the new tokens in one batch before computing their entries
+        self.lemmatizer.lemma_ids(self.vocabulary.tokens[len(self.starts):])
+        return super()._extend()
+
+    def entry(self, token: str):
+        entry = super().entry(token)
+        if entry is not None and entry[0]:
+            # A token equal to a wordlist word is reported as that word, not as the word sharing its lemma
+            return entry
+        word = self.lemma_index.get(self.lemmatizer.lemma_ids([token])[0])
+        if word is None:
+            return entry
+        return (word,), entry[1] if entry is not None else []
@@ -7,11 +7,18 @@ This module provides:
 3. Detailed formatting including function name and line number
 4. File output with automatic log file generation
 5. Easy initialization from any part of the codebase
+6. Optional queue based (non-blocking) output and JSON-lines records for log ingestion
 """
 
 import logging
+import logging.handlers
 import sys
 import os
+import json
+import uuid
+import queue
+import atexit
+import multiprocessing
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union
@@ -112,6 +119,51 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
+class JsonFormatter(logging.Formatter):
+    """
+    Formatter writing every record as one JSON object per line.
+    
+    Besides the usual fields, records carry the run id of the logging setup and the module id
+    and respondent id given through ``extra={'module_id': ..., 'respondent_id': ...}`` (None otherwise).
+    """
+    
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, '%Y-%m-%dT%H:%M:%S'),
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "line": record.lineno,
+            "process": record.process,
+            "message": record.getMessage(),
+            "run_id": getattr(record, 'run_id', None),
+            "module_id": getattr(record, 'module_id', None),
+            "respondent_id": getattr(record, 'respondent_id', None),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class RunContextFilter(logging.Filter):
+    """Filter adding the run id (and empty module/respondent ids) to records that do not have them."""
+    
+    def __init__(self, run_id: str):
+        super().__init__()
+        self.run_id = run_id
+    
+    def filter(self, record):
+        if not hasattr(record, 'run_id'):
+            record.run_id = self.run_id
+        if not hasattr(record, 'module_id'):
+            record.module_id = None
+        if not hasattr(record, 'respondent_id'):
+            record.respondent_id = None
+        return True
+
+
 class VetaLogger:
     """
     Main logger class for the veta package.
@@ -122,6 +174,16 @@ class VetaLogger:
     
     _instance = None
     _initialized = False
+
+    # Level and sampling of the messages logged once per item or respondent (see per_item_level)
+    per_item_level = logging.INFO
+    per_item_sample = 1
+    _per_item_count = 0
+
+    # Queue based output (see setup(use_queue=True))
+    run_id = None
+    log_queue = None
+    _listener = None
     
     def __new__(cls):
         """Singleton pattern to ensure only one logger instance."""
@@ -143,7 +205,13 @@ class VetaLogger:
               console_output: bool = True,
               file_level: Union[str, int] = logging.DEBUG,
               console_level: Union[str, int] = logging.INFO,
-              auto_generate_file: bool = True) -> None:
+              auto_generate_file: bool = True,
+              profile: str = 'default',
+              sample_every: int = 1000,
+              use_queue: bool = False,
+              multiprocess: bool = False,
+              json_format: bool = False,
+              run_id: Optional[str] = None) -> None:
         """
         Set up the logger with specified configuration.
         
@@ -162,11 +230,43 @@ class VetaLogger:
             Logging level for console output (default: INFO)
         auto_generate_file : bool
             Whether to auto-generate log file if none specified (default: True)
+        profile : str
+            'default' logs the per item and per respondent messages at INFO. 'performance' demotes them
+            to DEBUG and only logs one in every sample_every of them, so that INFO runs stay fast.
+        sample_every : int
+            Sampling period of the per item messages in the performance profile (default: 1000)
+        use_queue : bool
+            Send records to a queue and let a QueueListener thread format and write them,
+            so the scoring thread does no I/O (default: False)
+        multiprocess : bool
+            Use a multiprocessing queue, so worker processes can log through
+            setup_worker_logging(get_log_queue(), get_run_id()) (default: False, implies use_queue)
+        json_format : bool
+            Write the log file as JSON lines (see JsonFormatter) instead of plain text (default: False)
+        run_id : str, optional
+            Identifier added to every record. Generated if None.
         """
         
+        if profile == 'performance':
+            VetaLogger.per_item_level = logging.DEBUG
+            VetaLogger.per_item_sample = max(1, int(sample_every))
+        elif profile == 'default':
+            VetaLogger.per_item_level = logging.INFO
+            VetaLogger.per_item_sample = 1
+        else:
+            raise ValueError(f"Unknown logging profile: {profile}")
+        VetaLogger._per_item_count = 0
+
         # Clear any existing handlers to avoid duplicates
+        self._stop_listener()
         if self._handlers_added:
+            for handler in self.logger.handlers:
+                handler.close()
             self.logger.handlers.clear()
+
+        VetaLogger.run_id = run_id or uuid.uuid4().hex
+        context = RunContextFilter(VetaLogger.run_id)
+        handlers = []
         
         # Convert string levels to integers if needed
         if isinstance(level, str):
@@ -183,7 +283,7 @@ class VetaLogger:
             console_handler = logging.StreamHandler(sys.stderr)
             console_handler.setLevel(console_level)
             console_handler.setFormatter(ColoredFormatter(use_colors=True))
-            self.logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # Set up file handler
         if log_file or auto_generate_file:
@@ -197,19 +297,80 @@ class VetaLogger:
                 
                 file_handler = logging.FileHandler(log_file, mode='a')
                 file_handler.setLevel(file_level)
-                # Use plain formatter for file (no colors)
-                file_formatter = logging.Formatter(
-                    fmt="%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d | %(message)s",
-                    datefmt='%Y-%m-%d %H:%M:%S'
-                )
+                if json_format:
+                    file_formatter = JsonFormatter()
+                else:
+                    # Use plain formatter for file (no colors)
+                    file_formatter = logging.Formatter(
+                        fmt="%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d | %(message)s",
+                        datefmt='%Y-%m-%d %H:%M:%S'
+                    )
                 file_handler.setFormatter(file_formatter)
-                self.logger.addHandler(file_handler)
-                
-                self.logger.info(f"Logging to file: {log_file}")
+                handlers.append(file_handler)
+
+        if use_queue or multiprocess:
+            # The listener thread formats and writes the records queued by the logging calls
+            VetaLogger.log_queue = multiprocessing.Queue(-1) if multiprocess else queue.SimpleQueue()
+            for handler in handlers:
+                handler.addFilter(context)
+            queue_handler = logging.handlers.QueueHandler(VetaLogger.log_queue)
+            queue_handler.addFilter(context)
+            self.logger.addHandler(queue_handler)
+            VetaLogger._listener = logging.handlers.QueueListener(VetaLogger.log_queue, *handlers, respect_handler_level=True)
+            VetaLogger._listener.start()
+        else:
+            VetaLogger.log_queue = None
+            for handler in handlers:
+                handler.addFilter(context)
+                self.logger.addHandler(handler)
+
+        if log_file:
+            self.logger.info("Logging to file: %s", log_file)
         
         self._handlers_added = True
         self.logger.info("Veta logging system initialized")
     
+    def _stop_listener(self) -> None:
+        """Stop the queue listener, writing out the records still in the queue."""
+        listener = VetaLogger._listener
+        if listener is not None:
+            VetaLogger._listener = None
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+    
+    def shutdown(self) -> None:
+        """Flush and stop the queue based output, if any."""
+        self._stop_listener()
+    
+    def setup_worker(self, log_queue, run_id: Optional[str] = None, level: Union[str, int] = logging.DEBUG) -> None:
+        """
+        Send the records of this (worker) process to the queue of the main process.
+        
+        Parameters:
+        -----------
+        log_queue : multiprocessing.Queue
+            The queue returned by get_log_queue() in the main process
+        run_id : str, optional
+            The run id of the main process (get_run_id())
+        level : str or int
+            Logging level of the worker (default: DEBUG, the main process handlers filter further)
+        """
+        if isinstance(level, str):
+            level = getattr(logging, level.upper())
+        # A listener inherited from the main process (fork) belongs to that process, never stop it here
+        VetaLogger._listener = None
+        for handler in self.logger.handlers:
+            handler.close()
+        self.logger.handlers.clear()
+        VetaLogger.run_id = run_id or VetaLogger.run_id or uuid.uuid4().hex
+        VetaLogger.log_queue = log_queue
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.addFilter(RunContextFilter(VetaLogger.run_id))
+        self.logger.addHandler(queue_handler)
+        self.logger.setLevel(level)
+        self._handlers_added = True
+    
     def _generate_log_filename(self) -> str:
         """Generate an automatic log filename based on current timestamp."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -260,7 +421,13 @@ def setup_logging(level: Union[str, int] = logging.INFO,
                  console_output: bool = True,
                  file_level: Union[str, int] = logging.DEBUG,
                  console_level: Union[str, int] = logging.INFO,
-                 auto_generate_file: bool = True) -> None:
+                 auto_generate_file: bool = True,
+                 profile: str = 'default',
+                 sample_every: int = 1000,
+                 use_queue: bool = False,
+                 multiprocess: bool = False,
+                 json_format: bool = False,
+                 run_id: Optional[str] = None) -> None:
     """
     Set up logging for the veta package.
     
@@ -282,6 +449,20 @@ def setup_logging(level: Union[str, int] = logging.INFO,
         Logging level for console output (default: INFO)
     auto_generate_file : bool
         Whether to auto-generate log file if none specified (default: True)
+    profile : str
+        'default' or 'performance'. The performance profile logs the per item and per respondent
+        messages at DEBUG, sampling one in every sample_every of them.
+    sample_every : int
+        Sampling period of the per item messages in the performance profile (default: 1000)
+    use_queue : bool
+        Format and write records on a QueueListener thread instead of the calling thread (default: False)
+    multiprocess : bool
+        Use a multiprocessing queue so that worker processes can log to the same handlers
+        with setup_worker_logging (default: False)
+    json_format : bool
+        Write the log file as JSON lines with run_id, module_id and respondent_id fields (default: False)
+    run_id : str, optional
+        Identifier added to every record. Generated if None.
     
     Examples:
     ---------
@@ -293,6 +474,12 @@ def setup_logging(level: Union[str, int] = logging.INFO,
     
     >>> # Console-only logging
     >>> setup_logging(auto_generate_file=False)
+    
+    >>> # Keep INFO runs on large surveys fast
+    >>> setup_logging(profile='performance')
+    
+    >>> # Non-blocking JSON-lines output shared with worker processes
+    >>> setup_logging(multiprocess=True, json_format=True, log_file='run.jsonl')
     """
     _veta_logger.setup(
         level=level,
@@ -300,10 +487,59 @@ def setup_logging(level: Union[str, int] = logging.INFO,
         console_output=console_output,
         file_level=file_level,
         console_level=console_level,
-        auto_generate_file=auto_generate_file
+        auto_generate_file=auto_generate_file,
+        profile=profile,
+        sample_every=sample_every,
+        use_queue=use_queue,
+        multiprocess=multiprocess,
+        json_format=json_format,
+        run_id=run_id
     )
 
 
+def setup_worker_logging(log_queue, run_id: Optional[str] = None, level: Union[str, int] = logging.DEBUG) -> None:
+    """
+    Set up logging in a worker process so that its records are written by the main process.
+    
+    Parameters:
+    -----------
+    log_queue : multiprocessing.Queue
+        The queue returned by get_log_queue() in the main process, which must have
+        called setup_logging(multiprocess=True)
+    run_id : str, optional
+        The run id of the main process, returned by get_run_id()
+    level : str or int
+        Logging level of the worker (default: DEBUG)
+    
+    Examples:
+    ---------
+    >>> setup_logging(multiprocess=True, json_format=True)
+    >>> pool = multiprocessing.Pool(4, initializer=setup_worker_logging,
+    ...                             initargs=(get_log_queue(), get_run_id()))
+    """
+    _veta_logger.setup_worker(log_queue, run_id=run_id, level=level)
+
+
+def get_log_queue():
+    """Return the queue of the queue based output, or None if it is not enabled."""
+    return VetaLogger.log_queue
+
+
+def get_run_id() -> Optional[str]:
+    """Return the run id added to every log record."""
+    return VetaLogger.run_id
+
+
+def shutdown_logging() -> None:
+    """
+    Flush and stop the queue based output. Called automatically at exit.
+    """
+    _veta_logger.shutdown()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Get a logger for use in veta modules.
@@ -342,6 +578,39 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     return _veta_logger.get_logger(name)
 
 
+def per_item_level(logger: logging.Logger) -> int:
+    """
+    Get the level at which a per item (or per respondent) message should be logged.
+    
+    Hot paths call this before formatting the message, so that nothing is formatted
+    when the message would be filtered out or skipped by sampling.
+    
+    Parameters:
+    -----------
+    logger : logging.Logger
+        The logger the message would be sent to
+        
+    Returns:
+    --------
+    int
+        The level to log the message at, or 0 if it should be skipped
+        
+    Examples:
+    ---------
+    >>> level = per_item_level(logger)
+    >>> if level:
+    ...     logger.log(level, "Created item %s", item_id)
+    """
+    level = VetaLogger.per_item_level
+    if not logger.isEnabledFor(level):
+        return 0
+    if VetaLogger.per_item_sample > 1:
+        VetaLogger._per_item_count += 1
+        if VetaLogger._per_item_count % VetaLogger.per_item_sample:
+            return 0
+    return level
+
+
 # Convenience function to get caller info for manual logging
 def get_caller_info(frame_offset: int = 1) -> tuple:
     """
@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from veta.logger import get_logger
+
+# Initialize logger for this module
+logger = get_logger('match_cache')
+
+# Bump when the matching rules change so that stale results are discarded
+MATCH_CACHE_VERSION = "1"
+
+class MatchCache:
+    """
+    A persistent, size bounded cache of wordlist matches stored in a sqlite database in a local directory.
+    Entries map (cleaned sentence hash, wordlist fingerprint, language) to the words found in the sentence and
+    their counts, so re-running a survey (or scoring overlapping cohorts) skips matching the sentences already seen.
+    The least recently used entries are evicted once the cache holds more than max_entries.
+
+    Enable it for every scoring module with ScoringModule.match_cache = MatchCache(directory), or for a single
+    module by setting the attribute on the module.
+
+    ...
+
+    Attributes
+    ----------
+    path : str
+        The path to the sqlite database
+    max_entries : int
+        The maximum number of cached sentences
+    hits : int
+        The number of lookups answered by the cache
+    misses : int
+        The number of lookups that had to run the matcher
+
+    Methods
+    -------
+    get(sentence, fingerprint, language)
+        returns the cached word counts of a sentence, or None
+    put(sentence, fingerprint, language, word_counts)
+        stores the word counts of a sentence
+    stats()
+        returns the hit/miss counters and the number of entries
+    clear()
+        removes every entry
+    flush()
+        writes the pending changes to disk
+    close()
+        flushes and closes the database
+    """
+    filename = "match_cache.sqlite"
+
+    def __init__(self, directory: str, max_entries: int = 1000000, flush_every: int = 1000) -> None:
+        '''
+        Opens (or creates) the cache in the given directory
+
+                Parameters:
+                        directory (str): The directory holding the cache database. Created if needed.
+                        max_entries (int): The number of entries kept before the least recently used ones are evicted
+                        flush_every (int): The number of changes after which they are written to disk
+                Returns:
+
+        '''
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.filename)
+        self.max_entries = max_entries
+        self.flush_every = flush_every
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS matches (sentence TEXT, wordlist TEXT, language TEXT, result TEXT, "
+            "last_used INTEGER, PRIMARY KEY (sentence, wordlist, language))")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS matches_last_used ON matches (last_used)")
+
+        version = self._connection.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if version is None or version[0] != MATCH_CACHE_VERSION:
+            logger.info("Match cache %s was written by another matcher version, clearing it", self.path)
+            self._connection.execute("DELETE FROM matches")
+            self._connection.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (MATCH_CACHE_VERSION,))
+        self._connection.commit()
+
+        self._size, self._clock = self._connection.execute("SELECT COUNT(*), COALESCE(MAX(last_used), 0) FROM matches").fetchone()
+        logger.info("Opened match cache %s with %d entries", self.path, self._size)
+        return
+
+    @staticmethod
+    def sentence_hash(sentence: str) -> str:
+        return hashlib.sha1(sentence.encode('utf-8')).hexdigest()
+
+    def get(self, sentence: str, fingerprint: str, language: str):
+        '''
+        Returns the cached word counts of a sentence and marks the entry as recently used.
+
+                Parameters:
+                        sentence (str): The cleaned sentence
+                        fingerprint (str): The fingerprint of the wordlist (Wordlist.fingerprint)
+                        language (str): The language of the scoring module
+                Returns:
+                        word_counts (dict): The words found in the sentence and their counts, or None if the sentence is not cached
+        '''
+        key = (self.sentence_hash(sentence), fingerprint, language)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT result FROM matches WHERE sentence = ? AND wordlist = ? AND language = ?", key).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._clock += 1
+            self._connection.execute(
+                "UPDATE matches SET last_used = ? WHERE sentence = ? AND wordlist = ? AND language = ?", (self._clock,) + key)
+            self._changed()
+        return dict(json.loads(row[0]))
+
+    def put(self, sentence: str, fingerprint: str, language: str, word_counts: dict) -> None:
+        '''
+        Stores the word counts of a sentence, evicting the least recently used entries if the cache is full.
+
+                Parameters:
+                        sentence (str): The cleaned sentence
+                        fingerprint (str): The fingerprint of the wordlist (Wordlist.fingerprint)
+                        language (str): The language of the scoring module
+                        word_counts (dict): The words found in the sentence and their counts
+                Returns:
+
+        '''
+        result = json.dumps([[str(word), int(count)] for word, count in word_counts.items()], ensure_ascii=False)
+        with self._lock:
+            self._clock += 1
+            cursor = self._connection.execute(
+                "INSERT OR IGNORE INTO matches VALUES (?, ?, ?, ?, ?)",
+                (self.sentence_hash(sentence), fingerprint, language, result, self._clock))
+            self._size += cursor.rowcount
+            if self._size > self.max_entries:
+                self._evict()
+            self._changed()
+        return
+
+    def _evict(self) -> None:
+        # Evict a tenth of the cache at once so that eviction does not run on every insert
+        keep = self.max_entries - max(1, self.max_entries // 10)
+        cursor = self._connection.execute(
+            "DELETE FROM matches WHERE last_used IN (SELECT last_used FROM matches ORDER BY last_used LIMIT ?)",
+            (self._size - keep,))
+        self._size -= cursor.rowcount
+        logger.debug("Evicted %d entries from the match cache", cursor.rowcount)
+
+    def _changed(self) -> None:
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._connection.commit()
+            self._pending = 0
+
+    def stats(self) -> dict:
+        '''
+        Returns the hit/miss counters of the cache
+
+                Parameters:
+
+                Returns:
+                        stats (dict): hits, misses, hit_rate and entries
+        '''
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": self._size,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM matches")
+            self._connection.commit()
+            self._size = 0
+            self._pending = 0
+        return
+
+    def flush(self) -> None:
+        with self._lock:
+            self._connection.commit()
+            self._pending = 0
+        return
+
+    def close(self) -> None:
+        self.flush()
+        self._connection.close()
+        logger.info("Closed match cache %s (%d hits, %d misses)", self.path, self.hits, self.misses)
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -0,0 +1,89 @@
+import re
+import unicodedata
+
+# Characters replaced by a space when cleaning a sentence
+PUNCTUATION = "_–,-,.?!;:/()$\n\r\t"
+
+# Hebrew cantillation marks and vowel points (niqqud), keeping the maqaf and sof pasuq punctuation
+HEBREW_MARKS = [c for c in range(0x0591, 0x05C8) if chr(c) not in "־׀׃׆"]
+# Arabic short vowels (harakat), Quranic annotation marks and the tatweel
+ARABIC_MARKS = list(range(0x0610, 0x061B)) + list(range(0x064B, 0x0660)) + [0x0640, 0x0670] + list(range(0x06D6, 0x06EE))
+
+_SPACES = re.compile(' +')
+
+class Normalizer:
+    """
+    A class implementing the normalization applied to the sentences of an item before matching (Item.clean_sentence).
+    The punctuation is replaced in a single str.translate pass using a precompiled table, so cleaning runs in linear time.
+    With the default options the output is identical to the original cleaning: lower case, punctuation replaced by
+    spaces, pairs of spaces replaced by single spaces once and surrounding whitespace stripped.
+
+    ...
+
+    Attributes
+    ----------
+    language : str
+        The language of the text. Selects the diacritics handled by strip_diacritics.
+    nfkc : bool
+        Apply unicode NFKC normalization first (e.g. full width letters, ligatures, decomposed umlauts)
+    casefold : bool
+        Use str.casefold instead of str.lower (e.g. German ß becomes ss)
+    strip_diacritics : bool
+        For Hebrew, remove the niqqud and cantillation marks. For Arabic, remove the harakat and the tatweel.
+        For German, compose decomposed umlauts (NFC) so that they match the wordlist spelling.
+    collapse_whitespace : bool
+        Collapse every run of spaces into a single space instead of halving pairs of spaces once
+
+    Methods
+    -------
+    normalize(sentence)
+        returns the normalized sentence
+    """
+    def __init__(self, language='en', nfkc=False, casefold=False, strip_diacritics=False, collapse_whitespace=False) -> None:
+        '''
+        Initializes the Normalizer class and compiles its translation table
+
+                Parameters:
+                        language (str): The language of the text ('en', 'he', 'ar', 'de', ...)
+                        nfkc (bool): Apply unicode NFKC normalization
+                        casefold (bool): Use casefold instead of lower
+                        strip_diacritics (bool): Handle the diacritics of the language (see the class description)
+                        collapse_whitespace (bool): Collapse runs of spaces into a single space
+                Returns:
+
+        '''
+        self.language = language
+        self.nfkc = nfkc
+        self.casefold = casefold
+        self.strip_diacritics = strip_diacritics
+        self.collapse_whitespace = collapse_whitespace
+
+        table = dict.fromkeys(map(ord, PUNCTUATION), ' ')
+        if strip_diacritics and language == 'he':
+            table.update(dict.fromkeys(HEBREW_MARKS))
+        elif strip_diacritics and language == 'ar':
+            table.update(dict.fromkeys(ARABIC_MARKS))
+        self.table = str.maketrans(table)
+        return
+
+    def normalize(self, sentence) -> str:
+        '''
+        Normalizes a sentence for matching
+
+                Parameters:
+                        sentence (any): The sentence to normalize. Non string values are converted with str.
+                Returns:
+                        sentence (str): The normalized sentence
+        '''
+        sentence = str(sentence)
+        if self.nfkc:
+            sentence = unicodedata.normalize('NFKC', sentence)
+        elif self.strip_diacritics and self.language == 'de':
+            sentence = unicodedata.normalize('NFC', sentence)
+        sentence = sentence.casefold() if self.casefold else sentence.lower()
+        sentence = sentence.translate(self.table)
+        if self.collapse_whitespace:
+            return _SPACES.sub(' ', sentence).strip()
+        return sentence.replace("  ", ' ').strip()
+
+    __call__ = normalize
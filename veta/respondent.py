@@ -1,13 +1,21 @@
 from veta.item import Item
 from veta.wordlist import Wordlist
-from veta.logger import get_logger
+from veta.logger import get_logger, per_item_level
+from veta.score_table import RespondentTotals
 import numpy as np
+import logging
 
 # Initialize logger for this module
 logger = get_logger('respondent')
 
 total_respondents = 0
 
+def route(module, language):
+    '''Returns the scoring module to use for a language (see ScoringModule.for_language), the module itself if it cannot be routed'''
+    if language is None or not hasattr(module, 'for_language'):
+        return module
+    return module.for_language(language)
+
 class Respondent:
     """
     A class representing a single respondent of an LEAS survey. The class includes all of the LEAS items (question responses) 
@@ -22,8 +30,12 @@ class Respondent:
         a unique number representing the respondent.
     wordlist: Wordlist
         the wordlist object used to produce the associated scores.
+    language: str
+        the language of the respondent, used for the items without a language of their own and by the per respondent
+        modules. None if unknown.
     totals: dict
-        a dictionary containing the sums of all of the scoring methods applied to each member of the items list
+        a dictionary containing the sums of all of the scoring methods applied to each member of the items list. Once the
+        respondent is scored as part of a Survey this is a RespondentTotals view of the survey's ScoreTable.
     Methods
     -------
     __str__()
@@ -38,22 +50,27 @@ class Respondent:
         scores all of the respondent's items for all of the modules passed to the function
     add_wordlist(wordlist: Wordlist)
         sets the wordlist for the respondent and all of its items
+    detach_scores()
+        replaces the ScoreTable views of the items' scores and the totals by plain dictionaries
     """
-    def __init__(self, userid=None, wordlist_file=None) -> None:
+    __slots__ = ('items', 'id', 'userid', 'wordlist', 'totals', 'col_names', 'language')
+
+    def __init__(self, userid=None, wordlist_file=None, language=None) -> None:
         
         global total_respondents
 
-        logger.debug(f"Initializing new Respondent with userid={userid}, wordlist_file={wordlist_file}")
+        logger.debug("Initializing new Respondent with userid=%s, wordlist_file=%s", userid, wordlist_file)
 
         self.items = []
         self.id = total_respondents
         self.userid = None
         if isinstance(userid, str):
             self.userid = userid
-            logger.debug(f"Set userid to: {userid}")
+            logger.debug("Set userid to: %s", userid)
         self.wordlist = None
+        self.language = language
         if isinstance(wordlist_file, str):
-            logger.info(f"Loading wordlist from file: {wordlist_file}")
+            logger.info("Loading wordlist from file: %s", wordlist_file)
             wordlist = Wordlist(wordlist_file)
             self.add_wordlist(wordlist)
 
@@ -62,7 +79,9 @@ class Respondent:
         self.totals = {}
         self.col_names = []
 
-        logger.info(f"Created Respondent {self.id} (userid: {self.userid or 'None'})")
+        level = per_item_level(logger)
+        if level:
+            logger.log(level, "Created Respondent %s (userid: %s)", self.id, self.userid or 'None')
         return
 
     def __str__(self) -> str:
@@ -99,27 +118,26 @@ class Respondent:
         '''
         if len(self.items) == 0:
             return np.empty((0,0))
-        
-        # if len(self.items[0].scores.keys()) == 0:
-        #     return np.empty((0,0))
 
-        module_names = list(self.items[0].scores.keys())
         total_names = list(self.totals.keys())
-        #print(module_names)
-        module_names.sort()
         total_names.sort()
 
         full_data = np.zeros((len(self.items)+1, len(total_names)))
-        for i in range(len(self.items)):
-            item = self.items[i]
-            for j in range(len(total_names)):
-                total_name = total_names[j]
+        if isinstance(self.totals, RespondentTotals):
+            #Copy the item rows straight out of the survey's score columns
+            table = self.totals.table
+            start, end = table.offsets[self.totals.index], table.offsets[self.totals.index+1]
+            for j, total_name in enumerate(total_names):
+                if total_name in table.columns and table.present[total_name][start]:
+                    full_data[:-1,j] = table.columns[total_name][start:end]
+        else:
+            module_names = set(self.items[0].scores.keys())
+            for j, total_name in enumerate(total_names):
                 if total_name in module_names:
-                    full_data[i,j] = item.scores[total_name]
-        
-        for i in range(len(total_names)):
-            total_name = total_names[i]
-            # print(total_name, total_names)
+                    for i, item in enumerate(self.items):
+                        full_data[i,j] = item.scores[total_name]
+
+        for i, total_name in enumerate(total_names):
             full_data[-1,i] = self.totals[total_name]
         self.col_names = total_names
         return full_data
@@ -133,7 +151,11 @@ class Respondent:
                 Returns:
                         item (Item): The new item that was created.
         '''
-        logger.debug(f"Adding item to Respondent {self.id}. Sentences: {len(sentences)} provided")
+        logger.debug("Adding item to Respondent %s. Sentences: %d provided", self.id, len(sentences))
+
+        #The survey's score table has no row for the new item
+        if isinstance(self.totals, RespondentTotals):
+            self.detach_scores()
         
         if len(sentences) == 1 and isinstance(sentences[0], Item):
             item = sentences[0]
@@ -150,7 +172,9 @@ class Respondent:
             item.add_wordlist(self.wordlist)
             
         self.items.append(item)
-        logger.info(f"Added item {len(self.items)} to Respondent {self.id}")
+        level = per_item_level(logger)
+        if level:
+            logger.log(level, "Added item %d to Respondent %s", len(self.items), self.id)
         return item
 
     
@@ -164,7 +188,7 @@ class Respondent:
                 Returns:
 
         '''
-        logger.debug(f"Adding additional info to Respondent {self.id}: {id} = {data}")
+        logger.debug("Adding additional info to Respondent %s: %s = %s", self.id, id, data)
         self.totals[id] = data
         return
 
@@ -173,41 +197,55 @@ class Respondent:
         '''
         Scores all of the items in the respondent's items list using all of the specified scoring modules.
         The modules are applied per item or per respondent as indicated by the module type. The totals are
-        added to the totals dict.
+        added to the totals dict. Items with a language are scored with the module for their language
+        (ScoringModule.for_language), and per respondent modules with the module for the respondent's language.
 
                 Parameters:
                         modules (tuple): the scoring modules to be run on the respondent's items.
                 Returns:
 
         '''
-        logger.info(f"Scoring Respondent {self.id} with {len(modules)} modules")
+        level = per_item_level(logger)
+        if level:
+            logger.log(level, "Scoring Respondent %s with %d modules", self.id, len(modules), extra={'respondent_id': self.id})
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         for module in modules:
-            logger.debug(f"Applying module: {getattr(module, 'id', str(module))} (type: {getattr(module, 'type', 'unknown')})")
+            if debug:
+                logger.debug("Applying module: %s (type: %s)", getattr(module, 'id', str(module)), getattr(module, 'type', 'unknown'),
+                             extra={'respondent_id': self.id, 'module_id': getattr(module, 'id', None)})
             
             if module.type == "per item":
                 #total = 0
                 for i, item in enumerate(self.items):
-                    logger.debug(f"Scoring item {i+1} with module {getattr(module, 'id', str(module))}")
-                    item.score(module)
+                    if debug:
+                        logger.debug("Scoring item %d with module %s", i+1, getattr(module, 'id', str(module)),
+                                     extra={'respondent_id': self.id, 'module_id': getattr(module, 'id', None)})
+                    item.score(route(module, item.language or self.language))
                     #total += item.scores[module.id]
             elif module.type == "per respondent":
-                logger.debug(f"Applying per-respondent module: {getattr(module, 'id', str(module))}")
+                if debug:
+                    logger.debug("Applying per-respondent module: %s", getattr(module, 'id', str(module)))
                 for item in self.items:
                     item.scores[module.id] = 0
-                total = module.execute(self.items, self.wordlist)
+                total = route(module, self.language).execute(self.items, self.wordlist)
             #self.modules_ran.add(module.id)
                 self.totals[module.id] = total
-                logger.debug(f"Per-respondent module result: {total}")
+                logger.debug("Per-respondent module result: %s", total, extra={'respondent_id': self.id, 'module_id': module.id})
                 
         self.compute_totals()
-        logger.info(f"Completed scoring for Respondent {self.id}")
+        level = per_item_level(logger)
+        if level:
+            logger.log(level, "Completed scoring for Respondent %s", self.id, extra={'respondent_id': self.id})
         return
 
     def compute_totals(self):
-        logger.debug(f"Computing totals for Respondent {self.id}")
+        logger.debug("Computing totals for Respondent %s", self.id)
+        if isinstance(self.totals, RespondentTotals):
+            logger.debug("Totals for Respondent %s are computed by the survey's score table", self.id)
+            return
         if len(self.items) < 1:
-            logger.warning(f"No items found for Respondent {self.id}, cannot compute totals")
+            logger.warning("No items found for Respondent %s, cannot compute totals", self.id, extra={'respondent_id': self.id})
             return
         for ids in self.items[0].scores.keys():
             total = 0
@@ -215,7 +253,24 @@ class Respondent:
                 total += item.scores[ids]
             if total != 0 or ids not in self.totals.keys():
                 self.totals[ids] = total
-        logger.debug(f"Computed totals for {len(self.totals)} scoring methods")
+        logger.debug("Computed totals for %d scoring methods", len(self.totals))
+
+    def detach_scores(self) -> None:
+        '''
+        Replaces the ScoreTable views of the items' scores and of the totals by plain dictionaries holding the same values.
+
+                Parameters:
+
+                Returns:
+
+        '''
+        if not isinstance(self.totals, RespondentTotals):
+            return
+        logger.debug("Detaching Respondent %s from the survey's score table", self.id)
+        for item in self.items:
+            item.scores = dict(item.scores)
+        self.totals = dict(self.totals)
+        return
 
     def add_wordlist(self, wordlist: Wordlist) -> None:
         '''
@@ -226,11 +281,13 @@ class Respondent:
                 Returns:
 
         '''
-        logger.info(f"Setting wordlist for Respondent {self.id}")
+        level = per_item_level(logger)
+        if level:
+            logger.log(level, "Setting wordlist for Respondent %s", self.id)
         self.wordlist = wordlist
         for i, item in enumerate(self.items):
-            logger.debug(f"Adding wordlist to item {i+1}")
+            logger.debug("Adding wordlist to item %d", i+1)
             item.add_wordlist(wordlist)
-        logger.debug(f"Wordlist added to {len(self.items)} items")
+        logger.debug("Wordlist added to %d items", len(self.items))
         return
 
@@ -0,0 +1,303 @@
+from collections.abc import MutableMapping
+import numpy as np
+
+# Order in which column types are widened when a value does not fit the current column
+_KINDS = {'b': 0, 'i': 1, 'f': 2, 'O': 3}
+_DTYPES = [np.bool_, np.int64, np.float64, object]
+
+def _kind(value) -> int:
+    if isinstance(value, (bool, np.bool_)):
+        return 0
+    if isinstance(value, (int, np.integer)):
+        return 1
+    if isinstance(value, (float, np.floating)):
+        return 2
+    return 3
+
+class ScoreTable:
+    """
+    A class storing the item scores of a survey column by column. Every scoring module id (or additional info key)
+    is one contiguous numpy column indexed by item, and the items of each respondent occupy consecutive rows
+    starting at the respondent's offset. Respondent totals are computed for all respondents at once with np.add.reduceat.
+    Item.scores and Respondent.totals are replaced by the ItemScores and RespondentTotals views of the table.
+
+    ...
+
+    Attributes
+    ----------
+    columns : dict
+        Maps each id to its numpy column. Columns are bool, int64 or float64 and widen (up to object) as needed.
+    present : dict
+        Maps each id to a boolean column marking the items that have a value for that id
+    offsets : np.array
+        The first row of each respondent, followed by the total number of items
+    num_items : int
+        The number of rows of the table
+
+    Methods
+    -------
+    from_respondents(respondents)
+        builds a table holding the current scores of the respondents' items and attaches the views
+    matches(respondents)
+        checks whether the table still describes the given respondents
+    get(id, row)
+        returns the value of column id for an item
+    set(id, row, value)
+        sets the value of column id for an item, updating the cached totals of its respondent by the difference
+    totals(id)
+        returns the sum of column id for every respondent
+    """
+    def __init__(self, item_counts) -> None:
+        self.offsets = np.zeros(len(item_counts) + 1, dtype=np.int64)
+        np.cumsum(item_counts, out=self.offsets[1:])
+        self.num_items = int(self.offsets[-1])
+        self.columns = {}
+        self.present = {}
+        self._totals = {}
+        self.respondents = []
+        return
+
+    @classmethod
+    def from_respondents(cls, respondents: list):
+        '''
+        Builds a table holding the current scores of all of the respondents' items and replaces each item's
+        scores and each respondent's totals by views of the table.
+
+                Parameters:
+                        respondents (list): The respondents of the survey
+                Returns:
+                        table (ScoreTable): The new table
+        '''
+        table = cls([len(respondent.items) for respondent in respondents])
+        table.respondents = list(respondents)
+        row = 0
+        for index, respondent in enumerate(respondents):
+            for item in respondent.items:
+                for key, value in item.scores.items():
+                    table.set(key, row, value)
+                item.scores = ItemScores(table, row)
+                row += 1
+            totals = respondent.totals
+            if isinstance(totals, RespondentTotals):
+                totals = totals.extra
+            respondent.totals = RespondentTotals(table, index, dict(totals))
+        return table
+
+    def matches(self, respondents: list) -> bool:
+        '''
+        Checks whether the table still describes the given respondents, i.e. no respondents or items were added or removed since it was built.
+
+                Parameters:
+                        respondents (list): The respondents of the survey
+                Returns:
+                        (bool): True if every respondent and item is still backed by this table
+        '''
+        if len(respondents) != len(self.respondents):
+            return False
+        for index, respondent in enumerate(respondents):
+            totals = respondent.totals
+            if respondent is not self.respondents[index] or not isinstance(totals, RespondentTotals) or totals.table is not self:
+                return False
+            if len(respondent.items) != self.offsets[index+1] - self.offsets[index]:
+                return False
+        return True
+
+    def get(self, id, row: int):
+        '''
+        Returns the value of column id for an item
+
+                Parameters:
+                        id (any): The column id
+                        row (int): The row of the item
+                Returns:
+                        value (any): The stored value, converted to a python scalar for numeric columns
+        '''
+        if id not in self.columns or not self.present[id][row]:
+            raise KeyError(id)
+        value = self.columns[id][row]
+        if self.columns[id].dtype != object:
+            return value.item()
+        return value
+
+    def set(self, id, row: int, value) -> None:
+        '''
+        Sets the value of column id for an item, creating or widening the column if needed.
+
+                Parameters:
+                        id (any): The column id
+                        row (int): The row of the item
+                        value (any): The value to store
+                Returns:
+
+        '''
+        column = self.columns.get(id)
+        kind = _kind(value)
+        if column is None:
+            column = np.zeros(self.num_items, dtype=_DTYPES[kind])
+            self.columns[id] = column
+            self.present[id] = np.zeros(self.num_items, dtype=bool)
+        elif kind > _KINDS[column.dtype.kind]:
+            column = column.astype(_DTYPES[kind])
+            self.columns[id] = column
+            self._totals.pop(id, None)
+        totals = self._totals.get(id)
+        if totals is not None and column.dtype.kind in 'if':
+            #Update the total of the item's respondent by the difference instead of summing the column again
+            index = np.searchsorted(self.offsets, row, side='right') - 1
+            totals[index] += value - column[row]
+        else:
+            self._totals.pop(id, None)
+        column[row] = value
+        self.present[id][row] = True
+        return
+
+    def delete(self, id, row: int) -> None:
+        '''
+        Removes the value of column id for an item
+
+                Parameters:
+                        id (any): The column id
+                        row (int): The row of the item
+                Returns:
+
+        '''
+        if id not in self.columns or not self.present[id][row]:
+            raise KeyError(id)
+        self.present[id][row] = False
+        self.columns[id][row] = 0
+        self._totals.pop(id, None)
+        return
+
+    def totals(self, id) -> np.array:
+        '''
+        Returns the sum of column id over the items of every respondent. Respondents without items have a total of 0.
+
+                Parameters:
+                        id (any): The column id
+                Returns:
+                        totals (np.array): One total per respondent
+        '''
+        totals = self._totals.get(id)
+        if totals is not None:
+            return totals
+
+        column = self.columns[id]
+        starts = self.offsets[:-1]
+        nonempty = starts < self.offsets[1:]
+        if column.dtype == object:
+            totals = np.zeros(len(starts), dtype=object)
+            for index in np.flatnonzero(nonempty):
+                total = 0
+                for value in column[starts[index]:self.offsets[index+1]]:
+                    total += value
+                totals[index] = total
+        elif column.dtype.kind == 'f':
+            # Added item by item in order, as Respondent.compute_totals does, so that the totals are bit identical
+            # (the pairwise summation of np.add.reduceat can differ in the last digit)
+            totals = np.zeros(len(starts), dtype=np.float64)
+            lengths = self.offsets[1:] - starts
+            for position in range(lengths.max(initial=0)):
+                rows = np.flatnonzero(lengths > position)
+                totals[rows] += column[starts[rows] + position]
+        else:
+            totals = np.zeros(len(starts), dtype=np.int64)
+            if np.any(nonempty):
+                totals[nonempty] = np.add.reduceat(column, starts[nonempty], dtype=np.int64)
+        self._totals[id] = totals
+        return totals
+
+    def respondent_ids(self, index: int) -> list:
+        '''
+        Returns the column ids that appear in the totals of a respondent, i.e. the ids present for its first item.
+
+                Parameters:
+                        index (int): The position of the respondent in the table
+                Returns:
+                        ids (list): The column ids
+        '''
+        start = self.offsets[index]
+        if start == self.offsets[index+1]:
+            return []
+        return [id for id, present in self.present.items() if present[start]]
+
+
+class ItemScores(MutableMapping):
+    """
+    A dictionary-like view of the scores of one item stored in a ScoreTable. Used as Item.scores once a survey is scored.
+    """
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table: ScoreTable, row: int) -> None:
+        self.table = table
+        self.row = row
+
+    def __getitem__(self, id):
+        return self.table.get(id, self.row)
+
+    def __setitem__(self, id, value) -> None:
+        self.table.set(id, self.row, value)
+
+    def __delitem__(self, id) -> None:
+        self.table.delete(id, self.row)
+
+    def __contains__(self, id) -> bool:
+        present = self.table.present.get(id)
+        return present is not None and bool(present[self.row])
+
+    def __iter__(self):
+        row = self.row
+        return iter([id for id, present in self.table.present.items() if present[row]])
+
+    def __len__(self) -> int:
+        row = self.row
+        return sum(1 for present in self.table.present.values() if present[row])
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class RespondentTotals(MutableMapping):
+    """
+    A dictionary-like view of the totals of one respondent. The totals of the item columns come from the ScoreTable,
+    while values added directly (additional info, per respondent modules) are kept in the extra dict. As in
+    Respondent.compute_totals, an item column total of 0 does not replace a value that was added directly.
+    Used as Respondent.totals once a survey is scored.
+    """
+    __slots__ = ('table', 'index', 'extra')
+
+    def __init__(self, table: ScoreTable, index: int, extra: dict = None) -> None:
+        self.table = table
+        self.index = index
+        self.extra = {} if extra is None else extra
+
+    def _has_column(self, id) -> bool:
+        present = self.table.present.get(id)
+        start = self.table.offsets[self.index]
+        return present is not None and start < self.table.offsets[self.index+1] and bool(present[start])
+
+    def __getitem__(self, id):
+        if self._has_column(id):
+            total = self.table.totals(id)[self.index]
+            if total != 0 or id not in self.extra:
+                return total.item() if isinstance(total, np.generic) else total
+        return self.extra[id]
+
+    def __setitem__(self, id, value) -> None:
+        self.extra[id] = value
+
+    def __delitem__(self, id) -> None:
+        del self.extra[id]
+
+    def __contains__(self, id) -> bool:
+        return id in self.extra or self._has_column(id)
+
+    def __iter__(self):
+        ids = list(self.extra)
+        ids += [id for id in self.table.respondent_ids(self.index) if id not in self.extra]
+        return iter(ids)
+
+    def __len__(self) -> int:
+        return len(set(self.extra).union(self.table.respondent_ids(self.index)))
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
@@ -50,14 +50,7 @@ class _334(ScoringModule):
                         
 
         '''
-        if self.mode == "self":
-            sentence = item.self_sentence
-        elif self.mode == "other":
-            sentence = item.other_sentence
-        else:
-            sentence = item.self_sentence + ' ' + item.other_sentence
-
-        frequency, matching_words, scores = self.match_words(sentence, wordlist)
+        frequency, matching_words, scores = self.match_item(item, wordlist, self.mode)
 
         if len(scores) == 0:
             return 0
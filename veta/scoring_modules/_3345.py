@@ -43,7 +43,7 @@ class _3345(ScoringModule):
                         
 
         '''
-        self_frequency, self_matching_words, self_scores = self.match_words(item.self_sentence, wordlist)
+        self_frequency, self_matching_words, self_scores = self.match_item(item, wordlist, 'self')
 
         if len(self_scores) == 0:
             self_334 =  0
@@ -52,7 +52,7 @@ class _3345(ScoringModule):
         else:
             self_334 =  max(self_scores)
 
-        other_frequency, other_matching_words, other_scores = self.match_words(item.other_sentence, wordlist)
+        other_frequency, other_matching_words, other_scores = self.match_item(item, wordlist, 'other')
 
         if len(other_scores) == 0:
             other_334 =  0
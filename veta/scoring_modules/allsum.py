@@ -41,7 +41,6 @@ class allsum(ScoringModule):
                         
 
         '''
-        sentence = item.self_sentence + ' ' + item.other_sentence
-        frequency, matching_words, scores = self.match_words(sentence, wordlist)
+        frequency, matching_words, scores = self.match_item(item, wordlist)
 
         return sum(scores*frequency)
\ No newline at end of file
@@ -43,8 +43,7 @@ class allsum_unique(ScoringModule):
                         
 
         '''
-        sentence = item.self_sentence + ' ' + item.other_sentence
-        frequency, matching_words, scores = self.match_words(sentence, wordlist)
+        frequency, matching_words, scores = self.match_item(item, wordlist)
 
         if self.only_high_scores:
             return sum(scores[scores>2])
@@ -52,17 +52,10 @@ class count(ScoringModule):
                 Returns:
                         score (int): The score for the item 
         '''
-        if self.mode == 'self':
-            sentence = item.self_sentence
-        elif self.mode == 'other':
-            sentence = item.other_sentence
-        else:
-            sentence = item.self_sentence + ' ' + item.other_sentence
-
         if (self.sublevel is None):
-            frequency, matching_words, scores = self.match_words(sentence, wordlist, sublevels=False)
+            frequency, matching_words, scores = self.match_item(item, wordlist, self.mode, sublevels=False)
         else:
-            frequency, matching_words, scores, subscores = self.match_words(sentence, wordlist, sublevels=True)
+            frequency, matching_words, scores, subscores = self.match_item(item, wordlist, self.mode, sublevels=True)
 
         #If the user has not specified the level they are interested in, do them all
         if self.level is None:
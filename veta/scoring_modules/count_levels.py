@@ -0,0 +1,123 @@
+from veta.scoring_modules.scoring_module import *
+from veta.item import Item
+
+def format_level(level) -> str:
+    '''
+    Formats a wordlist score or subclass the way it appears in the count column ids (e.g. 3.0 -> '3').
+
+            Parameters:
+                    level (int or float): The level or sublevel to format
+            Returns:
+                    level (str): The formatted level
+    '''
+    if isinstance(level, (float, np.floating)) and float(level).is_integer():
+        return str(int(level))
+    return str(level)
+
+class count_levels(ScoringModule):
+    """
+    A class implementing the count scoring technique for every level and sublevel at once. Child of the ScoringModule class.
+    Running count_levels gives the same columns as running count(level=X), count(level=X, sublevel=Y) and their binary
+    variants for every level X and sublevel Y of the wordlist, but the item is only matched once and all of the counts
+    come from a single np.bincount over the level codes of the matching words. The columns keep the count module ids,
+    e.g. 'count-level-3-both', 'count-level-3-sublevel-1-both' and 'count-level-3-both-true_false'.
+
+    ...
+
+    Attributes
+    ----------
+    type : str
+        A string indicating how wether the score applies to single item or an entire respondent. Equals either 'per item' or 'per respondent'
+    id : str
+        A unique string indentifying the scoring module
+    output_ids : list
+        The ids of all of the columns produced by the module. Set when the wordlist is added.
+
+    Methods
+    -------
+    execute(item: Item, wordlist: Wordlist) -> dict
+        Scores a single LEAS item using a given wordlist.
+    """
+    type = "per item"
+    id = "count-levels"
+
+    def __init__(self, mode = 'both', levels = None, sublevels = True, binary = True, language='en') -> None:
+        '''
+        Initializes the count_levels scoring module
+
+                Parameters:
+                        mode (str): 'self', 'other' or 'both', the part of the item to count
+                        levels (list): The levels to count. Default is every score found in the wordlist.
+                        sublevels (bool): Whether to also count every (level, sublevel) pair
+                        binary (bool): Whether to also output the true_false indicator of every count
+                Returns:
+
+        '''
+        super().__init__(language=language)
+        self.mode = mode
+        self.levels = levels
+        self.sublevels = sublevels
+        self.binary = binary
+        self.id += '-' + str(self.mode)
+        self.output_ids = []
+        return
+
+    def add_wordlist(self, wordlist: Wordlist):
+        super().add_wordlist(wordlist)
+
+        if self.levels is None:
+            levels = sorted(set(score for score in wordlist.scores if score == score))
+        else:
+            levels = list(self.levels)
+        level_codes = {level: i for i, level in enumerate(levels)}
+        pairs = sorted(set((score, subclass) for score, subclass in zip(wordlist.scores, wordlist.subclasses)
+                           if score in level_codes and subclass == subclass))
+        pair_codes = {pair: i for i, pair in enumerate(pairs)}
+
+        # Words outside of the requested levels fall into the last (ignored) bin
+        self.word_level = {}
+        self.word_pair = {}
+        for word, score, subclass in zip(wordlist.words, wordlist.scores, wordlist.subclasses):
+            self.word_level[word] = level_codes.get(score, len(levels))
+            self.word_pair[word] = pair_codes.get((score, subclass), len(pairs))
+
+        mode = '-' + str(self.mode)
+        self.total_id = 'count' + mode
+        self.level_ids = ['count-level-' + format_level(level) + mode for level in levels]
+        self.pair_ids = []
+        if self.sublevels:
+            self.pair_ids = ['count-level-' + format_level(level) + '-sublevel-' + format_level(subclass) + mode
+                             for level, subclass in pairs]
+
+        self.output_ids = [self.total_id] + self.level_ids + self.pair_ids
+        if self.binary:
+            self.output_ids += [column + '-true_false' for column in self.output_ids]
+        return
+
+    def execute(self, item: Item, wordlist: Wordlist) -> dict:
+        '''
+        Counts the wordlist words of every level and sublevel found in a single LEAS item.
+
+                Parameters:
+                        item (Item): The LEAS item to be scored
+                        wordlist (Wordlist): The wordlist to be searched
+                Returns:
+                        counts (dict): The count (and true_false indicator) for every column id in output_ids
+        '''
+        frequency, matching_words, scores = self.match_item(item, wordlist, self.mode)
+
+        level_counts = np.bincount([self.word_level[word] for word in matching_words],
+                                   minlength=len(self.level_ids) + 1)
+        counts = {self.total_id: len(matching_words)}
+        counts.update(zip(self.level_ids, level_counts[:len(self.level_ids)].tolist()))
+        if self.sublevels:
+            pair_counts = np.bincount([self.word_pair[word] for word in matching_words],
+                                      minlength=len(self.pair_ids) + 1)
+            counts.update(zip(self.pair_ids, pair_counts[:len(self.pair_ids)].tolist()))
+
+        if self.binary:
+            binary = {column + '-true_false': value > 0 for column, value in counts.items()}
+            #Keep the count module's definition of the overall indicator (more than one word found)
+            binary[self.total_id + '-true_false'] = counts[self.total_id] > 1
+            counts.update(binary)
+        return counts
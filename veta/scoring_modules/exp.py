@@ -36,6 +36,8 @@ class exp(ScoringModule):
         '''
         super().__init__(language=language)
         self.b = b
+        #Reuse one (default language) 3345 module so its matcher is compiled once, matching as configured on this module
+        self.base = self.configure(_3345())
         return
 
     def execute(self, item: Item, wordlist: Wordlist) -> int:
@@ -49,4 +51,4 @@ class exp(ScoringModule):
                         score (int): The score for the item 
                         
         '''
-        return np.exp(self.b*_3345().execute(item, wordlist))-1
+        return np.exp(self.b*self.configure(self.base).execute(item, wordlist))-1
@@ -1,6 +1,6 @@
 from veta.scoring_modules.scoring_module import *
-from veta.scoring_modules.highestN import highestN
 from veta.item import Item
+import heapq
 
 class highestN_allinone(ScoringModule):
     """
@@ -20,6 +20,8 @@ class highestN_allinone(ScoringModule):
     -------
     execute(self, items: list, wordlist: Wordlist) -> int:
         Scores a list of LEAS items using a given wordlist.
+    joins_items(self, items: list, wordlist: Wordlist) -> bool:
+        Checks whether the items must be matched joined together.
     """
     type = "per respondent"
     
@@ -28,6 +30,9 @@ class highestN_allinone(ScoringModule):
         super().__init__(language=language)
         self.N = N
         self.id = "highest{}-allinone".format(N)
+        #Items are matched as by the highestN module this module has always used, i.e. in the default language, with
+        #the configuration of this module (see configure)
+        self.base = self.configure(ScoringModule())
         return
 
     def execute(self, items: list, wordlist: Wordlist) -> int:
@@ -41,9 +46,53 @@ class highestN_allinone(ScoringModule):
                         score (int): The score for the item 
                         
         '''
-        total_sentence = ""
-        for item in items:
-            total_sentence += " " + item.self_sentence + ' ' + item.other_sentence + ' '
-        
-        new_item = Item(total_sentence, "")
-        return highestN(self.N).execute(new_item, wordlist)
\ No newline at end of file
+        self.configure(self.base)
+        word_frequency = defaultdict(int)
+        word_scores = {}
+        if self.joins_items(items, wordlist):
+            #A word can match across two items: match all of the items joined together and cleaned again
+            total_sentence = ""
+            for item in items:
+                total_sentence += " " + item.self_sentence + ' ' + item.other_sentence + ' '
+            new_item = Item(total_sentence, "")
+            matched = [self.base.match_words(new_item.self_sentence + ' ' + new_item.other_sentence, wordlist)]
+        else:
+            #Merge the per item matches rather than re-matching one long sentence
+            matched = [self.base.match_item(item, wordlist) for item in items]
+        for frequency, matching_words, scores in matched:
+            for i in range(matching_words.size):
+                word_frequency[matching_words[i]] += frequency[i]
+                word_scores[matching_words[i]] = scores[i]
+
+        #Only the N highest scored words can contribute to the total
+        highest = heapq.nlargest(self.N, word_scores.items(), key=lambda pair: pair[1])
+
+        total = 0
+        left = self.N
+        for word, score in highest:
+            if left <= 0:
+                break
+            used = min(word_frequency[word], left)
+            total += used*score
+            left -= used
+
+        return total
+
+    def joins_items(self, items: list, wordlist: Wordlist) -> bool:
+        '''
+        Checks whether matching the items joined into one sentence can find other words than matching each item: a
+        wordlist word could match across the space between two sentences (see spans_boundary), including the double
+        spaces of a sentence that become single spaces when the joined sentence is cleaned again.
+
+                Parameters:
+                        items (list): The LEAS items of the respondent
+                        wordlist (Wordlist): The wordlist to be searched
+                Returns:
+                        (bool): True if the items must be matched joined together
+        '''
+        base = self.base
+        if base.wordlist is None or base.wordlist.unique_id != wordlist.unique_id:
+            base.add_wordlist(wordlist)
+        pieces = [piece for item in items for sentence in (item.self_sentence, item.other_sentence) if sentence
+                  for piece in sentence.split('  ')]
+        return any(base.spans_boundary(first, second) for first, second in zip(pieces, pieces[1:]))
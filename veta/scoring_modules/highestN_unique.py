@@ -51,8 +51,7 @@ class highestN_unique(ScoringModule):
                         score (int): The score for the item 
                         
         '''
-        sentence = item.self_sentence + ' ' + item.other_sentence
-        frequency, matching_words, scores = self.match_words(sentence, wordlist)
+        frequency, matching_words, scores = self.match_item(item, wordlist)
 
         p = scores.argsort()
         scores = scores[p]
@@ -42,8 +42,7 @@ class mlr(ScoringModule):
                 Returns:
                         score (int): The score for the item    
         '''
-        sentence = item.self_sentence + ' ' + item.other_sentence
-        frequency, matching_words, scores = self.match_words(sentence, wordlist)
+        frequency, matching_words, scores = self.match_item(item, wordlist)
         contains_low = 1 in scores or 2 in scores
         contains_high = 3 in scores
 
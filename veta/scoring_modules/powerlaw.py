@@ -37,6 +37,8 @@ class powerlaw(ScoringModule):
         '''
         super().__init__(language=language)
         self.gamma = gamma
+        #Reuse one (default language) 3345 module so its matcher is compiled once, matching as configured on this module
+        self.base = self.configure(_3345())
         return
 
     def execute(self, item: Item, wordlist: Wordlist) -> int:
@@ -50,4 +52,4 @@ class powerlaw(ScoringModule):
                         score (int): The score for the item 
                         
         '''
-        return _3345().execute(item, wordlist)**self.gamma
+        return self.configure(self.base).execute(item, wordlist)**self.gamma
@@ -1,7 +1,14 @@
 import numpy as np
 from veta.wordlist import Wordlist
+from veta.token_matcher import TokenMatcher, _TOKEN
+from veta.segmentation import SEGMENTERS
+from veta.lemmatization import Lemmatizer, LemmaMatcher
+from veta.fuzzy_matcher import FuzzyMatcher
 from veta.logger import get_logger
 import re
+import copy
+import time
+import inspect
 from collections import defaultdict
 
 # Initialize logger for scoring modules
@@ -19,6 +26,38 @@ class ScoringModule:
         A string indicating how wether the score applies to single item or an entire respondent. Equals either 'per item' or 'per respondent'
     id : str
         A unique string indentifying the scoring module
+    match_cache : MatchCache
+        An optional persistent cache consulted by match_words before running the matcher. None (disabled) by default.
+    needs_wordlist : bool
+        Whether execute takes a wordlist after the item. Inferred from the signature of execute when not declared.
+    returns_tuple : bool
+        Whether execute returns a tuple, stored as the columns id+"1", id+"2", ... Checked on every result when not declared.
+    scorer : callable
+        scorer(item, wordlist), the bound execute method with the module's calling convention. Used by Item.score.
+    stats : ModuleStats
+        Where the matcher time and match reuse are recorded while Survey.score collects statistics. None otherwise.
+    max_sentence_length : int
+        Sentences longer than this many characters are handled by long_sentence_policy. None (no limit) by default.
+    long_sentence_policy : str
+        'truncate' (match the first window only), 'split' (match every window and add up the counts) or 'flag' (match the
+        whole sentence and only report it). Windows are at most max_sentence_length characters and are cut at spaces that
+        no wordlist phrase spans, so 'split' finds the same words as matching the whole sentence.
+    long_sentences : int
+        The number of sentences longer than max_sentence_length seen by the module
+    matcher : str
+        'token' (default) finds the wordlist words with a TokenMatcher and uses the regex only when the token matcher
+        cannot guarantee the same result. 'regex' always uses the regex. 'segment' uses the segmenting matcher of the
+        module's language (veta.segmentation, e.g. the Hebrew prefix and run-together word segmentation), or the
+        TokenMatcher for languages without one. 'lemma' matches the wordlist words on their spaCy lemma
+        (veta.lemmatization, 'en' and 'de'). 'fuzzy' also corrects misspelled tokens within max_edit_distance edits of
+        a wordlist word (veta.fuzzy_matcher, see FuzzyMatcher.report for the corrections applied). Matches are cached
+        under the module's language and, for the other matchers than 'token' and 'regex', the matcher
+        (see match_language).
+    max_edit_distance : int
+        The largest edit distance corrected by the 'fuzzy' matcher (1 or 2)
+    union : WordlistUnion
+        Set while Survey.score_wordlists runs. The sentences are matched once through the union of all the wordlists,
+        and again with a single wordlist only when needed (see WordlistUnion.count). None otherwise.
 
     Methods
     -------
@@ -26,11 +65,50 @@ class ScoringModule:
         A helper function that checks if the string 'word' is contained within the string 'sentence' with a space on either side.
     match_words(self, sentence: str, wordlist: Wordlist)
         Finds all of the wordlist words and correspndoing scores that are contained in the sentence.
+    find_words(self, sentence: str)
+        Returns the count of each word of the current wordlist in the sentence, with the long sentence policy and the match_cache.
+    count_matches(self, sentence: str)
+        Runs the matcher on a sentence and returns the count of each wordlist word found.
+    count_matches_regex(self, sentence: str)
+        Runs the wordlist regex on a sentence and returns the count of each wordlist word found.
+    match_spans(self, sentence: str, wordlist: Wordlist)
+        Returns the (word, start, stop) of every wordlist word found in the sentence.
+    count_long_sentence(self, sentence: str)
+        Runs the matcher on a sentence longer than max_sentence_length according to long_sentence_policy.
+    sentence_windows(self, sentence: str, limit: int)
+        Yields the windows of at most limit characters that a long sentence is matched in.
+    match_item(self, item, wordlist: Wordlist, mode: str)
+        Matches the self and other sentences of an item once and shares the result between modes and modules.
+    match_language(self)
+        Returns the language the matches of the module are cached under.
+    match_key(self, wordlist: Wordlist)
+        Returns the key the matches of the module are stored under in Item.matches.
+    set_language(self, language: str)
+        Sets the language of the module and the characters accepted around words.
+    for_language(self, language: str)
+        Returns the module itself or its copy for the items of another language (see Survey.score).
+    configure(self, helper)
+        Gives a helper module the matching configuration of the module.
+    bind(self)
+        Validates the calling convention of the module and precomputes its scorer.
+    tuple_ids(self, length: int)
+        Returns the column ids of a tuple result.
     execute()
         Empty. To be overwritten by child classes.
     """
     type = None
     id = None
+    match_cache = None
+    needs_wordlist = None
+    returns_tuple = None
+    scorer = None
+    stats = None
+    max_sentence_length = None
+    long_sentence_policy = 'split'
+    max_edit_distance = 2
+    union = None
+    matcher = 'token'
+    long_sentences = 0
 
     def is_full_word(self, sentence: str, word: str) -> bool:
         '''
@@ -147,7 +225,8 @@ class ScoringModule:
     def match_words(self, sentence: str, wordlist: Wordlist, sublevels = False):
         '''
         Finds which words from the wordlist are present in the sentence along with their frequency and corresponding scores.
-        This function is used by most scoring modules to score LEAS items.
+        This function is used by most scoring modules to score LEAS items. If a match_cache is set, it is consulted
+        before running the matcher and filled in on a miss.
 
                 Parameters:
                         sentence (str): The string containing the sentence to be characterized.
@@ -162,6 +241,89 @@ class ScoringModule:
         if self.wordlist is None or self.wordlist.unique_id != wordlist.unique_id:
             self.add_wordlist(wordlist)
 
+        stats = self.stats
+        if stats is not None:
+            start = time.perf_counter()
+
+        word_counts = None
+        union = self.union
+        if union is not None and union.covers(self, wordlist):
+            word_counts = union.count(self, sentence, wordlist)
+        if word_counts is None:
+            word_counts = self.find_words(sentence)
+
+        if stats is not None:
+            stats.matcher_time += time.perf_counter() - start
+            stats.match_calls += 1
+
+        # Prepare the output list
+        frequency, matching_words, scores, subscores = [], [], [], []
+        for word, f in word_counts.items():
+            #Double check to make sure its actually in the dictionary 
+            if word in self.word_score:
+                matching_words.append(word)
+                frequency.append(f)
+                scores.append(self.word_score.get(word, 0))
+                subscores.append(self.word_subscore.get(word, 0))
+        frequency = np.array(frequency)
+        matching_words = np.array(matching_words)
+        scores = np.array(scores)
+        subscores = np.array(subscores)
+        if sublevels:
+            return frequency, matching_words, scores, subscores
+        return frequency, matching_words, scores
+
+    def find_words(self, sentence: str) -> dict:
+        '''
+        Finds the words of the current wordlist in a sentence, applying the long sentence policy and consulting the
+        match_cache if it is set
+
+                Parameters:
+                        sentence (str): The cleaned sentence
+                Returns:
+                        word_counts (dict): The words found and their frequency
+        '''
+        cache = self.match_cache
+        limit = self.max_sentence_length
+        if limit is not None and len(sentence) > limit:
+            # Long sentences bypass the cache, their result depends on the policy
+            return self.count_long_sentence(sentence)
+        if cache is None:
+            return self.count_matches(sentence)
+        if self.wordlist_fingerprint is None:
+            self.wordlist_fingerprint = self.wordlist.fingerprint()
+        word_counts = cache.get(sentence, self.wordlist_fingerprint, self.match_language())
+        if word_counts is None:
+            word_counts = self.count_matches(sentence)
+            cache.put(sentence, self.wordlist_fingerprint, self.match_language(), word_counts)
+        return word_counts
+
+    def count_matches(self, sentence: str) -> dict:
+        '''
+        Runs the matcher of the current wordlist on a sentence: the token matcher if it is enabled and can
+        guarantee the regex result for this sentence, the regex otherwise.
+
+                Parameters:
+                        sentence (str): The string containing the sentence to be characterized.
+                Returns:
+                        word_counts (dict): The wordlist words found in the sentence and their frequency, in order of first match
+        '''
+        token_matcher = self.token_matcher
+        if token_matcher is not None:
+            word_counts = token_matcher.count(sentence)
+            if word_counts is not None:
+                return word_counts
+        return self.count_matches_regex(sentence)
+
+    def count_matches_regex(self, sentence: str) -> dict:
+        '''
+        Runs the regex of the current wordlist on a sentence.
+
+                Parameters:
+                        sentence (str): The string containing the sentence to be characterized.
+                Returns:
+                        word_counts (dict): The wordlist words found in the sentence and their frequency, in order of first match
+        '''
         # Find all non-overlapping matches in the sentence
         matches = list(self.regex.finditer(sentence))
 
@@ -169,16 +331,14 @@ class ScoringModule:
         matched_ranges = []
         matched_words = []
         word_counts = defaultdict(int)
+        # finditer returns the matches in order, so a match can only overlap the one kept before it.
+        # Checking the last end keeps the loop linear in the number of matches.
+        last_end = -1
         for match in matches:
             start, end = match.span()
-            # Check for overlap with existing matched ranges
-            overlap = False
-            for s, e in matched_ranges:
-                if start < e and end > s:
-                    overlap = True
-                    break
             #If there is not overlap from the words so far
-            if not overlap:
+            if start >= last_end:
+                last_end = end
                 matched_text = match.group()
                 matched_words.append(matched_text)
                 #Either the word is in the wordlist
@@ -207,29 +367,247 @@ class ScoringModule:
                     #if the the next spot in the sentence exists and is not a space (i.e, its another letter)
                     if len(sentence) > matched_ranges[i][1] and sentence[matched_ranges[i][1]] != ' ':
                         word_counts[word] -= 1
+        return word_counts
+
+    def match_spans(self, sentence: str, wordlist: Wordlist) -> list:
+        '''
+        Finds where the wordlist words are in a sentence, with the token matcher if it can guarantee the regex result
+        and the regex otherwise. The whole sentence is matched whatever its length. Used by veta.term_discovery to
+        leave out the text the wordlist already covers.
+
+                Parameters:
+                        sentence (str): The cleaned sentence
+                        wordlist (Wordlist): The wordlist to be searched
+                Returns:
+                        matches (list): The (word, start, stop) of every word found, in order
+        '''
+        if self.wordlist is None or self.wordlist.unique_id != wordlist.unique_id:
+            self.add_wordlist(wordlist)
+        if self.token_matcher is not None:
+            found = self.token_matcher.matches(sentence)
+            if found is not None:
+                return found
+        found = []
+        last_end = -1
+        # The non-overlapping matches kept by count_matches_regex
+        for match in self.regex.finditer(sentence):
+            start, end = match.span()
+            if start >= last_end:
+                last_end = end
+                word = match.group()
+                # Leave out an accepted character before or after the word
+                if word in self.word_score:
+                    found.append((word, start, end))
+                elif word[:-1] in self.word_score:
+                    found.append((word[:-1], start, end - 1))
+                else:
+                    found.append((word[1:], start + 1, end))
+        return found
+
+    def count_long_sentence(self, sentence: str) -> dict:
+        '''
+        Runs the matcher on a sentence longer than max_sentence_length according to long_sentence_policy, so that the
+        time spent on a single pasted page of text stays bounded ('truncate') or linear in its length ('split', 'flag').
+
+                Parameters:
+                        sentence (str): The string containing the sentence to be characterized.
+                Returns:
+                        word_counts (dict): The wordlist words found in the sentence and their frequency, in order of first match
+        '''
+        policy = self.long_sentence_policy
+        self.long_sentences += 1
+        if self.stats is not None:
+            self.stats.long_sentences += 1
+        logger.warning("Sentence of %d characters is longer than max_sentence_length %d (policy %s): %.60s...",
+                       len(sentence), self.max_sentence_length, policy, sentence)
+
+        if policy == 'flag':
+            return self.count_matches(sentence)
+        if policy == 'truncate':
+            return self.count_matches(next(self.sentence_windows(sentence, self.max_sentence_length)))
+        if policy == 'split':
+            word_counts = defaultdict(int)
+            for window in self.sentence_windows(sentence, self.max_sentence_length):
+                for word, count in self.count_matches(window).items():
+                    word_counts[word] += count
+            return word_counts
+        raise ValueError(f"Unknown long_sentence_policy {policy}, use 'truncate', 'split' or 'flag'")
+
+    def sentence_windows(self, sentence: str, limit: int):
+        '''
+        Yields consecutive windows of at most limit characters covering a sentence. Windows are cut at the last space
+        before the limit that no wordlist phrase spans (checked with spans_boundary), or at the limit if there is none.
+
+                Parameters:
+                        sentence (str): The sentence to cut
+                        limit (int): The maximum length of a window
+                Returns:
+                        windows (generator): The windows, in order
+        '''
+        # A phrase check only needs the characters within the longest phrase of the cut
+        reach = self.max_word_length
+        start = 0
+        while len(sentence) - start > limit:
+            end = start + limit
+            cut = sentence.rfind(' ', start + 1, end + 1)
+            while cut > start and self.spans_boundary(sentence[max(start, cut - reach):cut], sentence[cut+1:cut+1+reach]):
+                cut = sentence.rfind(' ', start + 1, cut)
+            if cut <= start:
+                yield sentence[start:end]
+                start = end
+            else:
+                yield sentence[start:cut]
+                start = cut + 1
+        yield sentence[start:]
+
+    def match_item(self, item, wordlist: Wordlist, mode = 'both', sublevels = False):
+        '''
+        Finds the wordlist words in an item for the given mode ('self', 'other' or 'both'). The self and other sentences
+        are each matched once and the result is stored on the item, so every mode and every module using the same
+        wordlist and language shares one matching pass. The 'both' result is the merge of the self and other results.
+        A wordlist phrase spanning the self/other boundary (e.g. self ending in 'feel' and other starting with 'down')
+        can only be found in the joined sentence, so for those items the joined sentence is matched instead.
+
+                Parameters:
+                        item (Item): The LEAS item to be characterized.
+                        wordlist (Wordlist): The wordlist to be searched
+                        mode (str): Which part of the item to match, 'self', 'other' or 'both'
+                        sublevels (bool): Whether to also return the subscores of the matching words
+                Returns:
+                        The same arrays as match_words
+        '''
+        if self.wordlist is None or self.wordlist.unique_id != wordlist.unique_id:
+            self.add_wordlist(wordlist)
+
+        self_sentence, other_sentence = item.self_sentence, item.other_sentence
+        matches = getattr(item, 'matches', None)
+        if matches is None and hasattr(item, 'matches'):
+            matches = item.matches = {}
+        elif not isinstance(matches, dict):
+            matches = None
+        key = self.match_key(wordlist)
+        record = None if matches is None else matches.get(key)
+        #Discard results computed for sentences that have since been changed (e.g. by attempt_auto_self_other)
+        if record is None or record[0] is not self_sentence or record[1] is not other_sentence:
+            record = [self_sentence, other_sentence, None, None, None]
+            if matches is not None:
+                matches[key] = record
+
+        if mode == 'self':
+            slot = 2
+        elif mode == 'other':
+            slot = 3
+        else:
+            slot = 4
+
+        stats = self.stats
+        if stats is not None:
+            if record[slot] is None:
+                stats.item_cache_misses += 1
+            else:
+                stats.item_cache_hits += 1
+
+        if record[slot] is None:
+            if slot == 4 and self.spans_boundary(self_sentence, other_sentence):
+                logger.debug("Wordlist phrase spans the self/other boundary, matching the joined sentence")
+                record[4] = self.match_words(self_sentence + ' ' + other_sentence, wordlist, sublevels=True)
+            elif slot == 4:
+                if record[2] is None:
+                    record[2] = self.match_words(self_sentence, wordlist, sublevels=True)
+                if record[3] is None:
+                    record[3] = self.match_words(other_sentence, wordlist, sublevels=True)
+                record[4] = self.merge_matches(record[2], record[3])
+            else:
+                record[slot] = self.match_words(record[slot - 2], wordlist, sublevels=True)
 
-        # Prepare the output list
-        frequency, matching_words, scores, subscores = [], [], [], []
-        for word, f in word_counts.items():
-            #Double check to make sure its actually in the dictionary 
-            if word in self.word_score:
-                matching_words.append(word)
-                frequency.append(f)
-                scores.append(self.word_score.get(word, 0))
-                subscores.append(self.word_subscore.get(word, 0))
-        frequency = np.array(frequency)
-        matching_words = np.array(matching_words)
-        scores = np.array(scores)
-        subscores = np.array(subscores)
         if sublevels:
-            return frequency, matching_words, scores, subscores
-        return frequency, matching_words, scores
+            return record[slot]
+        return record[slot][:3]
+
+    def merge_matches(self, first, second):
+        '''
+        Combines two match_words results (with sublevels) into the result for the two sentences joined together.
+
+                Parameters:
+                        first (tuple): frequency, matching_words, scores, subscores of the first sentence
+                        second (tuple): frequency, matching_words, scores, subscores of the second sentence
+                Returns:
+                        frequency, matching_words, scores, subscores of the combined sentence
+        '''
+        if first[1].size == 0:
+            return second
+        if second[1].size == 0:
+            return first
+        position = {word: i for i, word in enumerate(first[1])}
+        frequency = list(first[0])
+        new = []
+        for i, word in enumerate(second[1]):
+            if word in position:
+                frequency[position[word]] += second[0][i]
+            else:
+                frequency.append(second[0][i])
+                new.append(i)
+        return (np.array(frequency),
+                np.concatenate((first[1], second[1][new])),
+                np.concatenate((first[2], second[2][new])),
+                np.concatenate((first[3], second[3][new])))
+
+    def spans_boundary(self, first: str, second: str) -> bool:
+        '''
+        Checks whether a multi-word wordlist phrase could match across the space joining two sentences, or whether a
+        word starting or ending with a character that is not a word character (e.g. 'glücklich ') is found next to or
+        over that space, where its match depends on both sentences.
+
+                Parameters:
+                        first (str): The sentence before the boundary
+                        second (str): The sentence after the boundary
+                Returns:
+                        (bool): True if the sentences must be matched joined together.
+        '''
+        if self.irregular_words:
+            reach = self.max_irregular_length + 1
+            joined = first[-reach:] + ' ' + second[:reach]
+            boundary = min(len(first), reach)
+            for word in self.irregular_words:
+                start = joined.find(word)
+                while start != -1:
+                    if start <= boundary + 1 and start + len(word) >= boundary:
+                        return True
+                    start = joined.find(word, start + 1)
+        if not first or not second:
+            return False
+        for head, tail in self.boundary_phrases.get(second.split(' ', 1)[0], ()):
+            if first.endswith(head) and second.startswith(tail):
+                return True
+        return False
 
     def __init__(self, language='en') -> None:
 
+        self._tuple_ids = {}
+        self._variants = {}
+        self.set_language(language)
+        self.bind()
+        return
+
+    def set_language(self, language: str) -> None:
+        '''
+        Sets the language of the module and the characters accepted around the wordlist words in that language. The
+        wordlist is added again on the next match.
+
+                Parameters:
+                        language (str): The language of the sentences ('en', 'de', 'he', 'ar', ...)
+                Returns:
+
+        '''
         self.language = language
         self.regex = None
         self.wordlist = None
+        self.boundary_phrases = {}
+        self.irregular_words = []
+        self.max_irregular_length = 0
+        self.max_word_length = 0
+        self.token_matcher = None
+        self.wordlist_fingerprint = None
         # Initialize with basic word boundary characters (space, punctuation)
         self.acceptable_prev_chars = ' \t\n\r.,!?;:()[]{}"-'
         self.acceptable_next_chars = ' \t\n\r.,!?;:()[]{}"-'
@@ -244,14 +622,165 @@ class ScoringModule:
             self.acceptable_prev_chars += '،ءأؤإئابةتثجحخدذرزسشصضطظعغفقكلمنهوىي'
         return
 
+    def for_language(self, language: str):
+        '''
+        Returns the module to score the items of a language with: the module itself for its own language (or None),
+        otherwise a copy of it set to that language, created once per language so that its matchers are built once.
+        The copy shares the helper modules held as attributes, which keep their own (default) language, and the id,
+        stats and union of the module are passed on to the copy on every call.
+
+                Parameters:
+                        language (str): The language of the items
+                Returns:
+                        module (ScoringModule): The module to use for the items of that language
+        '''
+        if language is None or language == self.language:
+            return self
+        variant = self._variants.get(language)
+        if variant is None:
+            variant = copy.copy(self)
+            variant._variants = {}
+            variant.stats = None
+            variant.set_language(language)
+            variant.bind()
+            self._variants[language] = variant
+            logger.debug("Created %s variant of scoring module %s", language, self.id)
+        for name, value in self.__dict__.items():
+            if isinstance(value, ScoringModule):
+                setattr(variant, name, value)
+        # Set while scoring, e.g. by Survey.score_wordlists or ScoringStats.attach
+        variant.id = self.id
+        variant.stats = self.stats
+        variant.union = self.union
+        return variant
+
+    def configure(self, helper):
+        '''
+        Gives a helper module held as an attribute (e.g. the 3345 module exp scores with) the matching configuration of
+        this module: its matcher, max_edit_distance, match_cache, max_sentence_length and long_sentence_policy. Called
+        by the module before using the helper, so that later changes are passed on. The helper keeps its language, the
+        default language these modules have always matched in.
+
+                Parameters:
+                        helper (ScoringModule): The helper module
+                Returns:
+                        helper (ScoringModule): The same module, configured
+        '''
+        if helper.matcher != self.matcher or helper.max_edit_distance != self.max_edit_distance:
+            helper.matcher = self.matcher
+            helper.max_edit_distance = self.max_edit_distance
+            # The matcher is built again on the next match
+            helper.wordlist = None
+        helper.match_cache = self.match_cache
+        helper.max_sentence_length = self.max_sentence_length
+        helper.long_sentence_policy = self.long_sentence_policy
+        return helper
+
+    def bind(self) -> None:
+        '''
+        Validates the calling convention declared by the module (needs_wordlist, returns_tuple) against its execute method
+        and precomputes scorer, so that Item.score does not inspect the module for every item. Called at construction;
+        call it again if execute is replaced afterwards.
+
+                Parameters:
+
+                Returns:
+
+        '''
+        signature = inspect.signature(self.execute)
+        if self.needs_wordlist is None:
+            self.needs_wordlist = len(signature.parameters) >= 2
+        try:
+            if self.needs_wordlist:
+                signature.bind(None, None)
+            elif len(signature.parameters) > 0:
+                signature.bind(None)
+        except TypeError:
+            raise TypeError(f"{type(self).__name__}.execute does not match needs_wordlist = {self.needs_wordlist}")
+        if self.returns_tuple not in (None, True, False):
+            raise TypeError(f"{type(self).__name__}.returns_tuple must be a bool")
+
+        if self.needs_wordlist:
+            self.scorer = self.execute
+        else:
+            execute = self.execute
+            self.scorer = lambda item, wordlist: execute(item)
+        return
+
+    def tuple_ids(self, length: int) -> list:
+        '''
+        Returns the column ids of a tuple result (id+"1", id+"2", ...), computed once per module id and length.
+
+                Parameters:
+                        length (int): The length of the tuple
+                Returns:
+                        ids (list): The column ids
+        '''
+        key = (self.id, length)
+        ids = self._tuple_ids.get(key)
+        if ids is None:
+            ids = [self.id + str(i+1) for i in range(length)]
+            self._tuple_ids[key] = ids
+        return ids
+
+    def match_language(self) -> str:
+        '''
+        Returns the language the matches of the module are cached under (Item.matches and match_cache): the module's
+        language, followed by the matcher when it finds different words than the regex ('segment', 'lemma', 'fuzzy')
+        '''
+        if self.matcher in ('token', 'regex'):
+            return self.language
+        if self.matcher == 'fuzzy':
+            return f"{self.language}:fuzzy{self.max_edit_distance}"
+        return f"{self.language}:{self.matcher}"
+
+    def match_key(self, wordlist: Wordlist) -> tuple:
+        '''
+        Returns the key the matches of the module are stored under in Item.matches: the wordlist, the match_language
+        and, for modules with a max_sentence_length, the limit and the long sentence policy, since a truncated match
+        cannot be reused by a module matching the whole sentence
+        '''
+        limit = self.max_sentence_length
+        return (wordlist.unique_id, self.match_language(), limit, self.long_sentence_policy if limit is not None else None)
+
     def add_wordlist(self, wordlist: Wordlist):
         self.wordlist = wordlist
+        self.wordlist_fingerprint = None
         # Create a mapping from word/phrase to score
         self.word_score = dict(zip(wordlist.words, wordlist.scores))
         self.word_subscore = dict(zip(wordlist.words, wordlist.subclasses))
 
+        # Index every way a phrase can be split at one of its spaces by the first word after the split
+        self.boundary_phrases = defaultdict(list)
+        for word in wordlist.words:
+            word = str(word)
+            for i, c in enumerate(word):
+                if c == ' ':
+                    tail = word[i+1:]
+                    self.boundary_phrases[tail.split(' ', 1)[0]].append((word[:i], tail))
+        # Words starting or ending with a character that is not a word character (e.g. 'glücklich ') can match the
+        # space joining two sentences or depend on the characters around it
+        self.irregular_words = [str(word) for word in wordlist.words
+                                if not (_TOKEN.match(str(word)[:1]) and _TOKEN.match(str(word)[-1:]))]
+        self.max_irregular_length = max(map(len, self.irregular_words), default=0)
+
         # Sort the words by length in descending order to match longer phrases first
         words_sorted = sorted(wordlist.words, key=len, reverse=True)
+        self.max_word_length = len(str(words_sorted[0])) if len(words_sorted) else 0
+        self.token_matcher = None
+        if self.matcher == 'token':
+            self.token_matcher = TokenMatcher(wordlist.words, self.acceptable_prev_chars, self.acceptable_next_chars)
+        elif self.matcher == 'segment':
+            matcher = SEGMENTERS.get(self.language, TokenMatcher)
+            self.token_matcher = matcher(wordlist.words, self.acceptable_prev_chars, self.acceptable_next_chars)
+        elif self.matcher == 'lemma':
+            self.token_matcher = LemmaMatcher(wordlist.words, self.acceptable_prev_chars, self.acceptable_next_chars,
+                                              Lemmatizer.get(self.language))
+        elif self.matcher == 'fuzzy':
+            self.token_matcher = FuzzyMatcher(wordlist.words, self.acceptable_prev_chars, self.acceptable_next_chars,
+                                              self.max_edit_distance)
+        elif self.matcher != 'regex':
+            raise ValueError(f"Unknown matcher {self.matcher}, use 'token', 'segment', 'lemma', 'fuzzy' or 'regex'")
 
         # Handle empty wordlist case
         if len(words_sorted) == 0:
@@ -14,6 +14,7 @@ except:
 class sentiment(ScoringModule):
 
     type = "per item"
+    returns_tuple = True
     return_length = 4
     id = "sentiment-"
 
@@ -21,12 +22,14 @@ class sentiment(ScoringModule):
 
     def __init__(self, language = 'en') -> None:
         super().__init__(language=language)
+        return
 
+    def set_language(self, language: str) -> None:
+        super().set_language(language)
         if self.language == 'de':
             self.model = SentimentModel()
         else:
             self.analyzer = SentimentIntensityAnalyzer()
-
         return
 
     def execute(self, item, wordlist):
@@ -43,16 +43,11 @@ class vocab(ScoringModule):
                         score (int): The score for the item 
                         
         '''
-        total_sentence = ""
+        vocabulary = set()
         for item in items:
-            if self.mode == "self":
-                sentence = item.self_sentence
-            elif self.mode == "other":
-                sentence = item.other_sentence
-            else:
-                sentence = item.self_sentence + ' ' + item.other_sentence
-            total_sentence += " " + sentence + ' '
-        
-        words = total_sentence.split(' ')
-        words = [word for word in words if word != '']
-        return len(set(words))
\ No newline at end of file
+            if self.mode != "other":
+                vocabulary.update(item.self_sentence.split(' '))
+            if self.mode != "self":
+                vocabulary.update(item.other_sentence.split(' '))
+        vocabulary.discard('')
+        return len(vocabulary)
@@ -0,0 +1,189 @@
+import json
+import time
+
+class ModuleStats:
+    """
+    Timing and throughput of one scoring module during a Survey.score run.
+
+    ...
+
+    Attributes
+    ----------
+    id : str
+        The id of the scoring module
+    type : str
+        'per item' or 'per respondent'
+    wall_time : float
+        Seconds spent running the module over the survey
+    calls : int
+        Number of times the module was executed (unique items with dedup, respondents for per respondent modules)
+    items : int
+        Number of items that received the module's scores
+    matcher_time : float
+        Seconds spent finding wordlist matches (ScoringModule.match_words)
+    match_calls : int
+        Number of match_words calls
+    item_cache_hits, item_cache_misses : int
+        Lookups of the per item match results (Item.matches) that were reused or had to be computed
+    cache_hits, cache_misses : int
+        Lookups of the persistent MatchCache, if enabled
+    long_sentences : int
+        Number of sentences longer than ScoringModule.max_sentence_length
+    """
+    fields = ['wall_time', 'calls', 'items', 'matcher_time', 'match_calls',
+              'item_cache_hits', 'item_cache_misses', 'cache_hits', 'cache_misses', 'long_sentences']
+
+    def __init__(self, id, type=None) -> None:
+        self.id = id
+        self.type = type
+        for field in self.fields:
+            setattr(self, field, 0)
+        self.wall_time = 0.0
+        self.matcher_time = 0.0
+        return
+
+    @property
+    def reduction_time(self) -> float:
+        '''Seconds spent outside the matcher, turning matches into scores'''
+        return max(0.0, self.wall_time - self.matcher_time)
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.wall_time if self.wall_time > 0 else 0.0
+
+    @staticmethod
+    def rate(hits: int, misses: int) -> float:
+        return hits / (hits + misses) if hits + misses else 0.0
+
+    def to_dict(self) -> dict:
+        stats = {'id': self.id, 'type': self.type}
+        for field in self.fields:
+            stats[field] = getattr(self, field)
+        stats['reduction_time'] = self.reduction_time
+        stats['items_per_second'] = self.items_per_second
+        stats['item_cache_hit_rate'] = self.rate(self.item_cache_hits, self.item_cache_misses)
+        stats['cache_hit_rate'] = self.rate(self.cache_hits, self.cache_misses)
+        return stats
+
+
+class ScoringStats:
+    """
+    Per module timing, throughput and cache statistics collected by Survey.score(..., collect_stats=True).
+    Scoring modules record their matcher time through their stats attribute, which is None (and costs a single
+    check per call) when statistics are not collected.
+
+    ...
+
+    Attributes
+    ----------
+    modules : dict
+        The ModuleStats of every module, by module id, in the order the modules were run
+    wall_time : float
+        Seconds spent in Survey.score
+    items : int
+        Number of items in the survey
+    unique_items : int
+        Number of unique items (equal to items without dedup)
+
+    Methods
+    -------
+    module(scoring_module)
+        returns the ModuleStats of a module, creating it if needed
+    attach(scoring_module) / detach(scoring_module)
+        starts / stops recording the matcher statistics of a module
+    to_dict()
+        returns the statistics as a dictionary
+    save(filename)
+        writes the statistics as a JSON report
+    """
+    def __init__(self) -> None:
+        self.modules = {}
+        self.wall_time = 0.0
+        self.items = 0
+        self.unique_items = 0
+        self._start = None
+        return
+
+    def start(self) -> None:
+        self._start = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._start is not None:
+            self.wall_time += time.perf_counter() - self._start
+            self._start = None
+
+    def module(self, scoring_module) -> ModuleStats:
+        '''
+        Returns the ModuleStats of a module, creating it if needed
+
+                Parameters:
+                        scoring_module (ScoringModule): The scoring module
+                Returns:
+                        stats (ModuleStats): The statistics of the module's id
+        '''
+        id = getattr(scoring_module, 'id', str(scoring_module))
+        stats = self.modules.get(id)
+        if stats is None:
+            stats = ModuleStats(id, getattr(scoring_module, 'type', None))
+            self.modules[id] = stats
+        return stats
+
+    @staticmethod
+    def _helpers(scoring_module) -> list:
+        # Modules such as exp or highestN-allinone match through helper modules held as attributes
+        from veta.scoring_modules.scoring_module import ScoringModule
+        modules = [scoring_module]
+        for value in getattr(scoring_module, '__dict__', {}).values():
+            if isinstance(value, ScoringModule):
+                modules.append(value)
+        return modules
+
+    def attach(self, scoring_module) -> ModuleStats:
+        '''
+        Makes the module (and its helper modules) record their matcher statistics in its ModuleStats
+
+                Parameters:
+                        scoring_module (ScoringModule): The scoring module
+                Returns:
+                        stats (ModuleStats): The statistics of the module
+        '''
+        stats = self.module(scoring_module)
+        for module in self._helpers(scoring_module):
+            if hasattr(module, 'stats'):
+                module.stats = stats
+        return stats
+
+    def detach(self, scoring_module) -> None:
+        for module in self._helpers(scoring_module):
+            if hasattr(module, 'stats'):
+                module.stats = None
+        return
+
+    def to_dict(self) -> dict:
+        return {
+            'wall_time': self.wall_time,
+            'items': self.items,
+            'unique_items': self.unique_items,
+            'dedup_ratio': self.items / self.unique_items if self.unique_items else 1.0,
+            'modules': [stats.to_dict() for stats in self.modules.values()],
+        }
+
+    def save(self, filename: str) -> None:
+        '''
+        Writes the statistics as a JSON report
+
+                Parameters:
+                        filename (str): The path of the report
+                Returns:
+
+        '''
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return
+
+    def __str__(self) -> str:
+        ret = "Scoring took {:.3f}s for {} items ({} unique)\n".format(self.wall_time, self.items, self.unique_items)
+        for stats in self.modules.values():
+            ret += "{}: {:.3f}s, {} calls, {:.0f} items/s, matcher {:.3f}s, reduction {:.3f}s\n".format(
+                stats.id, stats.wall_time, stats.calls, stats.items_per_second, stats.matcher_time, stats.reduction_time)
+        return ret
@@ -0,0 +1,363 @@
+
+from veta.token_matcher import TokenMatcher
+from veta.normalization import ARABIC_MARKS
+
+# Hebrew prefix letters (ו and, ה the, ב in, ל to, ש that) that can be written attached to a word
+HEBREW_PREFIXES = "לושבה"
+# Arabic letter variants written interchangeably, folded to a single letter (hamzated alefs, alef maqsura, ta marbuta
+# and the Persian kaf and yeh)
+ARABIC_VARIANTS = {'أ': 'ا', 'إ': 'ا', 'آ': 'ا', 'ٱ': 'ا', 'ى': 'ي', 'ة': 'ه', 'ک': 'ك', 'ی': 'ي'}
+# Arabic proclitics: an optional conjunction (و and, ف then), preposition (ب with, ل to, ك like) and article (ال the),
+# with ل followed by ال written لل
+ARABIC_PROCLITICS = frozenset(
+    (conjunction + preposition + article).replace('لال', 'لل')
+    for conjunction in ('', 'و', 'ف') for preposition in ('', 'ب', 'ل', 'ك') for article in ('', 'ال')
+) - {''}
+# German linking morphemes (Fugenelemente) written between the parts of a compound (Liebeskummer, Freudentränen)
+GERMAN_LINKS = ('', 's', 'es', 'n', 'en')
+# Marks the end of a word in a Trie
+_END = ''
+
+class Trie:
+    """
+    A character trie of wordlist words used to segment tokens in a single left to right pass.
+
+    ...
+
+    Attributes
+    ----------
+    root : dict
+        Nested dictionaries keyed by character. A node containing the key '' ends a word.
+
+    Methods
+    -------
+    add(word)
+        adds a word
+    ends(text, start)
+        yields the end positions of the words found in text starting at start
+    """
+    def __init__(self, words=()) -> None:
+        self.root = {}
+        for word in words:
+            self.add(word)
+        return
+
+    def add(self, word: str) -> None:
+        node = self.root
+        for c in word:
+            node = node.setdefault(c, {})
+        node[_END] = word
+        return
+
+    def ends(self, text: str, start: int):
+        node = self.root
+        for position in range(start, len(text)):
+            node = node.get(text[position])
+            if node is None:
+                return
+            if _END in node:
+                yield position + 1
+
+
+class PrefixMatcher(TokenMatcher):
+    """
+    A token matcher for languages writing short words (conjunctions, prepositions, articles) attached to the next
+    word. Replaces the acceptable prefix characters of the regex, which accept any of them (for Arabic, any letter) in
+    front of every wordlist word. Each distinct token is looked up once (see TokenMatcher.entry) and counts as:
+        - the wordlist word it is equal to, otherwise
+        - the longest wordlist word left after removing the prefixes returned by strip_prefixes
+    Wordlist phrases are found the same way when their first word is written with prefixes.
+
+    ...
+
+    Attributes
+    ----------
+    min_stem_length : int
+        The minimum number of letters left after removing prefixes
+
+    Methods
+    -------
+    strip_prefixes(token, start)
+        returns the positions in the token where a word can start after prefixes attached at start
+    lookup(token, offset)
+        returns the index entry of the word starting at offset in the token after removing prefixes
+    """
+    min_stem_length = 2
+
+    def __init__(self, words, acceptable_prev_chars: str = '', acceptable_next_chars: str = '') -> None:
+        super().__init__(words, acceptable_prev_chars, acceptable_next_chars)
+        # The prefixes are handled here instead of by the regex
+        self.supported = True
+        return
+
+    def strip_prefixes(self, token: str, start: int = 0) -> list:
+        raise NotImplementedError("Subclasses must implement the strip_prefixes method")
+
+    def lookup(self, token: str, offset: int):
+        return self.index.get(token[offset:])
+
+    def entry(self, token: str):
+        entry = super().entry(token)
+        words, phrases = entry if entry is not None else ((), [])
+        stripped = self.strip_prefixes(token)
+        # Phrases whose first word is written with prefixes
+        for offset in stripped:
+            indexed = self.lookup(token, offset)
+            if indexed is not None:
+                phrases = phrases + [(phrase, offset) for phrase in indexed[1]]
+        phrases.sort(key=lambda phrase: len(phrase[0]), reverse=True)
+
+        if not words:
+            for offset in stripped:
+                indexed = self.lookup(token, offset)
+                if indexed is not None and indexed[0] is not None:
+                    words = (indexed[0],)
+                    break
+        if not words and not phrases:
+            return None
+        return words, phrases
+
+
+class HebrewSegmenter(PrefixMatcher):
+    """
+    A token matcher for Hebrew (ScoringModule.matcher = 'segment') that handles the attached prefix letters and the
+    emotion words written without a space between them, replacing the raw substring patterns of the Hebrew regex.
+    Each distinct token is segmented once (see TokenMatcher.entry) and counts as:
+        - the wordlist word it is equal to, otherwise
+        - the wordlist word left after removing up to max_prefixes prefix letters (ושמח, ובשמחה), otherwise
+        - the wordlist words it is made of, when it can be covered entirely by two or more wordlist words longer than
+          two letters, each optionally preceded by prefix letters (שמחועצוב), using the fewest words.
+    Unlike the regex, a wordlist word inside a longer word that is not made of wordlist words does not match.
+
+    ...
+
+    Attributes
+    ----------
+    prefixes : str
+        The prefix letters
+    max_prefixes : int
+        The maximum number of prefix letters removed before a word
+    min_piece_length : int
+        The minimum length of the wordlist words a run-together token is split into
+    """
+    prefixes = HEBREW_PREFIXES
+    max_prefixes = 3
+    min_piece_length = 3
+    min_stem_length = 1
+
+    def __init__(self, words, acceptable_prev_chars: str = '', acceptable_next_chars: str = '') -> None:
+        super().__init__(words, acceptable_prev_chars, acceptable_next_chars)
+        self.trie = Trie(word for word, indexed in self.index.items()
+                         if indexed[0] is not None and len(word) >= self.min_piece_length)
+        return
+
+    def strip_prefixes(self, token: str, start: int = 0) -> list:
+        '''Returns the positions after each prefix letter attached at the start of the token, up to max_prefixes'''
+        positions = []
+        position = start
+        while (position < len(token) - self.min_stem_length and len(positions) < self.max_prefixes
+               and token[position] in self.prefixes):
+            position += 1
+            positions.append(position)
+        return positions
+
+    def entry(self, token: str):
+        entry = super().entry(token)
+        if entry is not None and entry[0]:
+            return entry
+        words = self.segment(token)
+        if not words:
+            return entry
+        return words, entry[1] if entry is not None else []
+
+    def segment(self, token: str) -> tuple:
+        '''
+        Splits a token into the fewest wordlist words covering it, each optionally preceded by prefix letters
+
+                Parameters:
+                        token (str): The token
+                Returns:
+                        words (tuple): The wordlist words, in order, or an empty tuple if the token is not made of at least two words
+        '''
+        # best[i] = (number of words, start of the previous piece, word) of the best split of token[:i]
+        best = [None] * (len(token) + 1)
+        best[0] = (0, None, None)
+        for position in range(len(token)):
+            if best[position] is None:
+                continue
+            count = best[position][0] + 1
+            for start in [position] + self.strip_prefixes(token, position):
+                for end in self.trie.ends(token, start):
+                    if best[end] is None or count < best[end][0]:
+                        best[end] = (count, position, token[start:end])
+        if best[-1] is None or best[-1][0] < 2:
+            return ()
+        words = []
+        position = len(token)
+        while position:
+            count, previous, word = best[position]
+            words.append(word)
+            position = previous
+        return tuple(reversed(words))
+
+
+class ArabicMatcher(PrefixMatcher):
+    """
+    A token matcher for Arabic (ScoringModule.matcher = 'segment'). The wordlist words and the sentences are
+    normalized with a translation table removing the diacritics (harakat, tatweel) and folding the letter variants
+    (ARABIC_VARIANTS), then the proclitics (ARABIC_PROCLITICS: و، ف، ب، ل، ك، ال and their combinations) are removed
+    before looking up a token, replacing the regex that accepts any Arabic letter before a wordlist word. After a
+    proclitic containing the article, the stem is also looked up with the article (للحزن matches الحزن).
+    The counts and matches are reported under the original wordlist words and positions of the sentence.
+
+    ...
+
+    Attributes
+    ----------
+    proclitics : frozenset
+        The proclitics removed before a word
+    table : dict
+        The str.translate table normalizing the wordlist words and the sentences
+    originals : dict
+        Maps each normalized wordlist word to the wordlist word
+    """
+    proclitics = ARABIC_PROCLITICS
+    table = str.maketrans({**dict.fromkeys(ARABIC_MARKS), **{ord(c): v for c, v in ARABIC_VARIANTS.items()}})
+
+    def __init__(self, words, acceptable_prev_chars: str = '', acceptable_next_chars: str = '') -> None:
+        self.originals = {}
+        for word in words:
+            self.originals.setdefault(str(word).translate(self.table), str(word))
+        super().__init__(list(self.originals), acceptable_prev_chars, acceptable_next_chars)
+        self.lengths = sorted({len(proclitic) for proclitic in self.proclitics})
+        return
+
+    def strip_prefixes(self, token: str, start: int = 0) -> list:
+        '''Returns the positions after each proclitic the token starts with, shortest first'''
+        return [start + length for length in self.lengths
+                if len(token) - start - length >= self.min_stem_length and token[start:start + length] in self.proclitics]
+
+    def lookup(self, token: str, offset: int):
+        indexed = self.index.get(token[offset:])
+        if indexed is None and token[offset - 2:offset] in ('ال', 'لل'):
+            indexed = self.index.get('ال' + token[offset:])
+        return indexed
+
+    def matches(self, sentence: str):
+        normalized = sentence.translate(self.table)
+        found = super().matches(normalized)
+        if found is None:
+            return None
+        originals = self.originals
+        if len(normalized) == len(sentence):
+            return [(originals[word], start, stop) for word, start, stop in found]
+        # The diacritics are removed, map the positions back to the sentence
+        kept = [i for i, c in enumerate(sentence) if self.table.get(ord(c), c) is not None]
+        return [(originals[word], kept[start], kept[stop - 1] + 1) for word, start, stop in found]
+
+
+class GermanDecompounder(TokenMatcher):
+    """
+    A token matcher for German (ScoringModule.matcher = 'segment') that splits compounds whose parts are wordlist
+    words (Wutausbruch, Trauergefühl, Liebeskummer, Todesangst) with a trie of the wordlist words and the linking
+    morphemes (GERMAN_LINKS). Each distinct token is split once (see TokenMatcher.entry) and counts as:
+        - the wordlist word it is equal to, otherwise
+        - the wordlist words found at the start of its parts, each followed by an optional linking morpheme and at
+          least min_rest_length letters, and the wordlist word ending it, keeping the split covering the most letters.
+    The parts of the compound that are not wordlist words are skipped.
+
+    ...
+
+    Attributes
+    ----------
+    links : tuple
+        The linking morphemes accepted after a part
+    min_piece_length : int
+        The minimum length of the wordlist words a compound is split into
+    min_rest_length : int
+        The minimum length of the rest of a compound next to a wordlist word
+    max_compound_length : int
+        Longer tokens (e.g. pasted text without spaces) are not split
+
+    parts : dict
+        The split of every compound and part of a compound seen so far, dropped with the vocabulary (see reset)
+
+    Methods
+    -------
+    decompose(token)
+        returns the wordlist words a compound is made of
+    """
+    links = GERMAN_LINKS
+    min_piece_length = 3
+    min_rest_length = 4
+    max_compound_length = 64
+
+    def __init__(self, words, acceptable_prev_chars: str = '', acceptable_next_chars: str = '') -> None:
+        super().__init__(words, acceptable_prev_chars, acceptable_next_chars)
+        self.singles = {word for word, indexed in self.index.items()
+                        if indexed[0] is not None and len(word) >= self.min_piece_length}
+        self.trie = Trie(self.singles)
+        self.parts = {}
+        return
+
+    def reset(self) -> None:
+        super().reset()
+        self.parts = {}
+        return
+
+    def entry(self, token: str):
+        entry = super().entry(token)
+        if entry is not None and entry[0]:
+            return entry
+        words = self.decompose(token)
+        if not words:
+            return entry
+        return words, entry[1] if entry is not None else []
+
+    def decompose(self, token: str) -> tuple:
+        '''
+        Splits a compound into the wordlist words it is made of
+
+                Parameters:
+                        token (str): The compound
+                Returns:
+                        words (tuple): The wordlist words, in order, or an empty tuple if none was found
+        '''
+        if len(token) > self.max_compound_length:
+            return ()
+        words = self.parts.get(token)
+        if words is not None:
+            return words
+        best, covered = (), 0
+        # A wordlist word ending the compound (Todesangst)
+        for start in range(self.min_rest_length, len(token) - self.min_piece_length + 1):
+            if token[start:] in self.singles:
+                best, covered = (token[start:],), len(token) - start
+                break
+        # A wordlist word starting the compound, followed by a linking morpheme and the rest (Liebeskummer)
+        for end in self.trie.ends(token, 0):
+            for link in self.links:
+                rest = end + len(link)
+                if len(token) - rest < self.min_rest_length or not token.startswith(link, end):
+                    continue
+                rest_words = self.parts_of(token[rest:])
+                candidate = (token[:end],) + rest_words
+                length = sum(len(word) for word in candidate)
+                if length > covered:
+                    best, covered = candidate, length
+        self.parts[token] = best
+        return best
+
+    def parts_of(self, part: str) -> tuple:
+        '''Returns the wordlist word a part of a compound is, or the wordlist words it is made of'''
+        if part in self.singles:
+            return (part,)
+        return self.decompose(part)
+
+
+# The segmenting matcher of each language, used by ScoringModule.matcher = 'segment'
+SEGMENTERS = {
+    'he': HebrewSegmenter,
+    'ar': ArabicMatcher,
+    'de': GermanDecompounder,
+}
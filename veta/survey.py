@@ -1,16 +1,27 @@
 import openpyxl
 
 from veta.item import Item
-from veta.respondent import Respondent
-from veta.wordlist import Wordlist
-from veta.logger import get_logger
+from veta.respondent import Respondent, route
+from veta.wordlist import Wordlist, WordlistDiff
+from veta.wordlist_union import WordlistUnion
+from veta.score_table import ScoreTable
+from veta.scoring_stats import ScoringStats
+from veta.language_detection import detect_language
+from veta.term_index import TermIndex, WordlistImpact, finds_by_tokens
+from veta.term_discovery import TermDiscovery
+from veta.fuzzy_matcher import FuzzyMatcher
+from veta.scoring_modules.scoring_module import ScoringModule
+from veta.logger import get_logger, per_item_level
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from sklearn.metrics import confusion_matrix
 import os 
+import copy
 import json
+import time
+from collections import Counter, defaultdict
 from scipy.stats import norm
 
 # Initialize logger for this module
@@ -50,6 +61,7 @@ class Survey:
         
         self.respondents = []
         self.wordlist = None
+        self.wordlists = {}
         if isinstance(wordlist_file,str):
             logger.info(f"Loading wordlist from file: {wordlist_file}")
             wordlist = Wordlist(wordlist_file)
@@ -57,7 +69,12 @@ class Survey:
 
         self.cols = [0,1,2]
         self.num_item_cols = 0
+        self.language_col = None
         self.summary = {}
+        self.score_table = None
+        self.dedup_report = {}
+        self.scoring_stats = None
+        self.term_index = None
         self.header = np.array(["ID", "Self", "Other"])
         
         logger.info("Survey initialized successfully")
@@ -106,6 +123,8 @@ class Survey:
                     other_sentence = ""
                 
                 item = res.add_item(self_sentence,other_sentence)
+                if self.language_col is not None:
+                    item.language = self.parse_language(data[i,self.language_col])
                 for col in self.cols[3:3+self.num_item_cols ]:
                     #print(self.header[col], col,  data[i,col])
                     item.add_additional_info(self.header[col], data[i,col])
@@ -129,6 +148,8 @@ class Survey:
                 res = Respondent()
             else:
                 res = Respondent(userid=str(userid))
+            if self.language_col is not None:
+                res.language = self.parse_language(data[i,self.language_col])
             self.add_respondent(res)
             #loop through data columns, starting with self_col
             #Assumes LEAS data is continuous
@@ -186,7 +207,12 @@ class Survey:
 
         return
     
-    def configure_columns(self, id_col, self_col, other_col, per_item_cols=[], per_res_cols=[]):
+    def configure_columns(self, id_col, self_col, other_col, per_item_cols=[], per_res_cols=[], language_col=None):
+        '''
+        Sets the columns of the survey file. The language column holds the language of each item (vertical layout) or
+        respondent (horizontal layout), e.g. 'en', 'de', 'he' or 'ar'.
+        '''
+        self.language_col = language_col
         self.cols = [id_col,self_col,other_col]
         for col in per_item_cols:
             self.cols.append(col)
@@ -196,23 +222,361 @@ class Survey:
         return
 
     def add_respondent(self, respondent):
-        logger.info(f"Adding respondent {getattr(respondent, 'id', 'unknown')} to survey")
+        level = per_item_level(logger)
+        if level:
+            logger.log(level, "Adding respondent %s to survey", getattr(respondent, 'id', 'unknown'))
         self.respondents.append(respondent)
-        if not (self.wordlist is None):
+        if not (self.wordlist is None) or self.wordlists:
             logger.debug("Adding wordlist to new respondent")
-            respondent.add_wordlist(self.wordlist)
-        logger.debug(f"Survey now has {len(self.respondents)} respondents")
+            self.route_wordlists([respondent])
+        logger.debug("Survey now has %d respondents", len(self.respondents))
         return
 
-    def score(self,*modules):
-        logger.info(f"Scoring survey with {len(modules)} modules across {len(self.respondents)} respondents")
-        
-        for i, respondent in enumerate(self.respondents):
-            logger.debug(f"Scoring respondent {i+1}/{len(self.respondents)} (ID: {getattr(respondent, 'id', 'unknown')})")
-            respondent.score(*modules)
-            
+    def attach_score_table(self) -> ScoreTable:
+        '''
+        Makes sure the scores of every item are stored in the survey's columnar ScoreTable, (re)building the table
+        if respondents or items were added since it was built.
+
+                Parameters:
+
+                Returns:
+                        score_table (ScoreTable): The table backing the item scores and respondent totals
+        '''
+        if self.score_table is None or not self.score_table.matches(self.respondents):
+            logger.debug("Building score table for %d respondents", len(self.respondents))
+            self.score_table = ScoreTable.from_respondents(self.respondents)
+        return self.score_table
+
+    def group_duplicates(self) -> list:
+        '''
+        Groups the items of all respondents that have the same cleaned self and other sentences, the same wordlist and
+        the same language. The raw input and the other data of the items are not compared. Items of a group share
+        their wordlist matches.
+
+                Parameters:
+
+                Returns:
+                        groups (list): Lists of identical items, in order of first appearance
+        '''
+        groups = {}
+        for respondent in self.respondents:
+            for item in respondent.items:
+                key = (item.self_sentence, item.other_sentence, id(item.wordlist), item.language or respondent.language)
+                group = groups.get(key)
+                if group is None:
+                    groups[key] = [item]
+                else:
+                    if group[0].matches is None:
+                        group[0].matches = {}
+                    item.matches = group[0].matches
+                    group.append(item)
+        return list(groups.values())
+
+    def score(self, *modules, dedup=False, collect_stats=False, index_terms=False):
+        '''
+        Scores all of the respondents using all of the specified scoring modules. With dedup, identical items
+        (see group_duplicates) are scored once per per item module and the scores are copied to the other items.
+        Only the cleaned sentences, the wordlist and the language of the items are compared, not their raw input or
+        any other data on the item, so dedup must only be used with modules that score an item from its sentences
+        and wordlist alone (all of the modules of veta.scoring_modules). The dedup ratio is stored in dedup_report.
+        With collect_stats, the per module
+        timing, throughput and cache statistics are stored in scoring_stats (a ScoringStats object).
+        Items with a language (Item.language, or the respondent's language) are scored in batches per language, with
+        the copy of each module for that language (ScoringModule.for_language) and the wordlist of that language
+        (see add_wordlist). With index_terms, the inverted index of the matches is stored in term_index afterwards
+        (see apply_wordlist_diff); otherwise the matches recorded on the items are dropped once they are scored.
+
+                Parameters:
+                        modules (tuple): the scoring modules to be run on the respondents' items.
+                        dedup (bool): Whether to score identical items only once
+                        collect_stats (bool): Whether to collect a ScoringStats of the run
+                        index_terms (bool): Whether to build the TermIndex of the survey
+                Returns:
+
+        '''
+        logger.info("Scoring survey with %d modules across %d respondents", len(modules), len(self.respondents))
+        stats = ScoringStats() if collect_stats else None
+        if stats is not None:
+            stats.start()
+        self.attach_score_table()
+
+        if not dedup and stats is None:
+            for i, respondent in enumerate(self.respondents):
+                logger.debug("Scoring respondent %d/%d (ID: %s)", i+1, len(self.respondents), getattr(respondent, 'id', 'unknown'))
+                respondent.score(*modules)
+            self.count_corrections(modules, [[item] for respondent in self.respondents for item in respondent.items])
+            self.index_matches(index_terms)
+            logger.info("Survey scoring completed")
+            return
+
+        if dedup:
+            groups = self.group_duplicates()
+        else:
+            groups = [[item] for respondent in self.respondents for item in respondent.items]
+        num_items = sum(len(group) for group in groups)
+        # The groups of each language, so that each module variant scores its items together
+        languages = {id(item): respondent.language for respondent in self.respondents for item in respondent.items}
+        batches = defaultdict(list)
+        for group in groups:
+            batches[group[0].language or languages[id(group[0])]].append(group)
+        if dedup:
+            self.dedup_report = {
+                "items": num_items,
+                "unique_items": len(groups),
+                "dedup_ratio": num_items / len(groups) if groups else 1.0,
+            }
+            logger.info("Scoring %d unique items out of %d (dedup ratio %.2f)", len(groups), num_items,
+                        self.dedup_report['dedup_ratio'])
+
+        for module in modules:
+            if stats is not None:
+                module_stats = stats.attach(module)
+                cache = getattr(module, 'match_cache', None)
+                cache_counts = (cache.hits, cache.misses) if cache is not None else None
+                start = time.perf_counter()
+
+            if module.type == "per item":
+                for language, batch in batches.items():
+                    variant = route(module, language)
+                    for group in batch:
+                        scores = group[0].compute_scores(variant)
+                        for item in group:
+                            item.scores.update(scores)
+            else:
+                for respondent in self.respondents:
+                    respondent.score(module)
+
+            if stats is not None:
+                module_stats.wall_time += time.perf_counter() - start
+                module_stats.calls += len(groups) if module.type == "per item" else len(self.respondents)
+                module_stats.items += num_items
+                if cache_counts is not None:
+                    module_stats.cache_hits += cache.hits - cache_counts[0]
+                    module_stats.cache_misses += cache.misses - cache_counts[1]
+                stats.detach(module)
+
+        for respondent in self.respondents:
+            respondent.compute_totals()
+
+        if stats is not None:
+            stats.items = num_items
+            stats.unique_items = len(groups)
+            stats.stop()
+            self.scoring_stats = stats
+            logger.info("Scoring statistics:\n%s", stats)
+
+        self.count_corrections(modules, groups)
+        self.index_matches(index_terms)
         logger.info("Survey scoring completed")
 
+    def count_corrections(self, modules, groups) -> None:
+        '''
+        Counts the corrections applied by the 'fuzzy' matchers of the modules (FuzzyMatcher.applied) in the items
+        scored. Each group of identical items is counted once per item, whether its matches were computed, shared
+        from an identical item or found in a cache.
+
+                Parameters:
+                        modules (tuple): The scoring modules the items were scored with
+                        groups (list): Lists of identical items
+                Returns:
+
+        '''
+        if not any(getattr(helper, 'matcher', None) == 'fuzzy'
+                   for module in modules for helper in ScoringStats._helpers(module)):
+            return
+        languages = {id(item): respondent.language for respondent in self.respondents for item in respondent.items}
+        counted = set()
+        for group in groups:
+            item = group[0]
+            language = item.language or languages[id(item)]
+            # The fuzzy matchers the item was matched with, each counted once even if several modules share it
+            matchers = {}
+            for module in modules:
+                for helper in ScoringStats._helpers(route(module, language)):
+                    matcher = getattr(helper, 'token_matcher', None)
+                    if isinstance(matcher, FuzzyMatcher) and helper.wordlist is item.wordlist:
+                        matchers[id(matcher)] = (helper, matcher)
+            for key, (helper, matcher) in matchers.items():
+                if key not in counted:
+                    # The counts are those of the last scoring run
+                    counted.add(key)
+                    matcher.applied.clear()
+                limit, policy = helper.max_sentence_length, helper.long_sentence_policy
+                for sentence in (item.self_sentence, item.other_sentence):
+                    # The part of a long sentence that was matched (see ScoringModule.count_long_sentence)
+                    if limit is None or len(sentence) <= limit or policy == 'flag':
+                        windows = [sentence]
+                    else:
+                        windows = helper.sentence_windows(sentence, limit)
+                        if policy == 'truncate':
+                            windows = [next(windows)]
+                    for window in windows:
+                        matcher.add_applied(window, len(group))
+        return
+
+    def index_matches(self, index_terms: bool) -> None:
+        '''
+        Builds the TermIndex of the matches recorded on the items while they were scored, or drops the matches
+        (Item.matches) so that they do not stay in memory once the survey is scored
+
+                Parameters:
+                        index_terms (bool): Whether to build the TermIndex and keep the matches
+                Returns:
+
+        '''
+        if index_terms:
+            self.term_index = TermIndex.from_respondents(self.respondents)
+            return
+        self.term_index = None
+        for respondent in self.respondents:
+            for item in respondent.items:
+                item.matches = None
+
+    def score_wordlists(self, wordlists, *modules, dedup=False, collect_stats=False):
+        '''
+        Scores all of the respondents with several wordlists at once. The scores of each module are stored once per
+        wordlist, under the module id followed by "-" and the wordlist name (e.g. allsum-original, allsum-expanded).
+        Each sentence is matched once against the union of the wordlists (WordlistUnion) instead of once per wordlist,
+        except for the wordlists a module cannot match through the union (see WordlistUnion.covers), which are matched
+        separately. Each wordlist is scored with copies of the modules, so the modules given are not changed. The
+        survey's wordlist is restored afterwards.
+
+                Parameters:
+                        wordlists (dict or list): The wordlists by name, or a list of wordlists with distinct names
+                        modules (tuple): the scoring modules to be run on the respondents' items.
+                        dedup (bool): Whether to score identical items only once
+                        collect_stats (bool): Whether to collect a ScoringStats of the run, with an entry per module and wordlist
+                Returns:
+                        union (WordlistUnion): The union of the wordlists
+        '''
+        union = WordlistUnion(wordlists)
+        logger.info("Scoring survey with %d wordlists: %s", len(union.wordlists), ', '.join(map(str, union.wordlists)))
+        previous = self.wordlist
+        stats = ScoringStats() if collect_stats else None
+        try:
+            for name, wordlist in union.wordlists.items():
+                self.add_wordlist(wordlist)
+                self.score(*[self._union_copy(module, union, name) for module in modules], dedup=dedup,
+                           collect_stats=collect_stats)
+                if stats is not None:
+                    stats.modules.update(self.scoring_stats.modules)
+                    stats.wall_time += self.scoring_stats.wall_time
+                    stats.items = self.scoring_stats.items
+                    stats.unique_items = self.scoring_stats.unique_items
+        finally:
+            union.clear()
+            self.add_wordlist(previous)
+        if stats is not None:
+            self.scoring_stats = stats
+        return union
+
+    @staticmethod
+    def _union_copy(module, union, name):
+        # A copy of the module (and of its helper modules) matching through the union, its scores stored under the
+        # wordlist name. The copies share the language variants and bound wordlists of the module.
+        duplicate = copy.copy(module)
+        for attribute, value in getattr(module, '__dict__', {}).items():
+            if isinstance(value, ScoringModule):
+                setattr(duplicate, attribute, copy.copy(value))
+        for helper in ScoringStats._helpers(duplicate):
+            if hasattr(helper, 'union'):
+                helper.union = union
+        duplicate.id = f"{module.id}-{name}"
+        return duplicate
+
+    def apply_wordlist_diff(self, diff: WordlistDiff, *modules, dry_run=False) -> WordlistImpact:
+        '''
+        Applies a proposed wordlist change to the scores of the survey without scoring it again. Only the items the
+        change can affect (TermIndex.affected) are matched and scored again with the given modules, the respondent
+        totals are updated by the differences, and the per respondent modules are run again for the respondents of
+        those items. The other items keep their matches, moved to the changed wordlist. The survey must have been
+        scored with the modules and the wordlist, with index_terms so that the matches are kept; otherwise the
+        index has no matches and every item of the wordlist is matched again. With dry_run the survey is left
+        unchanged and only the report is returned.
+
+                Parameters:
+                        diff (WordlistDiff): The proposed change
+                        modules (tuple): The scoring modules the survey was scored with
+                        dry_run (bool): Whether to only report the change
+                Returns:
+                        impact (WordlistImpact): The before/after report of the changed item scores and respondent totals
+        '''
+        index = self.term_index
+        if index is None or len(index.entries) != sum(len(respondent.items) for respondent in self.respondents):
+            index = self.term_index = TermIndex.from_respondents(self.respondents)
+        previous, wordlist = diff.wordlist, diff.apply()
+        scored = index.positions(previous)
+        languages = {entry[1].language or entry[0].language for entry in map(index.entries.__getitem__, scored)}
+        exact = all(finds_by_tokens(route(module, language)) for module in modules for language in languages)
+        positions = index.affected(diff, exact)
+        impact = WordlistImpact(diff, wordlist, not dry_run, len(positions), len(scored))
+        logger.info("Applying %s to %d of %d items%s", diff, len(positions), len(scored), ' (dry run)' if dry_run else '')
+
+        per_item = [module for module in modules if module.type == "per item"]
+        per_respondent = [module for module in modules if module.type == "per respondent"]
+        # The totals before the change and the sum of the item score changes of each affected respondent
+        respondents = {}
+        for position in sorted(positions):
+            respondent, item = index.entries[position]
+            language = item.language or respondent.language
+            before = dict(item.scores)
+            item.wordlist = wordlist
+            after = {}
+            for module in per_item:
+                after.update(item.compute_scores(route(module, language)))
+            rows = WordlistImpact._changes(before, after, respondent=respondent.userid or respondent.id,
+                                           item=before.get('index'))
+            impact.items += rows
+            if id(respondent) not in respondents:
+                respondents[id(respondent)] = (respondent, dict(respondent.totals), defaultdict(float))
+            deltas = respondents[id(respondent)][2]
+            for row in rows:
+                if row['delta'] is not None:
+                    deltas[row['id']] += row['delta']
+            if dry_run:
+                item.wordlist = previous
+                self._drop_matches([item], wordlist)
+            else:
+                item.scores.update(after)
+
+        if not dry_run:
+            # The matches of the other items do not change, they are kept for the changed wordlist
+            for position in scored:
+                respondent, item = index.entries[position]
+                item.wordlist = wordlist
+                for key in [key for key in item.matches or () if key[0] == previous.unique_id]:
+                    record = item.matches.pop(key)
+                    if position not in positions:
+                        item.matches[(wordlist.unique_id,) + key[1:]] = record
+                if respondent.wordlist is previous:
+                    respondent.wordlist = wordlist
+            if self.wordlist is previous:
+                self.wordlist = wordlist
+            for language, language_wordlist in self.wordlists.items():
+                if language_wordlist is previous:
+                    self.wordlists[language] = wordlist
+            index.reindex(positions, wordlist, previous)
+
+        for respondent, before, deltas in respondents.values():
+            after = {key: before.get(key, 0) + delta for key, delta in deltas.items()}
+            for module in per_respondent:
+                after[module.id] = route(module, respondent.language).execute(respondent.items, wordlist)
+                if not dry_run:
+                    respondent.totals[module.id] = after[module.id]
+            if dry_run and per_respondent:
+                self._drop_matches(respondent.items, wordlist)
+            elif not dry_run and isinstance(respondent.totals, dict):
+                respondent.compute_totals()
+            impact.respondents += WordlistImpact._changes(before, after, respondent=respondent.userid or respondent.id)
+        logger.info("Wordlist change impact:\n%s", impact)
+        return impact
+
+    @staticmethod
+    def _drop_matches(items, wordlist) -> None:
+        for item in items:
+            for key in [key for key in item.matches or () if key[0] == wordlist.unique_id]:
+                del item.matches[key]
+
     def compute_summary(self, percentiles=False):
 
         #Sum all of the respondents scores
@@ -236,6 +600,11 @@ class Survey:
                     respondent.add_additional_info('20-item-percentile',perc10)
 
         #Add all of the respondents totals to the summary
+        table = self.score_table
+        if table is not None and table.matches(self.respondents):
+            self.summary.update(self.summary_from_table(table))
+            return
+
         for respondent in self.respondents:
             for key in respondent.totals.keys():
                 self.summary[key] = []
@@ -250,15 +619,165 @@ class Survey:
 
         return
 
-    def add_wordlist(self, wordlist: Wordlist):
-        self.wordlist = wordlist
-        for respondent in self.respondents:
-            respondent.add_wordlist(wordlist)
+    def summary_from_table(self, table: ScoreTable) -> dict:
+        '''
+        Builds the summary arrays from the score table columns, using the per respondent totals of np.add.reduceat
+        directly and only looking at the values that were added to the respondents' totals by hand.
+
+                Parameters:
+                        table (ScoreTable): The score table of the survey
+                Returns:
+                        summary (dict): The total of every id for each respondent that has it
+        '''
+        extra_keys = {}
+        for index, respondent in enumerate(self.respondents):
+            for key in respondent.totals.extra:
+                extra_keys.setdefault(key, []).append(index)
+
+        starts = table.offsets[:-1]
+        nonempty = starts < table.offsets[1:]
+        summary = {}
+        for key in table.columns:
+            #Respondents have an item total when their first item has the id (as in compute_totals)
+            include = nonempty.copy()
+            include[nonempty] = table.present[key][starts[nonempty]]
+            values = np.array(table.totals(key), dtype=float)
+            for index in extra_keys.pop(key, []):
+                if not include[index] or values[index] == 0:
+                    values[index] = self.respondents[index].totals.extra[key]
+                    include[index] = True
+            if np.any(include):
+                summary[key] = values[include]
+
+        for key, indices in extra_keys.items():
+            summary[key] = np.array([self.respondents[index].totals.extra[key] for index in indices], dtype=float)
+        return summary
+
+    def add_wordlist(self, wordlist: Wordlist, language: str = None):
+        '''
+        Sets the wordlist the items are scored with. With a language, the wordlist is only used for the items of that
+        language (see detect_languages), the others keep the survey's wordlist.
+
+                Parameters:
+                        wordlist (Wordlist): The wordlist
+                        language (str): The language of the wordlist, None for the survey's wordlist
+                Returns:
+
+        '''
+        if language is None:
+            self.wordlist = wordlist
+        else:
+            self.wordlists[language] = wordlist
+        self.route_wordlists(self.respondents)
+
+    def route_wordlists(self, respondents) -> None:
+        '''
+        Gives every item the wordlist of its language (Item.language, or the respondent's language), or the survey's
+        wordlist if there is none for that language
+
+                Parameters:
+                        respondents (list): The respondents whose items are updated
+                Returns:
+
+        '''
+        for respondent in respondents:
+            respondent.add_wordlist(self.wordlists.get(respondent.language, self.wordlist))
+            if self.wordlists:
+                for item in respondent.items:
+                    if item.language is not None and item.language != respondent.language:
+                        item.add_wordlist(self.wordlists.get(item.language, self.wordlist))
+        return
 
-    def save(self, filename):
+    @staticmethod
+    def parse_language(value):
+        '''Returns the language code of a language column cell, None for an empty cell'''
+        if value is None or (isinstance(value, float) and np.isnan(value)) or not str(value).strip():
+            return None
+        return str(value).strip().lower()
+
+    def detect_languages(self, per='item', default='en') -> dict:
+        '''
+        Sets the language of the items and respondents that have none, from the script and function words of their
+        raw input (veta.language_detection.detect_language). Languages set explicitly (Item.language,
+        Respondent.language or the language column, see configure_columns) are kept, and an item without a language
+        takes the language of its respondent. The items are then given the wordlist of their language.
+
+                Parameters:
+                        per (str): 'item' to detect the language of each item, 'respondent' to detect it once from all
+                                   of the respondent's items
+                        default (str): The language of the texts that give no evidence (see detect_language)
+                Returns:
+                        counts (dict): The number of items of each language
+        '''
+        if per not in ('item', 'respondent'):
+            raise ValueError(f"Unknown per {per}, use 'item' or 'respondent'")
+        counts = Counter()
+        for respondent in self.respondents:
+            if respondent.language is None and per == 'respondent':
+                text = ' '.join(item.raw_input for item in respondent.items)
+                respondent.language = detect_language(text, default)
+            for item in respondent.items:
+                if item.language is None:
+                    item.language = respondent.language or detect_language(item.raw_input, default)
+                counts[item.language] += 1
+            if respondent.language is None and respondent.items:
+                # The most frequent language of the items, for the per respondent modules
+                respondent.language = Counter(item.language for item in respondent.items).most_common(1)[0][0]
+        self.route_wordlists(self.respondents)
+        logger.info("Item languages: %s", dict(counts))
+        return dict(counts)
+
+    def discover_terms(self, module=None, n=2, window=4, examples=3, capacity=10000) -> TermDiscovery:
+        '''
+        Reads the cleaned sentences of every item once and counts the frequent words and phrases that the wordlist of
+        the item does not cover, favoring those after an emotion verb (see TermDiscovery). The wordlist words are
+        found with the module routed to the language of the item, or with the default token matcher. Meant to
+        propose additions to the wordlist, e.g. with a WordlistDiff reviewed by apply_wordlist_diff(dry_run=True).
+
+                Parameters:
+                        module (ScoringModule): The module whose matcher finds the wordlist words, None for the default
+                        n (int): The longest phrase counted, in words
+                        window (int): The number of words after an emotion verb counted as near it
+                        examples (int): The number of example contexts kept per candidate
+                        capacity (int): The number of phrases kept when the counts are pruned
+                Returns:
+                        discovery (TermDiscovery): The counts, see TermDiscovery.candidates for the ranked candidates
+        '''
+        if module is None:
+            module = ScoringModule()
+        discovery = TermDiscovery(n=n, window=window, examples=examples, capacity=capacity)
+        for respondent in self.respondents:
+            for item in respondent.items:
+                language = item.language or respondent.language
+                matcher = route(module, language)
+                for sentence in (item.self_sentence, item.other_sentence):
+                    if not sentence:
+                        continue
+                    spans = matcher.match_spans(sentence, item.wordlist) if item.wordlist is not None else ()
+                    discovery.add(sentence, spans, language or matcher.language)
+        logger.info("Term discovery:\n%s", discovery)
+        return discovery
+
+    def save(self, filename, stats_report=False):
+        '''
+        Saves the survey and its scores (.json, .csv, .xls or .xlsx). With stats_report, the ScoringStats of the
+        last Survey.score(..., collect_stats=True) run are also written next to it as <name>.stats.json.
+
+                Parameters:
+                        filename (str): The output file
+                        stats_report (bool): Whether to write the scoring statistics report
+                Returns:
+
+        '''
         # Get the file extension
         file_extension = os.path.splitext(filename)[1]
 
+        if stats_report:
+            if self.scoring_stats is None:
+                logger.warning("No scoring statistics to report, score the survey with collect_stats=True")
+            else:
+                self.scoring_stats.save(os.path.splitext(filename)[0] + ".stats.json")
+
         if file_extension in ['.json']:
             with open(filename, 'w') as f:
                 json.dump(self.to_json(), f, indent=2, cls=NumpyEncoder)
@@ -399,15 +918,19 @@ class Survey:
         for respondent in self.respondents:
             respondent_data = {
                 'userid': respondent.userid,
-                'totals': respondent.totals,
+                'totals': dict(respondent.totals),
                 'items': []
             }
+            if respondent.language is not None:
+                respondent_data['language'] = respondent.language
             for item in respondent.items:
                 item_data = {
                     'self_sentence': item.self_sentence,
                     'other_sentence': item.other_sentence,
-                    'scores': item.scores
+                    'scores': dict(item.scores)
                 }
+                if item.language is not None:
+                    item_data['language'] = item.language
                 respondent_data['items'].append(item_data)
             data.append(respondent_data)
         return data
@@ -422,11 +945,13 @@ class Survey:
             return
 
         self.respondents = []
+        self.score_table = None
 
         for respondent_data in data:
             respondent = Respondent()
             respondent.userid = respondent_data.get('userid', '')
             respondent.totals = respondent_data.get('totals', {})
+            respondent.language = respondent_data.get('language')
             respondent.items = []
 
             for item_data in respondent_data.get('items', []):
@@ -434,6 +959,7 @@ class Survey:
                 item = Item(item_data.get('self_sentence', ''),
                            item_data.get('other_sentence', ''))
                 item.scores = item_data.get('scores', {})
+                item.language = item_data.get('language')
 
                 respondent.items.append(item)
 
@@ -0,0 +1,291 @@
+import re
+
+from veta.language_detection import FUNCTION_WORDS
+from veta.logger import get_logger
+
+logger = get_logger('term_discovery')
+
+# The verbs introducing a feeling ("i feel left out", "ich fühle mich verloren"). The words shortly after them are
+# more likely to name an emotion.
+EMOTION_VERBS = {
+    'en': {'feel', 'feels', 'felt', 'feeling'},
+    'de': {'fühle', 'fühlst', 'fühlt', 'fühlen', 'fühlte', 'fühlten', 'gefühlt'},
+}
+# The words a candidate term cannot start or end with: the function words of the language and other frequent words
+STOPWORDS = {
+    'en': FUNCTION_WORDS['en'] | {'an', 'as', 'so', 'in', 'on', 'or', 'if', 'by', 'do', 'did', 'was', 'were', 'been',
+                                  'his', 'her', 'him', 'them', 'their', 'our', 'your', 'its', 'from', 'about', 'what',
+                                  'when', 'there', 'then', 'than', 'just', 'really', 'like', 'would', 'could', 'will',
+                                  'some', 'more', 'too', 'also', 'who', 'how', 'had', 'has', "i'm", "don't", "can't",
+                                  "it's", "i'd", "i've"},
+    'de': FUNCTION_WORDS['de'] | {'so', 'in', 'im', 'an', 'am', 'die', 'den', 'dem', 'des', 'was', 'sich', 'auch',
+                                  'wenn', 'dann', 'als', 'wie', 'noch', 'nur', 'schon', 'einen', 'einem', 'einer',
+                                  'meine', 'meinen', 'meiner', 'dich', 'dir', 'uns', 'ihr', 'ihn', 'ihm', 'wäre',
+                                  'hat', 'hatte', 'war', 'oder', 'von', 'bei'},
+}
+
+# Words, keeping the apostrophes and hyphens within a word ("don't", "left-out")
+_WORD = re.compile(r"\w+(?:['’-]\w+)*")
+
+
+class TermCounter:
+    """
+    A bounded memory counter of the most frequent keys of a stream, with the space saving method: at most 2 * capacity
+    keys are counted, and when there are more the counter keeps the capacity most frequent. A key counted again after
+    it was dropped starts from the largest count dropped so far (floor), so every count is an upper bound of the true
+    count and is at most error above it. As long as no key is dropped the counts are exact.
+
+    ...
+
+    Attributes
+    ----------
+    capacity : int
+        The number of keys kept when pruning
+    counts : dict
+        Maps each counted key to its count
+    errors : dict
+        Maps each counted key to the largest amount its count can be above the true count
+    floor : int
+        The largest count dropped so far
+    dropped : int
+        The number of keys dropped so far
+
+    Methods
+    -------
+    add(key, count)
+        counts a key and returns whether it was counted from the start (no error)
+    prune()
+        keeps the capacity most frequent keys and returns the keys dropped
+    most_common(n)
+        returns the n most frequent keys and their counts
+    """
+    def __init__(self, capacity: int = 10000) -> None:
+        if capacity < 1:
+            raise ValueError(f"The capacity must be at least 1, got {capacity}")
+        self.capacity = capacity
+        self.counts = {}
+        self.errors = {}
+        self.floor = 0
+        self.dropped = 0
+        return
+
+    def add(self, key, count: int = 1) -> bool:
+        counts = self.counts
+        if key in counts:
+            counts[key] += count
+            return self.errors[key] == 0
+        counts[key] = self.floor + count
+        self.errors[key] = self.floor
+        return self.floor == 0
+
+    def prune(self) -> list:
+        '''
+        Keeps the capacity most frequent keys
+
+                Parameters:
+
+                Returns:
+                        dropped (list): The keys dropped
+        '''
+        if len(self.counts) <= self.capacity:
+            return []
+        ranked = sorted(self.counts, key=self.counts.get, reverse=True)
+        dropped = ranked[self.capacity:]
+        self.floor = max(self.floor, self.counts[dropped[0]])
+        for key in dropped:
+            del self.counts[key]
+            del self.errors[key]
+        self.dropped += len(dropped)
+        return dropped
+
+    def most_common(self, n: int = None) -> list:
+        ranked = sorted(self.counts.items(), key=lambda entry: entry[1], reverse=True)
+        return ranked if n is None else ranked[:n]
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
+class TermDiscovery:
+    """
+    Finds candidate wordlist terms in the responses of a survey: the words and short phrases (n-grams up to n words)
+    that are frequent in the cleaned sentences but not covered by the wordlist. The sentences are read once as a
+    stream (add) with the positions of the wordlist words found in them (ScoringModule.match_spans); the covered words
+    are left out and no n-gram spans a covered word, so "left out" is only counted where the wordlist does not already
+    match it, and "lonely and" is never counted across "lonely". N-grams starting or ending with a stopword of the
+    language (STOPWORDS) or an emotion verb are skipped.
+
+    Each n-gram starting within window words after an emotion verb of the language (EMOTION_VERBS, e.g. "i feel
+    [left out]") is also counted as near, and candidates are ranked by count + anchor_weight * near, leaving out the
+    n-grams only found within a longer candidate. The counts are kept in a TermCounter, pruned to capacity n-grams
+    whenever it holds twice as many, so memory stays bounded on large surveys; the few example contexts of each
+    candidate are dropped with it.
+
+    ...
+
+    Attributes
+    ----------
+    n : int
+        The longest n-gram counted
+    window : int
+        The number of words after an emotion verb that an n-gram must start within to be counted as near
+    examples : int
+        The number of example contexts kept per candidate
+    anchor_weight : float
+        The weight of the near count in the ranking
+    context : int
+        The number of characters kept on each side of a candidate in its example contexts
+    counter : TermCounter
+        The counts of the n-grams
+    near : dict
+        The number of times each counted n-gram was found after an emotion verb
+    contexts : dict
+        The example contexts of each counted n-gram, the n-gram in square brackets
+    sentences : int
+        The number of sentences read
+    words : int
+        The number of words read
+    covered : int
+        The number of those words covered by the wordlist
+
+    Methods
+    -------
+    add(sentence, spans, language)
+        counts the n-grams of a sentence outside of the wordlist matches
+    candidates(top, min_count)
+        returns the ranked candidate terms with their counts and example contexts
+    """
+    anchor_weight = 2.0
+    context = 40
+
+    def __init__(self, n: int = 2, window: int = 4, examples: int = 3, capacity: int = 10000) -> None:
+        '''
+        Initializes the TermDiscovery class
+
+                Parameters:
+                        n (int): The longest n-gram counted
+                        window (int): The number of words after an emotion verb counted as near it
+                        examples (int): The number of example contexts kept per candidate
+                        capacity (int): The number of n-grams kept when the counts are pruned
+                Returns:
+
+        '''
+        if n < 1:
+            raise ValueError(f"n must be at least 1, got {n}")
+        self.n = n
+        self.window = window
+        self.examples = examples
+        self.counter = TermCounter(capacity)
+        self.near = {}
+        self.contexts = {}
+        self.sentences = 0
+        self.words = 0
+        self.covered = 0
+        return
+
+    def add(self, sentence: str, spans=(), language: str = 'en') -> None:
+        '''
+        Counts the n-grams of a sentence that do not overlap a wordlist match
+
+                Parameters:
+                        sentence (str): The cleaned sentence
+                        spans (list): The (word, start, stop) of the wordlist words found in the sentence
+                        language (str): The language of the sentence, selecting the stopwords and emotion verbs
+                Returns:
+
+        '''
+        self.sentences += 1
+        stopwords = STOPWORDS.get(language, frozenset())
+        anchors = EMOTION_VERBS.get(language, frozenset())
+        spans = sorted((start, stop) for word, start, stop in spans)
+        counter = self.counter
+        n = self.n
+        # The uncovered words of the current run and the position of the last emotion verb
+        run = []
+        last_anchor = None
+        span = 0
+        for position, match in enumerate(_WORD.finditer(sentence)):
+            start, stop = match.span()
+            self.words += 1
+            while span < len(spans) and spans[span][1] <= start:
+                span += 1
+            if span < len(spans) and spans[span][0] < stop:
+                # A covered word ends the run
+                self.covered += 1
+                run = []
+                continue
+            word = match.group()
+            if word in anchors:
+                last_anchor = position
+            run.append((word, start, stop))
+            if len(run) > n:
+                del run[0]
+            # Count the n-grams ending at this word
+            if word in stopwords or word in anchors or word.isdigit():
+                continue
+            for length in range(1, len(run) + 1):
+                first = run[-length][0]
+                if first in stopwords or first in anchors or first.isdigit():
+                    continue
+                begin = run[-length][1]
+                term = ' '.join(entry[0] for entry in run[-length:])
+                counter.add(term)
+                if last_anchor is not None and 0 < position - length + 1 - last_anchor <= self.window:
+                    self.near[term] = self.near.get(term, 0) + 1
+                contexts = self.contexts.setdefault(term, [])
+                if len(contexts) < self.examples:
+                    context = self._context(sentence, begin, stop)
+                    if context not in contexts:
+                        contexts.append(context)
+        if len(counter) > 2 * counter.capacity:
+            for term in counter.prune():
+                self.near.pop(term, None)
+                self.contexts.pop(term, None)
+        return
+
+    def _context(self, sentence: str, start: int, stop: int) -> str:
+        before = max(0, start - self.context)
+        after = min(len(sentence), stop + self.context)
+        return "{}{}[{}]{}{}".format('...' if before > 0 else '', sentence[before:start], sentence[start:stop],
+                                     sentence[stop:after], '...' if after < len(sentence) else '')
+
+    def candidates(self, top: int = 50, min_count: int = 2) -> list:
+        '''
+        Returns the candidate terms, best first. The n-grams found as often within a longer n-gram as on their own
+        are left out.
+
+                Parameters:
+                        top (int): The number of candidates returned, None for all of them
+                        min_count (int): The smallest count of a candidate
+                Returns:
+                        candidates (list): A dictionary per candidate with the term, its count, its near count, the
+                                           largest error of the count (see TermCounter), its score and example contexts
+        '''
+        counter = self.counter
+        # The largest count of a longer n-gram containing each n-gram
+        contained = {}
+        for term, count in counter.counts.items():
+            words = term.split(' ')
+            for length in range(1, len(words)):
+                for start in range(len(words) - length + 1):
+                    part = ' '.join(words[start:start + length])
+                    contained[part] = max(contained.get(part, 0), count)
+        candidates = []
+        for term, count in counter.counts.items():
+            # Skip the n-grams only found within a longer one ("left" of "left out")
+            if count < min_count or contained.get(term, 0) >= count:
+                continue
+            near = self.near.get(term, 0)
+            candidates.append({'term': term, 'count': count, 'near': near, 'error': counter.errors[term],
+                               'score': count + self.anchor_weight * near, 'examples': list(self.contexts.get(term, ()))})
+        candidates.sort(key=lambda candidate: (-candidate['score'], -candidate['count'], candidate['term']))
+        return candidates if top is None else candidates[:top]
+
+    def __str__(self) -> str:
+        ret = "{} sentences, {} words of which {} covered by the wordlist, {} n-grams counted ({} dropped)\n".format(
+            self.sentences, self.words, self.covered, len(self.counter), self.counter.dropped)
+        for candidate in self.candidates(top=20):
+            ret += "{}: {} ({} near an emotion verb) e.g. {}\n".format(
+                candidate['term'], candidate['count'], candidate['near'],
+                candidate['examples'][0] if candidate['examples'] else '')
+        return ret
@@ -0,0 +1,259 @@
+from collections import defaultdict
+
+from veta.token_matcher import _TOKEN
+from veta.scoring_modules.scoring_module import ScoringModule
+from veta.logger import get_logger
+
+logger = get_logger('term_index')
+
+def finds_by_tokens(module) -> bool:
+    '''Returns whether a scoring module (and its helper modules) only finds wordlist words made of the sentence tokens'''
+    if not isinstance(module, ScoringModule):
+        return False
+    helpers = [module] + [value for value in module.__dict__.values() if isinstance(value, ScoringModule)]
+    return all(helper.matcher in ('token', 'regex') and
+               not _TOKEN.search(helper.acceptable_prev_chars + helper.acceptable_next_chars) for helper in helpers)
+
+
+class TermIndex:
+    """
+    An inverted index of a scored survey: the items each wordlist word was found in, read from the matches recorded
+    on the items while they were scored (Item.matches), and the items each token of the cleaned sentences appears in.
+    Survey.apply_wordlist_diff uses it to rescore only the items a wordlist change can affect:
+
+    - a changed or removed word affects the items it was found in (removing a phrase also frees its words there)
+    - an added word can only be found in the items containing all of its tokens. With matchers that find words
+      without their tokens (Hebrew and Arabic prefixes, lemmas, segments, typos), added and removed words affect
+      every item of the wordlist instead.
+
+    Items of the wordlist without recorded matches (never scored) are always affected.
+
+    ...
+
+    Attributes
+    ----------
+    entries : list
+        The (respondent, item) of each indexed item, by position
+    terms : dict
+        Maps each wordlist unique_id to a dict from each word to the positions of the items it was found in
+    tokens : dict
+        Maps each token to the positions of the items containing it
+    words : list
+        The words found in each item, by wordlist unique_id, used to update the index
+
+    Methods
+    -------
+    from_respondents(respondents)
+        builds the index of the respondents' items
+    positions(wordlist)
+        returns the positions of the items scored with a wordlist
+    candidates(word)
+        returns the positions of the items containing every token of a word
+    affected(diff, exact)
+        returns the positions of the items a WordlistDiff can change
+    reindex(positions, wordlist, previous)
+        moves the index to a new version of a wordlist and indexes the matches of the given items again
+    """
+    def __init__(self) -> None:
+        self.entries = []
+        self.terms = defaultdict(lambda: defaultdict(set))
+        self.tokens = defaultdict(set)
+        self.words = []
+        return
+
+    @classmethod
+    def from_respondents(cls, respondents: list):
+        '''
+        Builds the index of the respondents' items from their recorded matches and cleaned sentences
+
+                Parameters:
+                        respondents (list): The respondents of the survey
+                Returns:
+                        index (TermIndex): The index
+        '''
+        index = cls()
+        for respondent in respondents:
+            for item in respondent.items:
+                position = len(index.entries)
+                index.entries.append((respondent, item))
+                index.words.append({})
+                for token in set(_TOKEN.findall(item.self_sentence + ' ' + item.other_sentence)):
+                    index.tokens[token].add(position)
+                index._add(position)
+        logger.info("Indexed %d items, %d tokens", len(index.entries), len(index.tokens))
+        return index
+
+    def _add(self, position: int) -> None:
+        item = self.entries[position][1]
+        found = defaultdict(set)
+        matches = item.matches if isinstance(item.matches, dict) else {}
+        for key, record in matches.items():
+            unique_id = key[0]
+            # Skip the results of sentences that have since been changed
+            if record[0] is not item.self_sentence or record[1] is not item.other_sentence:
+                continue
+            results = [result for result in record[2:] if result is not None]
+            if results:
+                words = found[unique_id]
+                for result in results:
+                    words.update(str(word) for word in result[1])
+        for unique_id, words in found.items():
+            terms = self.terms[unique_id]
+            for word in words:
+                terms[word].add(position)
+        self.words[position] = found
+        return
+
+    def _remove(self, position: int) -> None:
+        for unique_id, words in self.words[position].items():
+            terms = self.terms[unique_id]
+            for word in words:
+                terms[word].discard(position)
+        self.words[position] = {}
+        return
+
+    def positions(self, wordlist) -> set:
+        return {position for position, (respondent, item) in enumerate(self.entries) if item.wordlist is wordlist}
+
+    def candidates(self, word: str) -> set:
+        '''
+        Returns the positions of the items containing every token of a word, a superset of the items it can be found in
+
+                Parameters:
+                        word (str): The word or phrase
+                Returns:
+                        positions (set): The positions of the candidate items, None if the word has no token
+        '''
+        tokens = set(_TOKEN.findall(word))
+        if not tokens:
+            return None
+        postings = sorted((self.tokens.get(token, set()) for token in tokens), key=len)
+        return set(postings[0]).intersection(*postings[1:])
+
+    def affected(self, diff, exact: bool = True) -> set:
+        '''
+        Returns the positions of the items whose matches or scores a wordlist change can affect
+
+                Parameters:
+                        diff (WordlistDiff): The proposed change
+                        exact (bool): Whether the words are found by their tokens (see the class description)
+                Returns:
+                        positions (set): The positions of the affected items
+        '''
+        positions = self.positions(diff.wordlist)
+        terms = self.terms.get(diff.wordlist.unique_id, {})
+        # Items that were never matched with the wordlist
+        affected = {position for position in positions if diff.wordlist.unique_id not in self.words[position]}
+        for word in diff.changed:
+            affected.update(terms.get(word, ()))
+        if not exact and (diff.added or diff.removed):
+            return positions
+        for word in diff.removed:
+            affected.update(terms.get(word, ()))
+        for word in diff.added:
+            candidates = self.candidates(word)
+            affected.update(positions if candidates is None else candidates & positions)
+        return affected
+
+    def reindex(self, positions, wordlist, previous) -> None:
+        '''
+        Moves the index from a wordlist to its changed version and indexes the matches of the given items again
+
+                Parameters:
+                        positions (set): The positions of the items that were matched again
+                        wordlist (Wordlist): The changed wordlist
+                        previous (Wordlist): The wordlist it replaces
+                Returns:
+
+        '''
+        for position in positions:
+            self._remove(position)
+        terms = self.terms.pop(previous.unique_id, None)
+        if terms is not None:
+            self.terms[wordlist.unique_id] = terms
+        for words in self.words:
+            if previous.unique_id in words:
+                words[wordlist.unique_id] = words.pop(previous.unique_id)
+        for position in positions:
+            self._add(position)
+        return
+
+
+class WordlistImpact:
+    """
+    The before/after report of a wordlist change (Survey.apply_wordlist_diff)
+
+    ...
+
+    Attributes
+    ----------
+    diff : WordlistDiff
+        The change
+    wordlist : Wordlist
+        The changed wordlist
+    applied : bool
+        Whether the new scores were stored (False for a dry run)
+    rescored : int
+        The number of items rescored, out of total items of the wordlist
+    items : list
+        A dictionary per changed item score with the respondent, the item index, the score id, before, after and delta
+    respondents : list
+        A dictionary per changed respondent total with the respondent, the score id, before, after and delta
+
+    Methods
+    -------
+    summary()
+        returns the number of items and respondents changed and the mean change of each score id
+    to_dict()
+        returns the report as a dictionary
+    """
+    def __init__(self, diff, wordlist, applied: bool, rescored: int, total: int) -> None:
+        self.diff = diff
+        self.wordlist = wordlist
+        self.applied = applied
+        self.rescored = rescored
+        self.total = total
+        self.items = []
+        self.respondents = []
+        return
+
+    @staticmethod
+    def _changes(before: dict, after: dict, **row) -> list:
+        rows = []
+        for key, value in after.items():
+            previous = before.get(key, 0)
+            if previous != value:
+                delta = value - previous if isinstance(value, (int, float)) and isinstance(previous, (int, float)) else None
+                rows.append(dict(row, id=key, before=previous, after=value, delta=delta))
+        return rows
+
+    def summary(self) -> dict:
+        summary = {}
+        for level, rows in (('items', self.items), ('respondents', self.respondents)):
+            for row in rows:
+                entry = summary.setdefault(row['id'], {'items': 0, 'respondents': 0, 'delta': 0.0})
+                entry[level] += 1
+                if level == 'items' and row['delta'] is not None:
+                    entry['delta'] += row['delta']
+        for entry in summary.values():
+            entry['mean_delta'] = entry.pop('delta') / entry['items'] if entry['items'] else 0.0
+        return summary
+
+    def to_dict(self) -> dict:
+        return {
+            'diff': {'added': self.diff.added, 'removed': sorted(self.diff.removed), 'changed': self.diff.changed},
+            'applied': self.applied,
+            'rescored': self.rescored,
+            'total': self.total,
+            'summary': self.summary(),
+            'items': self.items,
+            'respondents': self.respondents,
+        }
+
+    def __str__(self) -> str:
+        ret = "{}: rescored {} of {} items, {} item scores and {} respondent totals changed\n".format(
+            self.diff, self.rescored, self.total, len(self.items), len(self.respondents))
+        for id, entry in self.summary().items():
+            ret += "{}: {} items, {} respondents, mean item change {:+.3f}\n".format(
+                id, entry['items'], entry['respondents'], entry['mean_delta'])
+        return ret
@@ -0,0 +1,209 @@
+import re
+from collections import defaultdict
+
+# Runs of word characters, with the same definition of a word character as the \b of the wordlist regex
+_TOKEN = re.compile(r'\w+')
+
+class Vocabulary:
+    """
+    A vocabulary interning every token seen by a token matcher as an integer id, so that a token repeated across the
+    items of a survey is hashed once per occurrence and every wordlist lookup after that is a list index.
+
+    ...
+
+    Attributes
+    ----------
+    ids : dict
+        Maps each token to its id
+    tokens : list
+        The tokens, by id
+
+    Methods
+    -------
+    intern(token)
+        returns the id of a token, adding it if needed
+    """
+    def __init__(self) -> None:
+        self.ids = {}
+        self.tokens = []
+        return
+
+    def intern(self, token: str) -> int:
+        id = self.ids.get(token)
+        if id is None:
+            id = len(self.tokens)
+            self.ids[token] = id
+            self.tokens.append(token)
+        return id
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+
+class TokenMatcher:
+    """
+    A wordlist matcher working on the tokens (runs of word characters) of a cleaned sentence instead of the regex
+    alternation. A wordlist word can only match from the start of a token to the end of a token, and the regex keeps
+    the longest word at the leftmost position, so the matcher walks the tokens once: single tokens are looked up by
+    their interned id, and multi-token words (phrases, or words such as "don't") are only compared at tokens that
+    start one of them, longest first.
+
+    The result is identical to ScoringModule.count_matches_regex. When that cannot be guaranteed, count returns None
+    and the caller uses the regex instead:
+        - the acceptable prefix/suffix characters include word characters (e.g. the Hebrew and Arabic prefixes)
+        - the sentence contains a wordlist word that does not start and end with a word character (e.g. "glücklich ")
+
+    ...
+
+    Attributes
+    ----------
+    vocabulary : Vocabulary
+        The vocabulary interning the tokens seen by this matcher
+    max_vocabulary : int
+        The largest number of tokens kept in the vocabulary. When it holds more, the vocabulary, the entries and the
+        other per token memos of the matcher are dropped before the next sentence (see reset) and built again from
+        the tokens seen after that, so the memory of a matcher stays bounded on large surveys at the cost of
+        computing the entries of the tokens seen again.
+    starts : list
+        The entry of every vocabulary id, extended as the vocabulary grows
+    supported : bool
+        False if the matcher can never reproduce the regex (every sentence falls back)
+    irregular : list
+        The wordlist words that do not start and end with a word character
+
+    Methods
+    -------
+    count(sentence)
+        returns the count of each wordlist word found in the sentence, or None to fall back to the regex
+    matches(sentence)
+        returns the position of each wordlist word found in the sentence, or None to fall back to the regex
+    entry(token)
+        returns what a token matches: the words it counts as on its own and the longer words starting at it.
+        Computed once per vocabulary token. Subclasses override it to segment tokens (see veta.segmentation).
+    reset()
+        drops the vocabulary and the entries. Subclasses override it to drop their own per token memos too.
+    """
+    max_vocabulary = 200000
+
+    def __init__(self, words, acceptable_prev_chars: str = '', acceptable_next_chars: str = '') -> None:
+        '''
+        Indexes the words of a wordlist by their first token
+
+                Parameters:
+                        words (list): The wordlist words
+                        acceptable_prev_chars (str): The characters the regex accepts before a word
+                        acceptable_next_chars (str): The characters the regex accepts after a word
+                Returns:
+
+        '''
+        self.supported = not _TOKEN.search(acceptable_prev_chars + acceptable_next_chars)
+        self.irregular = []
+        # First token -> the single token word (or None) and the longer words starting with it
+        self.index = {}
+        for word in words:
+            word = str(word)
+            first = _TOKEN.match(word)
+            if first is None or not _TOKEN.search(word[-1]):
+                self.irregular.append(word)
+                continue
+            entry = self.index.setdefault(first.group(), [None, []])
+            if first.end() == len(word):
+                entry[0] = word
+            else:
+                entry[1].append(word)
+        self.vocabulary = Vocabulary()
+        self.starts = []
+        return
+
+    def entry(self, token: str):
+        '''
+        Returns what a token matches
+
+                Parameters:
+                        token (str): A run of word characters
+                Returns:
+                        entry (tuple): The wordlist words the token counts as when no longer word starts at it, and the longer
+                                       words starting in it as (word, offset in the token) pairs, longest first. None if the
+                                       token matches nothing.
+        '''
+        indexed = self.index.get(token)
+        if indexed is None:
+            return None
+        words = () if indexed[0] is None else (indexed[0],)
+        return words, sorted([(phrase, 0) for phrase in indexed[1]], key=lambda phrase: len(phrase[0]), reverse=True)
+
+    def reset(self) -> None:
+        self.vocabulary = Vocabulary()
+        self.starts = []
+        return
+
+    def _extend(self) -> list:
+        tokens = self.vocabulary.tokens
+        entry = self.entry
+        self.starts.extend(entry(token) for token in tokens[len(self.starts):])
+        return self.starts
+
+    def count(self, sentence: str):
+        '''
+        Finds the wordlist words in a cleaned sentence
+
+                Parameters:
+                        sentence (str): The cleaned sentence
+                Returns:
+                        word_counts (dict): The words found and their frequency, in order of first match, or None if the regex must be used
+        '''
+        found = self.matches(sentence)
+        if found is None:
+            return None
+        word_counts = defaultdict(int)
+        for word, start, stop in found:
+            word_counts[word] += 1
+        return word_counts
+
+    def matches(self, sentence: str):
+        '''
+        Finds where the wordlist words are in a cleaned sentence
+
+                Parameters:
+                        sentence (str): The cleaned sentence
+                Returns:
+                        matches (list): The (word, start, stop) of every word found, in order, or None if the regex must be used.
+                                        A token counting as several words (see entry) gives one match per word.
+        '''
+        if not self.supported:
+            return None
+        for word in self.irregular:
+            if word in sentence:
+                return None
+
+        if len(self.vocabulary) > self.max_vocabulary:
+            self.reset()
+        intern = self.vocabulary.intern
+        starts = self.starts
+        tokens = [(match.start(), match.end(), intern(match.group())) for match in _TOKEN.finditer(sentence)]
+        if tokens and max(token[2] for token in tokens) >= len(starts):
+            starts = self._extend()
+
+        found = []
+        length = len(sentence)
+        resume = 0
+        for start, end, id in tokens:
+            # Skip the tokens covered by the previous match
+            if start < resume:
+                continue
+            entry = starts[id]
+            if entry is None:
+                continue
+            words, phrases = entry
+            for phrase, offset in phrases:
+                stop = start + offset + len(phrase)
+                # The phrase must end at the end of a token (the \b of the regex)
+                if sentence.startswith(phrase, start + offset) and (stop == length or not _TOKEN.match(sentence, stop)):
+                    found.append((phrase, start + offset, stop))
+                    resume = stop
+                    break
+            else:
+                for word in words:
+                    found.append((word, start, end))
+                resume = end
+        return found
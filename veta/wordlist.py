@@ -4,6 +4,8 @@ import datetime
 import re 
 import random
 import string
+import hashlib
+import copy
 from veta.logger import get_logger
 
 # Initialize logger for this module
@@ -39,6 +41,10 @@ class Wordlist:
     -------
     loadFromFile(filename):
         extracts the wordlist data from file
+    fingerprint():
+        returns a hash of the words, stable across runs
+
+    See WordlistDiff for proposed changes to a wordlist.
     """
     def __init__(self, filename: str, creator="veta", name="wordlist", language="en") -> None:
         '''
@@ -78,6 +84,22 @@ class Wordlist:
 
         return
 
+    def fingerprint(self) -> str:
+        '''
+        Returns a hash of the words of the wordlist, in order. Unlike unique_id it is the same in every run for the same
+        words, so it identifies the wordlist in persistent caches. Scores are not included since they do not change which words match.
+
+                Parameters:
+
+                Returns:
+                        fingerprint (str): The hex digest of the words
+        '''
+        digest = hashlib.sha1()
+        for word in self.words:
+            digest.update(str(word).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
     def loadFromFile(self, filename: str) -> np.array:
         '''
         Initializes the Wordlist class
@@ -265,4 +287,128 @@ class Wordlist:
 
         self.sortWordlist()
 
-        return
\ No newline at end of file
+        return
+
+class WordlistDiff:
+    """
+    A proposed change to a wordlist: words added, words removed and new scores (or sublevels) of existing words.
+    Survey.apply_wordlist_diff rescores only the items the change can affect (see TermIndex).
+
+    ...
+
+    Attributes
+    ----------
+    wordlist : Wordlist
+        The wordlist the change applies to
+    added : dict
+        The (score, subclass) of each added word
+    removed : set
+        The removed words
+    changed : dict
+        The new (score, subclass) of each changed word
+
+    Methods
+    -------
+    between(old, new)
+        returns the diff turning the old wordlist into the new one
+    words()
+        returns every word touched by the diff
+    apply()
+        returns a new Wordlist with the change applied
+    """
+    def __init__(self, wordlist: Wordlist, add: dict = None, remove=None, change: dict = None) -> None:
+        '''
+        Initializes the WordlistDiff class
+
+                Parameters:
+                        wordlist (Wordlist): The wordlist the change applies to
+                        add (dict): The score, or (score, subclass), of each new word
+                        remove (list): The words to remove
+                        change (dict): The new score, or (score, subclass), of existing words
+                Returns:
+
+        '''
+        self.wordlist = wordlist
+        current = {str(word): (float(score), float(subclass)) for word, score, subclass in
+                   zip(wordlist.words, wordlist.scores, wordlist.subclasses)}
+        self.added = {str(word).lower(): self._values(value) for word, value in (add or {}).items()}
+        self.removed = {str(word).lower() for word in (remove or [])}
+        self.changed = {}
+        for word, value in (change or {}).items():
+            word = str(word).lower()
+            score, subclass = self._values(value, current.get(word, (0.0, 0.0))[1])
+            if current.get(word) != (score, subclass):
+                self.changed[word] = (score, subclass)
+
+        existing = [word for word in self.added if word in current]
+        if existing:
+            raise ValueError(f"Words already in the wordlist, change their score instead: {existing}")
+        missing = [word for word in self.removed.union(self.changed) if word not in current]
+        if missing:
+            raise ValueError(f"Words not in the wordlist: {missing}")
+        both = self.removed.intersection(self.changed)
+        if both:
+            raise ValueError(f"Words both removed and changed: {sorted(both)}")
+        return
+
+    @staticmethod
+    def _values(value, subclass: float = 0.0) -> tuple:
+        if isinstance(value, (tuple, list)):
+            return float(value[0]), float(value[1])
+        return float(value), float(subclass)
+
+    @classmethod
+    def between(cls, old: Wordlist, new: Wordlist):
+        '''
+        Returns the diff turning the old wordlist into the new one
+
+                Parameters:
+                        old (Wordlist): The current wordlist
+                        new (Wordlist): The proposed wordlist
+                Returns:
+                        diff (WordlistDiff): The words added, removed and changed
+        '''
+        before = {str(word): (float(score), float(subclass)) for word, score, subclass in
+                  zip(old.words, old.scores, old.subclasses)}
+        after = {str(word): (float(score), float(subclass)) for word, score, subclass in
+                 zip(new.words, new.scores, new.subclasses)}
+        return cls(old,
+                   add={word: values for word, values in after.items() if word not in before},
+                   remove=[word for word in before if word not in after],
+                   change={word: values for word, values in after.items() if word in before and values != before[word]})
+
+    def words(self) -> set:
+        return set(self.added).union(self.removed, self.changed)
+
+    def apply(self) -> Wordlist:
+        '''
+        Returns a copy of the wordlist with the change applied, with its own unique_id. The wordlist is not modified.
+
+                Parameters:
+
+                Returns:
+                        wordlist (Wordlist): The changed wordlist
+        '''
+        wordlist = copy.copy(self.wordlist)
+        wordlist.unique_id = ''.join(random.sample(string.ascii_uppercase, 26))
+        words, scores, subclasses = [], [], []
+        for word, score, subclass in zip(self.wordlist.words, self.wordlist.scores, self.wordlist.subclasses):
+            if str(word) in self.removed:
+                continue
+            score, subclass = self.changed.get(str(word), (score, subclass))
+            words.append(str(word))
+            scores.append(score)
+            subclasses.append(subclass)
+        for word, (score, subclass) in self.added.items():
+            words.append(word)
+            scores.append(score)
+            subclasses.append(subclass)
+        wordlist.words = np.array(words)
+        wordlist.scores = np.array(scores, dtype=float)
+        wordlist.subclasses = np.array(subclasses, dtype=float)
+        wordlist.sortWordlist()
+        logger.info("Applied wordlist diff: %d added, %d removed, %d changed", len(self.added), len(self.removed), len(self.changed))
+        return wordlist
+
+    def __str__(self) -> str:
+        return "WordlistDiff({} added, {} removed, {} changed)".format(len(self.added), len(self.removed), len(self.changed))
@@ -0,0 +1,182 @@
+import random
+import string
+import hashlib
+import numpy as np
+from collections import defaultdict
+
+from veta.token_matcher import _TOKEN
+from veta.scoring_modules.scoring_module import ScoringModule
+from veta.logger import get_logger
+
+logger = get_logger('wordlist_union')
+
+def overlaps(first: tuple, second: tuple) -> bool:
+    '''Returns whether two token sequences can overlap in a sentence: some shift makes their common tokens equal'''
+    for shift in range(1 - len(second), len(first)):
+        start, stop = max(0, shift), min(len(first), shift + len(second))
+        if first[start:stop] == second[start - shift:stop - shift]:
+            return True
+    return False
+
+
+class WordlistUnion:
+    """
+    The union of several wordlists, used by Survey.score_wordlists to find the words of all of them in a single
+    matching pass. The scoring modules match each sentence once against the union, and match_words keeps the words
+    of the wordlist being scored with their scores in that wordlist.
+
+    Matching the union finds the same words of a wordlist as matching it alone unless a longer word of another
+    wordlist that can overlap one of its words (see overlaps) is found, e.g. "let down" in one list hiding "down" in
+    another. These words are precomputed for each wordlist (shadows), and the sentences where one of them is found
+    fall back to being matched with the wordlist alone. The union is only used by modules with the token or regex
+    matcher and no word characters around words (not Hebrew or Arabic), the others match each wordlist separately.
+
+    ...
+
+    Attributes
+    ----------
+    wordlists : dict
+        The wordlists, by name
+    words : numpy.array
+        The words of all of the wordlists, each once, in order of first appearance
+    scores : numpy.array
+        Zero for every word, so that the union can be matched as a wordlist (ScoringModule.add_wordlist). The scores
+        are taken from the wordlist being scored.
+    subclasses : numpy.array
+        Zero for every word, as scores
+    shadows : dict
+        The words of the other wordlists that can hide a word of the wordlist, by name
+    exact : dict
+        Whether matching the union always gives the same words as matching the wordlist alone (no shadows), by name
+    fallbacks : dict
+        The number of sentences matched again with the wordlist alone, by name
+    unique_id : str
+        A random id, as Wordlist.unique_id
+
+    Methods
+    -------
+    fingerprint()
+        returns a hash of the words, as Wordlist.fingerprint
+    covers(module, wordlist)
+        returns whether the module can match the wordlist through the union
+    count(module, sentence, wordlist)
+        returns the count of each union word in the sentence, matched once per sentence and module configuration, or
+        None if the sentence must be matched with the wordlist alone
+    clear()
+        drops the cached union matches
+    """
+    def __init__(self, wordlists) -> None:
+        '''
+        Initializes the WordlistUnion class
+
+                Parameters:
+                        wordlists (dict or list): The wordlists by name, or a list of wordlists with distinct names
+                Returns:
+
+        '''
+        if not isinstance(wordlists, dict):
+            wordlists = list(wordlists)
+            names = [wordlist.name for wordlist in wordlists]
+            if len(set(names)) != len(names):
+                raise ValueError(f"Wordlist names must be distinct, got {names}. Pass a dict of wordlists by name instead.")
+            wordlists = dict(zip(names, wordlists))
+        if not wordlists:
+            raise ValueError("At least one wordlist is needed")
+        self.wordlists = wordlists
+        self.unique_id = ''.join(random.sample(string.ascii_uppercase, 26))
+
+        rows = {}
+        for wordlist in wordlists.values():
+            for word in wordlist.words:
+                rows.setdefault(word, len(rows))
+        self.words = np.array(list(rows), dtype=object)
+        self.scores = np.zeros(len(rows))
+        self.subclasses = np.zeros(len(rows))
+
+        self.names = {wordlist.unique_id: name for name, wordlist in wordlists.items()}
+        self.shadows = {name: self._shadows(wordlist) for name, wordlist in wordlists.items()}
+        self.exact = {name: not shadows for name, shadows in self.shadows.items()}
+        self.fallbacks = dict.fromkeys(wordlists, 0)
+        # The union matcher of each module configuration and the words it found in each sentence
+        self.modules = {}
+        self.counts = {}
+        logger.info("Union of %d wordlists with %d words, matched together: %s", len(wordlists), len(rows),
+                    [name for name, exact in self.exact.items() if exact])
+        return
+
+    def _shadows(self, wordlist) -> set:
+        own = {str(word) for word in wordlist.words}
+        # The words of the wordlist by token, as token tuples
+        containing = defaultdict(list)
+        for word in own:
+            tokens = tuple(_TOKEN.findall(word))
+            for token in set(tokens):
+                containing[token].append(tokens)
+        shadows = set()
+        for word in self.words:
+            # A single token word can only match where no longer word of the wordlist does
+            if str(word) in own or _TOKEN.fullmatch(str(word)):
+                continue
+            tokens = tuple(_TOKEN.findall(str(word)))
+            if any(overlaps(tokens, other) for other in {other for token in tokens for other in containing.get(token, ())}):
+                shadows.add(word)
+        return shadows
+
+    def fingerprint(self) -> str:
+        digest = hashlib.sha1()
+        for word in self.words:
+            digest.update(str(word).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def covers(self, module: ScoringModule, wordlist) -> bool:
+        '''
+        Returns whether the module finds the same words of the wordlist by matching the union
+
+                Parameters:
+                        module (ScoringModule): The scoring module
+                        wordlist (Wordlist): The wordlist being scored
+                Returns:
+                        covered (bool): True if the wordlist can be matched through the union
+        '''
+        if wordlist.unique_id not in self.names or module.matcher not in ('token', 'regex'):
+            return False
+        return not _TOKEN.search(module.acceptable_prev_chars + module.acceptable_next_chars)
+
+    def count(self, module: ScoringModule, sentence: str, wordlist):
+        '''
+        Finds the words of the union in a sentence, once per sentence for all of the wordlists and modules with the
+        same matching configuration
+
+                Parameters:
+                        module (ScoringModule): The scoring module asking for the matches
+                        sentence (str): The cleaned sentence
+                        wordlist (Wordlist): The wordlist being scored
+                Returns:
+                        word_counts (dict): The union words found and their frequency, or None if a word that can hide
+                                            a word of the wordlist was found
+        '''
+        key = (module.match_language(), module.max_sentence_length, module.long_sentence_policy)
+        word_counts = self.counts.get((key, sentence))
+        if word_counts is None:
+            matcher = self.modules.get(key)
+            if matcher is None:
+                matcher = ScoringModule(language=module.language)
+                matcher.matcher = module.matcher
+                matcher.max_sentence_length = module.max_sentence_length
+                matcher.long_sentence_policy = module.long_sentence_policy
+                matcher.match_cache = module.match_cache
+                matcher.add_wordlist(self)
+                self.modules[key] = matcher
+            matcher.stats = module.stats
+            word_counts = self.counts[(key, sentence)] = matcher.find_words(sentence)
+        name = self.names[wordlist.unique_id]
+        shadows = self.shadows[name]
+        if shadows and not shadows.isdisjoint(word_counts):
+            self.fallbacks[name] += 1
+            return None
+        return word_counts
+
+    def clear(self) -> None:
+        self.counts.clear()
+        return